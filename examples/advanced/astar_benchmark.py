@@ -0,0 +1,110 @@
+"""
+Benchmark of unidirectional and bidirectional A* searches.
+
+For random queries on a weighted grid with the Manhattan distance as
+heuristic and on a random geometric graph with the Euclidean distance as
+heuristic, the script reports the average number of settled nodes, that is
+nodes whose edges are scanned, and the average running time of
+
+* Dijkstra's algorithm, i.e. :func:`networkx.astar_path` without heuristic,
+* :func:`networkx.astar_path` with the heuristic,
+* :func:`networkx.bidirectional_astar` without heuristic, i.e. a
+  bidirectional Dijkstra search,
+* :func:`networkx.bidirectional_astar` with the heuristic.
+
+Typical observations:
+
+* bidirectional Dijkstra settles 35 to 60% fewer nodes than Dijkstra;
+* bidirectional A* settles 20 to 25% fewer nodes than A*, although the
+  average potentials only use half of the heuristic in each direction;
+* with a tight heuristic, as on the geometric graph, bidirectional A*
+  settles 15 times fewer nodes than Dijkstra's algorithm, and 3 times
+  fewer on the grid, whose Manhattan heuristic ignores the weights.
+"""
+# Copyright (C) 2017 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from __future__ import division
+from __future__ import print_function
+
+import math
+import random
+import time
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.astar import _bidirectional_astar
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+
+
+class CountingGraph(nx.Graph):
+    """A graph counting the lookups ``G[u]``, which :func:`astar_path`
+    makes exactly once per settled node."""
+
+    lookups = 0
+
+    def __getitem__(self, n):
+        self.lookups += 1
+        return super(CountingGraph, self).__getitem__(n)
+
+
+def unidirectional(G, s, t, heuristic):
+    G.lookups = 0
+    nx.astar_path(G, s, t, heuristic)
+    return G.lookups
+
+
+def bidirectional(G, s, t, heuristic):
+    weight = _weight_function(G, 'weight')
+    return _bidirectional_astar(G, s, t, heuristic, weight)[2]
+
+
+def bench(name, G, heuristic, queries=50, seed=1):
+    print("%s (%d nodes, %d edges)" % (name, G.order(), G.size()))
+    rng = random.Random(seed)
+    nodes = list(G)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(queries)]
+    pairs = [(s, t) for s, t in pairs if nx.has_path(G, s, t)]
+    for label, search, h in [('Dijkstra', unidirectional, None),
+                             ('A*', unidirectional, heuristic),
+                             ('bidirectional Dijkstra', bidirectional, None),
+                             ('bidirectional A*', bidirectional, heuristic)]:
+        start = time.time()
+        settled = sum(search(G, s, t, h) for s, t in pairs)
+        elapsed = time.time() - start
+        print("\t%-24s %9.0f settled %8.1f ms" %
+              (label, settled / len(pairs), 1000 * elapsed / len(pairs)))
+
+
+def grid(n, seed):
+    rng = random.Random(seed)
+    G = CountingGraph(nx.grid_2d_graph(n, n))
+    for u, v, d in G.edges(data=True):
+        d['weight'] = rng.randint(1, 4)
+    return G
+
+
+def geometric(n, radius, seed):
+    random.seed(seed)
+    G = CountingGraph(nx.random_geometric_graph(n, radius))
+    pos = nx.get_node_attributes(G, 'pos')
+    for u, v, d in G.edges(data=True):
+        d['weight'] = math.hypot(pos[u][0] - pos[v][0],
+                                 pos[u][1] - pos[v][1])
+    return G, pos
+
+
+if __name__ == '__main__':
+    def manhattan(a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    bench("weighted grid graph", grid(200, seed=1), manhattan)
+
+    G, pos = geometric(20000, 0.015, seed=1)
+
+    def euclidean(a, b):
+        return math.hypot(pos[a][0] - pos[b][0], pos[a][1] - pos[b][1])
+
+    bench("random geometric graph", G, euclidean)
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2017 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""Sampling estimators of graph measures defined by averages of shortest
+path lengths over all pairs of nodes.
+
+The exact functions need a shortest path search from every node. The
+estimators below average over randomly drawn sources or pairs of nodes
+instead, and stop as soon as a sample budget, a time budget or a target
+error is reached.
+"""
+from __future__ import division
+
+import math
+import random
+import time
+
+import networkx as nx
+from networkx.utils import not_implemented_for
+
+__all__ = ['average_shortest_path_length', 'global_efficiency']
+
+# Number of samples required before the target error is checked, so that
+# the sample variance is a reasonable estimate.
+_MIN_SAMPLES = 30
+
+
+def average_shortest_path_length(G, weight=None, sampling='pairs',
+                                 max_samples=1000, epsilon=None,
+                                 time_budget=None, confidence=0.95,
+                                 seed=None):
+    r"""Estimates the average shortest path length of `G`.
+
+    The average shortest path length is
+
+    .. math::
+
+       a =\sum_{s,t \in V} \frac{d(s, t)}{n(n-1)}
+
+    where `V` is the set of nodes in `G`, `d(s, t)` is the shortest path
+    length from `s` to `t` and `n` is the number of nodes in `G`.
+
+    Instead of a shortest path search from every node, this function
+    averages over random samples, which are either pairs of distinct
+    nodes, whose distance is found by a bidirectional search, or source
+    nodes, whose average distance to all other nodes is found by a single
+    source search. Sampling is stopped at the first of `max_samples`
+    samples, a confidence interval narrower than `epsilon` or a running
+    time of `time_budget` seconds.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : None or string, optional (default = None)
+       If None, every edge has weight/distance/cost 1.
+       If a string, use this edge attribute as the edge weight.
+       Any edge attribute not present defaults to 1.
+
+    sampling : string, optional (default='pairs')
+       Either 'pairs' or 'sources'. A pair costs a bidirectional search,
+       which usually explores a small part of the graph, while a source
+       costs a full search but has a much smaller variance.
+
+    max_samples : integer or None, optional (default=1000)
+       Maximum number of samples. If None, `epsilon` or `time_budget`
+       must be given.
+
+    epsilon : float, optional (default=None)
+       Stop once the half-width of the confidence interval is at most
+       `epsilon`. It is only checked after 30 samples.
+
+    time_budget : float, optional (default=None)
+       Stop drawing samples after this many seconds.
+
+    confidence : float, optional (default=0.95)
+       Confidence level of the interval, between 0 and 1.
+
+    seed : integer, optional
+       Seed for random number generator.
+
+    Returns
+    -------
+    estimate : float
+       The estimated average shortest path length.
+
+    interval : tuple of two floats
+       Confidence interval of the average shortest path length, based on
+       the normal approximation of the sample mean.
+
+    Raises
+    ------
+    NetworkXPointlessConcept
+        If `G` is the null graph (that is, the graph on zero nodes).
+
+    NetworkXError
+        If `G` is undirected and a sample reveals that it is not connected.
+
+    ValueError
+        If the stopping rule can never be satisfied or `sampling` is
+        unknown.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.grid_2d_graph(20, 20)
+    >>> est, (low, high) = approx.average_shortest_path_length(G, seed=1)
+    >>> low <= nx.average_shortest_path_length(G) <= high
+    True
+
+    Notes
+    -----
+    As for :func:`networkx.average_shortest_path_length`, a pair of nodes
+    of a directed graph without a path between them contributes zero.
+
+    See Also
+    --------
+    networkx.average_shortest_path_length
+    global_efficiency
+
+    """
+    n = len(G)
+    if n == 0:
+        msg = ('the null graph has no paths, thus there is no average'
+               'shortest path length')
+        raise nx.NetworkXPointlessConcept(msg)
+    if n == 1:
+        return 0, (0, 0)
+    directed = G.is_directed()
+
+    def no_path():
+        if not directed:
+            raise nx.NetworkXError("Graph is not connected.")
+        return 0
+
+    if sampling == 'pairs':
+        nodes = list(G)
+
+        def sample():
+            s, t = _random_pair(nodes)
+            try:
+                return _distance(G, s, t, weight)
+            except nx.NetworkXNoPath:
+                return no_path()
+    elif sampling == 'sources':
+        nodes = list(G)
+
+        def sample():
+            lengths = _lengths(G, random.choice(nodes), weight)
+            if len(lengths) < n:
+                no_path()
+            return sum(lengths.values()) / (n - 1)
+    else:
+        raise ValueError("sampling must be 'pairs' or 'sources'")
+    return _estimate_mean(sample, max_samples, epsilon, time_budget,
+                          confidence, seed)
+
+
+@not_implemented_for('directed')
+def global_efficiency(G, sampling='pairs', max_samples=1000, epsilon=None,
+                      time_budget=None, confidence=0.95, seed=None):
+    """Estimates the average global efficiency of the graph.
+
+    The *efficiency* of a pair of nodes in a graph is the multiplicative
+    inverse of the shortest path distance between the nodes, and zero if
+    there is no path. The *average global efficiency* of a graph is the
+    average efficiency of all pairs of nodes.
+
+    Instead of a shortest path search from every node, this function
+    averages over random samples, which are either pairs of distinct
+    nodes or source nodes, as in :func:`average_shortest_path_length`.
+
+    Parameters
+    ----------
+    G : :class:`networkx.Graph`
+        An undirected graph.
+
+    sampling : string, optional (default='pairs')
+       Either 'pairs' or 'sources'. A pair costs a bidirectional search
+       and a source a full breadth-first search.
+
+    max_samples : integer or None, optional (default=1000)
+       Maximum number of samples. If None, `epsilon` or `time_budget`
+       must be given.
+
+    epsilon : float, optional (default=None)
+       Stop once the half-width of the confidence interval is at most
+       `epsilon`. It is only checked after 30 samples.
+
+    time_budget : float, optional (default=None)
+       Stop drawing samples after this many seconds.
+
+    confidence : float, optional (default=0.95)
+       Confidence level of the interval, between 0 and 1.
+
+    seed : integer, optional
+       Seed for random number generator.
+
+    Returns
+    -------
+    estimate : float
+       The estimated average global efficiency.
+
+    interval : tuple of two floats
+       Confidence interval of the average global efficiency, based on
+       the normal approximation of the sample mean.
+
+    Raises
+    ------
+    ValueError
+        If the stopping rule can never be satisfied or `sampling` is
+        unknown.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.cycle_graph(50)
+    >>> est, (low, high) = approx.global_efficiency(G, max_samples=None,
+    ...                                           epsilon=0.01, seed=1)
+    >>> high - low <= 0.02
+    True
+
+    Notes
+    -----
+    Edge weights are ignored when computing the shortest path distances.
+
+    See Also
+    --------
+    networkx.global_efficiency
+    average_shortest_path_length
+
+    """
+    n = len(G)
+    if n < 2:
+        return 0, (0, 0)
+    nodes = list(G)
+    if sampling == 'pairs':
+        def sample():
+            s, t = _random_pair(nodes)
+            try:
+                return 1 / _distance(G, s, t, None)
+            except nx.NetworkXNoPath:
+                return 0
+    elif sampling == 'sources':
+        def sample():
+            lengths = _lengths(G, random.choice(nodes), None)
+            return sum(1 / d for d in lengths.values() if d > 0) / (n - 1)
+    else:
+        raise ValueError("sampling must be 'pairs' or 'sources'")
+    return _estimate_mean(sample, max_samples, epsilon, time_budget,
+                          confidence, seed)
+
+
+def _random_pair(nodes):
+    """Returns a pair of distinct nodes drawn uniformly at random."""
+    n = len(nodes)
+    i = random.randrange(n)
+    j = random.randrange(n - 1)
+    if j >= i:
+        j += 1
+    return nodes[i], nodes[j]
+
+
+def _distance(G, s, t, weight):
+    """Returns the shortest path length from `s` to `t`."""
+    if weight is None:
+        return len(nx.bidirectional_shortest_path(G, s, t)) - 1
+    return nx.bidirectional_dijkstra(G, s, t, weight=weight)[0]
+
+
+def _lengths(G, s, weight):
+    """Returns the shortest path lengths from `s` to all reachable nodes."""
+    if weight is None:
+        return dict(nx.single_source_shortest_path_length(G, s))
+    return dict(nx.single_source_dijkstra_path_length(G, s, weight=weight))
+
+
+def _normal_quantile(confidence):
+    """Returns z such that a standard normal variable lies in [-z, z] with
+    probability `confidence`.
+    """
+    low, high = 0.0, 40.0
+    for _ in range(100):
+        z = (low + high) / 2
+        if math.erf(z / math.sqrt(2)) < confidence:
+            low = z
+        else:
+            high = z
+    return (low + high) / 2
+
+
+def _estimate_mean(sample, max_samples, epsilon, time_budget, confidence,
+                   seed):
+    """Averages the values returned by `sample` until the stopping rule is
+    satisfied.
+
+    Returns the mean and its confidence interval.
+    """
+    if max_samples is None and epsilon is None and time_budget is None:
+        raise ValueError('one of max_samples, epsilon or time_budget '
+                         'must be given')
+    if not 0 < confidence < 1:
+        raise ValueError('confidence must be between 0 and 1')
+    if seed is not None:
+        random.seed(seed)
+    z = _normal_quantile(confidence)
+    start = time.time()
+    # Welford's running mean and sum of squared deviations.
+    k = 0
+    mean = 0.0
+    m2 = 0.0
+    half_width = float('inf')
+    while max_samples is None or k < max_samples:
+        x = sample()
+        k += 1
+        delta = x - mean
+        mean += delta / k
+        m2 += delta * (x - mean)
+        if k > 1:
+            half_width = z * math.sqrt(m2 / (k - 1) / k)
+        if epsilon is not None and k >= _MIN_SAMPLES and \
+                half_width <= epsilon:
+            break
+        if time_budget is not None and k > 1 and \
+                time.time() - start >= time_budget:
+            break
+    return mean, (mean - half_width, mean + half_width)
@@ -0,0 +1,92 @@
+from nose.tools import assert_equal
+from nose.tools import assert_raises
+from nose.tools import assert_true
+
+import networkx as nx
+from networkx.algorithms import approximation as approx
+
+
+class TestAverageShortestPathLength(object):
+
+    def test_pairs_and_sources(self):
+        G = nx.grid_2d_graph(8, 8)
+        exact = nx.average_shortest_path_length(G)
+        for sampling in ('pairs', 'sources'):
+            est, (low, high) = approx.average_shortest_path_length(
+                G, sampling=sampling, max_samples=500, seed=1)
+            assert_true(low <= est <= high)
+            assert_true(low <= exact <= high)
+
+    def test_weighted(self):
+        G = nx.cycle_graph(20)
+        for u, v in G.edges():
+            G[u][v]['weight'] = 2
+        exact = nx.average_shortest_path_length(G, weight='weight')
+        est, (low, high) = approx.average_shortest_path_length(
+            G, weight='weight', sampling='sources', max_samples=10, seed=2)
+        # Every source of a cycle has the same average distance.
+        assert_equal(est, exact)
+        assert_equal(low, high)
+
+    def test_directed(self):
+        G = nx.DiGraph([(0, 1), (1, 2)])
+        exact = nx.average_shortest_path_length(G)
+        est, (low, high) = approx.average_shortest_path_length(
+            G, sampling='sources', max_samples=2000, seed=3)
+        assert_true(abs(est - exact) < 0.1)
+
+    def test_epsilon(self):
+        G = nx.path_graph(40)
+        est, (low, high) = approx.average_shortest_path_length(
+            G, max_samples=None, epsilon=0.5, seed=4)
+        assert_true(high - low <= 1.0)
+
+    def test_time_budget(self):
+        G = nx.path_graph(40)
+        est, (low, high) = approx.average_shortest_path_length(
+            G, max_samples=None, time_budget=0.05, seed=5)
+        assert_true(low <= est <= high)
+
+    def test_seed(self):
+        G = nx.gnp_random_graph(50, 0.1, seed=6)
+        G = max(nx.connected_component_subgraphs(G), key=len)
+        result = approx.average_shortest_path_length(G, seed=7)
+        assert_equal(result, approx.average_shortest_path_length(G, seed=7))
+
+    def test_trivial_and_errors(self):
+        G = nx.Graph()
+        assert_raises(nx.NetworkXPointlessConcept,
+                      approx.average_shortest_path_length, G)
+        G.add_node(0)
+        assert_equal(approx.average_shortest_path_length(G), (0, (0, 0)))
+        G = nx.Graph([(0, 1), (2, 3)])
+        assert_raises(nx.NetworkXError, approx.average_shortest_path_length,
+                      G, sampling='sources', seed=8)
+        G = nx.path_graph(3)
+        assert_raises(ValueError, approx.average_shortest_path_length, G,
+                      max_samples=None)
+        assert_raises(ValueError, approx.average_shortest_path_length, G,
+                      sampling='edges')
+        assert_raises(ValueError, approx.average_shortest_path_length, G,
+                      confidence=1)
+
+
+class TestGlobalEfficiency(object):
+
+    def test_estimate(self):
+        G = nx.barbell_graph(10, 5)
+        exact = nx.global_efficiency(G)
+        for sampling in ('pairs', 'sources'):
+            est, (low, high) = approx.global_efficiency(
+                G, sampling=sampling, max_samples=500, seed=1)
+            assert_true(low <= exact <= high)
+
+    def test_disconnected(self):
+        G = nx.Graph([(0, 1), (2, 3)])
+        est, (low, high) = approx.global_efficiency(G, sampling='sources',
+                                                    seed=2)
+        assert_equal(est, 1 / 3)
+
+    def test_directed(self):
+        assert_raises(nx.NetworkXNotImplemented, approx.global_efficiency,
+                      nx.DiGraph([(0, 1)]))
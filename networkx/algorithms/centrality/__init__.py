@@ -1,7 +1,10 @@
 from .betweenness import *
 from .betweenness_subset import *
+from .betweenness_approx import *
+from .betweenness_dynamic import *
 from .closeness import *
 from .subgraph_alg import *
+from .flow_matrix import *
 from .current_flow_closeness import *
 from .current_flow_betweenness import *
 from .current_flow_betweenness_subset import *
@@ -9,6 +12,7 @@ from .degree_alg import *
 from .dispersion import *
 from .eigenvector import *
 from .harmonic import *
+from .hyperball import *
 from .katz import *
 from .load import *
 from .reaching import *
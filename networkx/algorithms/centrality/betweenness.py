@@ -10,16 +10,19 @@
 """Betweenness centrality measures."""
 from heapq import heappush, heappop
 from itertools import count
+import multiprocessing
 import random
 
 import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_snapshot
 
 __all__ = ['betweenness_centrality', 'edge_betweenness_centrality',
            'edge_betweenness']
 
 
 def betweenness_centrality(G, k=None, normalized=True, weight=None,
-                           endpoints=False, seed=None):
+                           endpoints=False, seed=None, n_jobs=None,
+                           executor=None):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
     Betweenness centrality of a node `v` is the sum of the
@@ -57,15 +60,34 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     endpoints : bool, optional
       If True include the endpoints in the shortest path counts.
 
+    n_jobs : int, optional (default=None)
+      Number of worker processes among which the sources are divided,
+      or -1 for one process per CPU. If None or 1, the sources are
+      processed in this process, unless `executor` is given. Other
+      values are invalid.
+
+    executor : object, optional (default=None)
+      An object with a ``map(func, iterable)`` method, such as a
+      :class:`multiprocessing.Pool` or a
+      :class:`concurrent.futures.Executor`, through which the sources are
+      processed in parallel instead. Each task carries the adjacency of
+      `G`.
+
     Returns
     -------
     nodes : dictionary
        Dictionary of nodes with betweenness centrality as the value.
 
+    Raises
+    ------
+    ValueError
+       If `n_jobs` is neither None, -1 nor a positive integer.
+
     See Also
     --------
     edge_betweenness_centrality
     load_centrality
+    approximate_betweenness_centrality
 
     Notes
     -----
@@ -81,6 +103,11 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     Zero edge weights can produce an infinite number of equal length
     paths between pairs of nodes.
 
+    With `n_jobs` or `executor`, the sources are divided into contiguous
+    chunks, a few per worker, and the betweenness values computed from
+    each chunk are added in the order of the chunks. The sources sampled
+    for a given `seed` do not depend on the number of workers.
+
     References
     ----------
     .. [1] Ulrik Brandes:
@@ -101,23 +128,35 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
        Sociometry 40: 35–41, 1977
        http://moreno.ss.uci.edu/23.pdf
     """
+    _check_n_jobs(n_jobs)
     betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        if endpoints:
-            betweenness = _accumulate_endpoints(betweenness, S, P, sigma, s)
-        else:
-            betweenness = _accumulate_basic(betweenness, S, P, sigma, s)
+    if weight is not None:
+        # The weights are read once for all the sources.
+        weight = _weight_snapshot(G, weight)
+    if endpoints:
+        accumulate = _accumulate_endpoints
+    else:
+        accumulate = _accumulate_basic
+    if executor is not None or n_jobs not in (None, 1):
+        for partial in _parallel_betweenness(G, nodes, weight, accumulate,
+                                             n_jobs, executor):
+            for v, b in partial.items():
+                betweenness[v] += b
+    else:
+        for s in nodes:
+            # single source shortest paths
+            if weight is None:  # use BFS
+                S, P, sigma = _single_source_shortest_path_basic(G, s)
+            else:  # use Dijkstra's algorithm
+                S, P, sigma = _single_source_dijkstra_path_basic(G, s,
+                                                                 weight)
+            # accumulation
+            betweenness = accumulate(betweenness, S, P, sigma, s)
     # rescaling
     betweenness = _rescale(betweenness, len(G), normalized=normalized,
                            directed=G.is_directed(), k=k)
@@ -125,7 +164,7 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
 
 
 def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
-                                seed=None):
+                                seed=None, n_jobs=None, executor=None):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge `e` is the sum of the
@@ -158,11 +197,29 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_jobs : int, optional (default=None)
+      Number of worker processes among which the sources are divided,
+      or -1 for one process per CPU. If None or 1, the sources are
+      processed in this process, unless `executor` is given. Other
+      values are invalid.
+
+    executor : object, optional (default=None)
+      An object with a ``map(func, iterable)`` method, such as a
+      :class:`multiprocessing.Pool` or a
+      :class:`concurrent.futures.Executor`, through which the sources are
+      processed in parallel instead. Each task carries the adjacency of
+      `G`.
+
     Returns
     -------
     edges : dictionary
        Dictionary of edges with betweenness centrality as the value.
 
+    Raises
+    ------
+    ValueError
+       If `n_jobs` is neither None, -1 nor a positive integer.
+
     See Also
     --------
     betweenness_centrality
@@ -176,6 +233,11 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
     Zero edge weights can produce an infinite number of equal length
     paths between pairs of nodes.
 
+    With `n_jobs` or `executor`, the sources are divided into contiguous
+    chunks, a few per worker, and the betweenness values computed from
+    each chunk are added in the order of the chunks. The sources sampled
+    for a given `seed` do not depend on the number of workers.
+
     References
     ----------
     .. [1]  A Faster Algorithm for Betweenness Centrality. Ulrik Brandes,
@@ -186,6 +248,7 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
+    _check_n_jobs(n_jobs)
     betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     # b[e]=0 for e in G.edges()
     betweenness.update(dict.fromkeys(G.edges(), 0.0))
@@ -194,14 +257,29 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+    if weight is not None:
+        # The weights are read once for all the sources.
+        weight = _weight_snapshot(G, weight)
+    if executor is not None or n_jobs not in (None, 1):
+        for partial in _parallel_betweenness(G, nodes, weight,
+                                             _accumulate_edges, n_jobs,
+                                             executor):
+            for e, b in partial.items():
+                # The workers may orient the edges of undirected graphs
+                # differently.
+                if e not in betweenness:
+                    e = e[::-1]
+                betweenness[e] += b
+    else:
+        for s in nodes:
+            # single source shortest paths
+            if weight is None:  # use BFS
+                S, P, sigma = _single_source_shortest_path_basic(G, s)
+            else:  # use Dijkstra's algorithm
+                S, P, sigma = _single_source_dijkstra_path_basic(G, s,
+                                                                 weight)
+            # accumulation
+            betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
     # rescaling
     for n in G:  # remove nodes to only return edges
         del betweenness[n]
@@ -218,7 +296,80 @@ def edge_betweenness(G, k=None, normalized=True, weight=None, seed=None):
 
 # helpers for betweenness centrality
 
-def _single_source_shortest_path_basic(G, s):
+# Adjacency and weights shared by the worker processes of a pool.
+_shared = None
+
+
+def _check_n_jobs(n_jobs):
+    """Raises ValueError unless `n_jobs` is None, -1 or positive."""
+    if n_jobs is not None and n_jobs != -1 and n_jobs < 1:
+        raise ValueError('n_jobs must be None, -1 or a positive integer, '
+                         'not %r' % (n_jobs,))
+
+
+def _parallel_betweenness(G, sources, weight, accumulate, n_jobs=None,
+                          executor=None):
+    """Returns the betweenness values computed from chunks of `sources`
+    by worker processes, in the order of the chunks.
+
+    The adjacency of `G`, as lists of neighbors or as the weight snapshot
+    `weight`, is given once to each worker of the pool created for
+    `n_jobs`, or with each task sent to `executor`.
+    """
+    if weight is None:
+        succ = G._succ if G.is_directed() else G._adj
+        adj = {u: list(nbrs) for u, nbrs in succ.items()}
+    else:
+        adj = weight
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = multiprocessing.cpu_count()
+    sources = list(sources)
+    size = -(-len(sources) // (4 * n_jobs)) or 1
+    chunks = [sources[i:i + size] for i in range(0, len(sources), size)]
+    flags = (weight is not None, G.is_directed(), accumulate)
+    if executor is not None:
+        return executor.map(_betweenness_task,
+                            [(adj,) + flags + (chunk,) for chunk in chunks])
+    pool = multiprocessing.Pool(n_jobs, _init_worker, (adj,))
+    try:
+        return pool.map(_betweenness_task,
+                        [(None,) + flags + (chunk,) for chunk in chunks])
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _init_worker(adj):
+    global _shared
+    _shared = adj
+
+
+def _betweenness_task(args):
+    """Returns the betweenness values of the nodes, and of the edges for
+    :func:`_accumulate_edges`, computed from the sources of a chunk."""
+    adj, weighted, directed, accumulate, sources = args
+    if adj is None:
+        adj = _shared
+    betweenness = dict.fromkeys(adj, 0.0)
+    if accumulate is _accumulate_edges:
+        for u, nbrs in adj.items():
+            for v in nbrs:
+                if directed or (v, u) not in betweenness:
+                    betweenness[(u, v)] = 0.0
+    for s in sources:
+        if weighted:
+            S, P, sigma = _single_source_dijkstra_path_basic(adj, s, adj)
+        else:
+            S, P, sigma = _single_source_shortest_path_basic(adj, s)
+        betweenness = accumulate(betweenness, S, P, sigma, s)
+    if accumulate is _accumulate_edges:
+        for n in adj:
+            del betweenness[n]
+    return betweenness
+
+
+def _single_source_shortest_path_basic(G, s, target=None):
+    # The search stops once the shortest paths to target are counted.
     S = []
     P = {}
     for v in G:
@@ -231,6 +382,8 @@ def _single_source_shortest_path_basic(G, s):
     while Q:   # use BFS to find shortest paths
         v = Q.pop(0)
         S.append(v)
+        if v == target:
+            break
         Dv = D[v]
         sigmav = sigma[v]
         for w in G[v]:
@@ -243,8 +396,9 @@ def _single_source_shortest_path_basic(G, s):
     return S, P, sigma
 
 
-def _single_source_dijkstra_path_basic(G, s, weight):
+def _single_source_dijkstra_path_basic(G, s, weight, target=None):
     # modified from Eppstein
+    weight = _weight_snapshot(G, weight)
     S = []
     P = {}
     for v in G:
@@ -265,8 +419,10 @@ def _single_source_dijkstra_path_basic(G, s, weight):
         sigma[v] += sigma[pred]  # count paths
         S.append(v)
         D[v] = dist
-        for w, edgedata in G[v].items():
-            vw_dist = dist + edgedata.get(weight, 1)
+        if v == target:
+            break
+        for w, cost in weight[v].items():
+            vw_dist = dist + cost
             if w not in D and (w not in seen or vw_dist < seen[w]):
                 seen[w] = vw_dist
                 push(Q, (vw_dist, next(c), v, w))
@@ -0,0 +1,287 @@
+#    Copyright (C) 2017 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""Betweenness centrality maintained under edge insertions and deletions."""
+import random
+
+import networkx as nx
+from networkx.algorithms.centrality.betweenness import\
+    _single_source_dijkstra_path_basic as dijkstra
+from networkx.algorithms.centrality.betweenness import\
+    _single_source_shortest_path_basic as shortest_path
+from networkx.algorithms.centrality.betweenness import _rescale
+from networkx.algorithms.shortest_paths.weighted import _weight_snapshot
+
+__all__ = ['DynamicBetweenness']
+
+
+class DynamicBetweenness(object):
+    """Betweenness centrality of the nodes of a graph changing by a few
+    edges at a time.
+
+    For each source, the distances from the source and the dependencies
+    of the other nodes on it [1]_ are kept. An edge change can only alter
+    the shortest paths from the sources for which it is on a shortest
+    path, after an insertion or before a deletion, which the distances
+    tell. Only the contributions of these sources are recomputed [2]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph or DiGraph
+        The graph is not copied. Edges and nodes must be changed through
+        the methods of the object; after any other change, call
+        :meth:`rebuild`.
+
+    k : integer, optional (default=None)
+        If None, every node is a source and the betweenness is exact.
+        Otherwise `k` sources are sampled, as by
+        :func:`betweenness_centrality`, and the betweenness is estimated
+        from them. The memory used and the cost of an update are
+        proportional to the number of sources.
+
+    weight : None or string, optional (default=None)
+        If None, all edge weights are considered equal.
+        Otherwise holds the name of the edge attribute used as weight.
+
+    seed : integer, optional
+        Seed for the random choice of the sources.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is a multigraph.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> dynamic = nx.DynamicBetweenness(G)
+    >>> dynamic.betweenness(normalized=False)
+    {0: 0.0, 1: 2.0, 2: 2.0, 3: 0.0}
+    >>> dynamic.add_edge(0, 3)
+    4
+    >>> dynamic.betweenness(normalized=False)
+    {0: 0.5, 1: 0.5, 2: 0.5, 3: 0.5}
+
+    Notes
+    -----
+    An update costs one breadth-first search, or one run of Dijkstra's
+    algorithm, per affected source, and a pass over the sources to find
+    them. The distances and dependencies take memory proportional to the
+    number of sources times the number of nodes they reach.
+
+    References
+    ----------
+    .. [1] Ulrik Brandes:
+       A Faster Algorithm for Betweenness Centrality.
+       Journal of Mathematical Sociology 25(2):163-177, 2001.
+       http://www.inf.uni-konstanz.de/algo/publications/b-fabc-01.pdf
+    .. [2] Min-Joong Lee, Jungmin Lee, Jaimie Yejean Park, Ryan Hyun Choi
+       and Chin-Wan Chung:
+       QUBE: a Quick algorithm for Updating BEtweenness centrality.
+       Proceedings of the 21st International Conference on World Wide
+       Web, pp. 351-360, 2012.
+    """
+
+    def __init__(self, G, k=None, weight=None, seed=None):
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'multigraph type')
+        self.G = G
+        self.k = k
+        self.weight = weight
+        if k is not None:
+            random.seed(seed)
+            self._sources = set(random.sample(G.nodes(), k))
+        else:
+            self._sources = None
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the betweenness from the current graph."""
+        if self._sources is None:
+            sources = list(self.G)
+        else:
+            # Sources removed from the graph are no longer sampled.
+            self._sources &= set(self.G)
+            sources = list(self._sources)
+        if self.weight is not None:
+            self._snapshot = _weight_snapshot(self.G, self.weight)
+        self._betweenness = dict.fromkeys(self.G, 0.0)
+        self._distance = {}
+        self._dependency = {}
+        for s in sources:
+            self._search(s)
+
+    def _search(self, s):
+        """Add the dependencies of the nodes on `s`."""
+        if self.weight is None:
+            S, P, sigma = shortest_path(self.G, s)
+        else:
+            S, P, sigma = dijkstra(self.G, s, self._snapshot)
+        # The distance to each node is the distance to the predecessor
+        # which the search found first, plus the length of the edge.
+        distance = {s: 0}
+        for w in S[1:]:
+            v = P[w][0]
+            if self.weight is None:
+                distance[w] = distance[v] + 1
+            else:
+                distance[w] = distance[v] + self._snapshot[v][w]
+        dependency = {}
+        delta = dict.fromkeys(S, 0)
+        for w in reversed(S):
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v in P[w]:
+                delta[v] += sigma[v] * coeff
+            if w != s and delta[w]:
+                dependency[w] = delta[w]
+                self._betweenness[w] += delta[w]
+        self._distance[s] = distance
+        self._dependency[s] = dependency
+
+    def _forget(self, s):
+        """Subtract the dependencies of the nodes on `s`."""
+        for w, d in self._dependency.pop(s).items():
+            self._betweenness[w] -= d
+        del self._distance[s]
+
+    def _update(self, u, v, removed=None, inserted=None):
+        """Recompute the contributions of the sources for which the edge
+        from `u` to `v` was on a shortest path with length `removed`, or
+        is on one with length `inserted`."""
+        if self.G.is_directed():
+            ends = [(u, v)]
+        else:
+            ends = [(u, v), (v, u)]
+
+        def affected(distance):
+            for a, b in ends:
+                da = distance.get(a)
+                if da is None:
+                    continue
+                db = distance.get(b)
+                if removed is not None and da + removed == db:
+                    return True
+                if inserted is not None and (db is None or
+                                             da + inserted <= db):
+                    return True
+            return False
+
+        sources = [s for s, distance in self._distance.items()
+                   if affected(distance)]
+        for s in sources:
+            self._forget(s)
+            self._search(s)
+        return len(sources)
+
+    def betweenness(self, normalized=True):
+        """Return a dictionary of nodes with betweenness centrality as the
+        value, normalized as by :func:`betweenness_centrality`."""
+        return _rescale(dict(self._betweenness), len(self.G),
+                        normalized=normalized,
+                        directed=self.G.is_directed(), k=self.k)
+
+    def add_node(self, n, **attr):
+        """Add the node `n` to `G`.
+
+        Unless the sources are sampled, `n` becomes a source.
+        """
+        self.G.add_node(n, **attr)
+        if n not in self._betweenness:
+            self._betweenness[n] = 0.0
+            if self.weight is not None:
+                self._snapshot[n] = {}
+            if self._sources is None:
+                self._search(n)
+
+    def add_edge(self, u, v, **attr):
+        """Add the edge from `u` to `v` to `G` and update the betweenness.
+
+        The nodes are added if they are not in `G` already. Edge
+        attributes can be given as keywords, as for :meth:`Graph.add_edge`.
+
+        Returns
+        -------
+        count : integer
+            The number of sources whose contributions were recomputed.
+        """
+        if self.G.has_edge(u, v):
+            old = self._length(u, v)
+            self.G.add_edge(u, v, **attr)
+            new = self._length(u, v)
+            if new == old:
+                return 0
+            self._set_length(u, v, new)
+            return self._update(u, v, removed=old, inserted=new)
+        self.add_node(u)
+        self.add_node(v)
+        self.G.add_edge(u, v, **attr)
+        new = self._length(u, v)
+        self._set_length(u, v, new)
+        return self._update(u, v, inserted=new)
+
+    def remove_edge(self, u, v):
+        """Remove the edge from `u` to `v` from `G` and update the
+        betweenness.
+
+        Returns
+        -------
+        count : integer
+            The number of sources whose contributions were recomputed.
+
+        Raises
+        ------
+        NetworkXError
+            If there is no edge from `u` to `v`.
+        """
+        if not self.G.has_edge(u, v):
+            raise nx.NetworkXError("The edge %s-%s is not in the graph"
+                                   % (u, v))
+        length = self._length(u, v)
+        if self.weight is not None:
+            # The mirrored entry of a self-loop is the same entry.
+            self._snapshot[u].pop(v, None)
+            if not self.G.is_directed():
+                self._snapshot[v].pop(u, None)
+        self.G.remove_edge(u, v)
+        return self._update(u, v, removed=length)
+
+    def remove_node(self, n):
+        """Remove the node `n` and its edges from `G` and update the
+        betweenness.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is not in `G`.
+        """
+        if n not in self.G:
+            raise nx.NetworkXError("The node %s is not in the graph." % (n,))
+        edges = list(self.G.edges(n))
+        if self.G.is_directed():
+            edges.extend(self.G.in_edges(n))
+        for u, v in edges:
+            if self.G.has_edge(u, v):
+                self.remove_edge(u, v)
+        if n in self._distance:
+            self._forget(n)
+        if self._sources is not None:
+            self._sources.discard(n)
+        if self.weight is not None:
+            del self._snapshot[n]
+        del self._betweenness[n]
+        self.G.remove_node(n)
+
+    def _length(self, u, v):
+        if self.weight is None:
+            return 1
+        return self.G[u][v].get(self.weight, 1)
+
+    def _set_length(self, u, v, length):
+        if self.weight is not None:
+            self._snapshot[u][v] = length
+            if not self.G.is_directed():
+                self._snapshot[v][u] = length
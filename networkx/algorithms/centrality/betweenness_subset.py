@@ -13,6 +13,7 @@ from networkx.algorithms.centrality.betweenness import\
     _single_source_dijkstra_path_basic as dijkstra
 from networkx.algorithms.centrality.betweenness import\
     _single_source_shortest_path_basic as shortest_path
+from networkx.algorithms.shortest_paths.weighted import _weight_snapshot
 
 __all__ = ['betweenness_centrality_subset', 'betweenness_centrality_source',
            'edge_betweenness_centrality_subset']
@@ -89,6 +90,9 @@ def betweenness_centrality_subset(G, sources, targets, normalized=False,
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
     b = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    if weight is not None:
+        # The weights are read once for all the sources.
+        weight = _weight_snapshot(G, weight)
     for s in sources:
         # single source shortest paths
         if weight is None:  # use BFS
@@ -168,6 +172,9 @@ def edge_betweenness_centrality_subset(G, sources, targets, normalized=False,
     """
     b = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     b.update(dict.fromkeys(G.edges(), 0.0))  # b[e] for e in G.edges()
+    if weight is not None:
+        # The weights are read once for all the sources.
+        weight = _weight_snapshot(G, weight)
     for s in sources:
         # single source shortest paths
         if weight is None:  # use BFS
@@ -8,11 +8,16 @@ Closeness centrality measures.
 #    All rights reserved.
 #    BSD license.
 import functools
+from heapq import heappush, heappop, heapreplace
+from itertools import count
 import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_snapshot
+from networkx.algorithms.traversal.array_bfs import _distance_rows
+from networkx.algorithms.traversal.array_bfs import _has_numpy
 __author__ = "\n".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                         'Pieter Swart (swart@lanl.gov)',
                         'Sasha Gutfraind (ag362@cornell.edu)'])
-__all__ = ['closeness_centrality']
+__all__ = ['closeness_centrality', 'top_k_closeness']
 
 
 def closeness_centrality(G, u=None, distance=None, normalized=True, reverse=False):
@@ -57,7 +62,7 @@ def closeness_centrality(G, u=None, distance=None, normalized=True, reverse=Fals
     See Also
     --------
     betweenness_centrality, load_centrality, eigenvector_centrality,
-    degree_centrality
+    degree_centrality, top_k_closeness, approximate_closeness_centrality
 
     Notes
     -----
@@ -71,6 +76,10 @@ def closeness_centrality(G, u=None, distance=None, normalized=True, reverse=Fals
     shortest-path length will be computed using Dijkstra's algorithm with
     that edge attribute as the edge weight.
 
+    Otherwise, if NumPy is available and `u` is None, the distances are
+    found by breadth-first searches from 64 nodes at a time, as in
+    :func:`~networkx.bfs_distance_matrix`.
+
     References
     ----------
     .. [1] Linton C. Freeman: Centrality in networks: I.
@@ -91,15 +100,21 @@ def closeness_centrality(G, u=None, distance=None, normalized=True, reverse=Fals
         nodes = G.nodes()
     else:
         nodes = [u]
+    if distance is None and u is None and _has_numpy():
+        # Bit-parallel breadth-first searches from 64 nodes at a time.
+        rows = _distance_rows(G, reverse=G.is_directed() and not reverse)
+        sums = ((n, int((row >= 0).sum()), int(row[row > 0].sum()))
+                for n, row, _ in rows)
+    else:
+        sums = ((n, len(sp), sum(sp.values()))
+                for n, sp in ((n, dict(path_length(G, n))) for n in nodes))
     closeness_centrality = {}
-    for n in nodes:
-        sp = dict(path_length(G, n))
-        totsp = sum(sp.values())
+    for n, reached, totsp in sums:
         if totsp > 0.0 and len(G) > 1:
-            closeness_centrality[n] = (len(sp)-1.0) / totsp
+            closeness_centrality[n] = (reached-1.0) / totsp
             # normalize to number of nodes-1 in connected part
             if normalized:
-                s = (len(sp)-1.0) / ( len(G) - 1 )
+                s = (reached-1.0) / ( len(G) - 1 )
                 closeness_centrality[n] *= s
         else:
             closeness_centrality[n] = 0.0
@@ -107,3 +122,217 @@ def closeness_centrality(G, u=None, distance=None, normalized=True, reverse=Fals
         return closeness_centrality[u]
     else:
         return closeness_centrality
+
+
+def top_k_closeness(G, k, distance=None, normalized=True, reverse=False):
+    r"""Return the `k` nodes of highest closeness centrality.
+
+    The closeness centrality is as computed by
+    :func:`closeness_centrality`. The nodes are searched from in order of
+    decreasing degree, and each search stops as soon as a bound shows
+    that its node cannot have a higher closeness than the `k`-th best
+    found so far [1]_. The searches from peripheral nodes are then cut
+    after a few levels.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+    k : integer
+      Number of nodes to return.
+    distance : edge attribute key, optional (default=None)
+      Use the specified edge attribute as the edge distance in shortest
+      path calculations
+    normalized : bool, optional
+      If True (default) normalize by the number of nodes in the connected
+      part of the graph.
+    reverse : bool, optional (default=False)
+      If True and G is a digraph, reverse the edges of G, using successors
+      instead of predecessors.
+
+    Returns
+    -------
+    nodes : list
+      List of `(node, closeness)` pairs by decreasing closeness, of
+      length `k` or the number of nodes if it is smaller. Among nodes of
+      equal closeness, the first searched are kept.
+
+    Raises
+    ------
+    ValueError
+      If `k` is not positive.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> nx.top_k_closeness(G, 2)
+    [(2, 0.6666666666666666), (1, 0.5714285714285714)]
+
+    See Also
+    --------
+    closeness_centrality
+
+    Notes
+    -----
+    Without distances, the searches are breadth-first searches. After
+    each level `d`, the nodes not reached yet are at distance at least
+    `d + 1`, and at most as many of them as the edges leaving the level
+    are at distance `d + 1`. With distances, Dijkstra's algorithm is used
+    and the nodes not reached yet are at least as far as the last one
+    reached. The number of nodes the search can still reach is bounded
+    by the size of the connected component, and for directed graphs by
+    the sizes of the strongly connected components it can reach.
+
+    The pruning works best on graphs of small diameter, such as social
+    networks. On meshes and road networks most searches run to the end,
+    and :func:`closeness_centrality` may be faster.
+
+    References
+    ----------
+    .. [1] Elisabetta Bergamini, Michele Borassi, Pierluigi Crescenzi,
+       Andrea Marino and Henning Meyerhenke:
+       Computing Top-k Closeness Centrality Faster in Unweighted Graphs.
+       Proceedings of the 18th Workshop on Algorithm Engineering and
+       Experiments (ALENEX), pp. 68-80, 2016.
+    """
+    if k < 1:
+        raise ValueError('k must be positive')
+    n = len(G)
+    directed = G.is_directed()
+    # As in closeness_centrality, the distances to the nodes of digraphs
+    # are searched along the edges reversed, unless reverse is True or
+    # the edges have distances.
+    backward = directed and not reverse and distance is None
+    if not directed:
+        adj = G._adj
+    else:
+        adj = G._pred if backward else G._succ
+    if distance is not None:
+        adj = _weight_snapshot(G, distance)
+    reach = _reach_bounds(G, backward)
+
+    def closeness(reached, total):
+        if total > 0 and n > 1:
+            c = (reached - 1.0) / total
+            if normalized:
+                c *= (reached - 1.0) / (n - 1)
+            return c
+        return 0.0
+
+    def bound(reached, total, most, near, gamma, far):
+        # At most gamma of the nodes still to reach are at distance near,
+        # the others farther. The closeness is largest for the fewest or
+        # the most nodes on either side of gamma.
+        best = 0.0
+        for r in {reached, min(reached + gamma, most), most}:
+            extra = r - reached
+            close = min(gamma, extra)
+            farness = total + near * close + far * (extra - close)
+            if farness == 0 and r > 1:
+                # Nothing is known yet about the distances.
+                return float('inf')
+            best = max(best, closeness(r, farness))
+        return best
+
+    top = []
+    c = count()
+    nodes = sorted(G, key=lambda v: len(adj[v]), reverse=True)
+    for v in nodes:
+        threshold = top[0][0] if len(top) == k else None
+        if distance is None:
+            value = _bfs_cut(adj, v, reach[v], threshold, closeness, bound,
+                             not directed)
+        else:
+            value = _dijkstra_cut(adj, v, reach[v], threshold, closeness,
+                                  bound)
+        if value is None:
+            continue
+        if threshold is None:
+            heappush(top, (value, -next(c), v))
+        elif value > threshold:
+            heapreplace(top, (value, -next(c), v))
+    return [(v, value) for value, _, v in sorted(top, reverse=True)]
+
+
+def _bfs_cut(adj, source, most, threshold, closeness, bound, undirected):
+    """Returns the closeness of `source` from a breadth-first search, or
+    None if its bound falls below `threshold`."""
+    seen = {source}
+    level = [source]
+    depth = 0
+    reached = 1
+    total = 0
+    while level:
+        if threshold is not None:
+            # Every node of the level but the source has an edge back to
+            # the previous level.
+            gamma = sum(len(adj[w]) for w in level)
+            if undirected and depth > 0:
+                gamma -= len(level)
+            if bound(reached, total, most, depth + 1, gamma,
+                     depth + 2) < threshold:
+                return None
+        following = []
+        for w in level:
+            for x in adj[w]:
+                if x not in seen:
+                    seen.add(x)
+                    following.append(x)
+        depth += 1
+        reached += len(following)
+        total += depth * len(following)
+        level = following
+    return closeness(reached, total)
+
+
+def _dijkstra_cut(adj, source, most, threshold, closeness, bound):
+    """Returns the closeness of `source` from Dijkstra's algorithm on the
+    weights `adj`, or None if its bound falls below `threshold`."""
+    dist = {}
+    seen = {source: 0}
+    c = count()
+    fringe = [(0, next(c), source)]
+    reached = 0
+    total = 0
+    while fringe:
+        d, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        if threshold is not None and bound(reached, total, most, d, 0,
+                                           d) < threshold:
+            return None
+        dist[v] = d
+        reached += 1
+        total += d
+        for u, cost in adj[v].items():
+            vu_dist = d + cost
+            if u not in dist and (u not in seen or vu_dist < seen[u]):
+                seen[u] = vu_dist
+                heappush(fringe, (vu_dist, next(c), u))
+    return closeness(reached, total)
+
+
+def _reach_bounds(G, backward):
+    """Returns upper bounds on the number of nodes reachable from each
+    node, itself included, along the edges of `G`, reversed if `backward`
+    is True."""
+    if not G.is_directed():
+        reach = {}
+        for component in nx.connected_components(G):
+            reach.update(dict.fromkeys(component, len(component)))
+        return reach
+    C = nx.condensation(G)
+    order = list(nx.topological_sort(C))
+    if not backward:
+        order.reverse()
+    nbrs = C._pred if backward else C._succ
+    weak = {}
+    for component in nx.weakly_connected_components(C):
+        size = sum(len(C.node[c]['members']) for c in component)
+        weak.update(dict.fromkeys(component, size))
+    bound = {}
+    for c in order:
+        bound[c] = min(weak[c], len(C.node[c]['members']) +
+                       sum(bound[d] for d in nbrs[c]))
+    mapping = C.graph['mapping']
+    return {v: bound[mapping[v]] for v in G}
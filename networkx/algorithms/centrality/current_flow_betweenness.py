@@ -10,8 +10,9 @@
 import random
 
 import networkx as nx
-from networkx.algorithms.centrality.flow_matrix import *
-from networkx.utils import not_implemented_for, reverse_cuthill_mckee_ordering
+from networkx.algorithms.centrality.flow_matrix import _BATCH
+from networkx.algorithms.centrality.flow_matrix import _factorization
+from networkx.utils import not_implemented_for
 
 __all__ = ['current_flow_betweenness_centrality',
            'approximate_current_flow_betweenness_centrality',
@@ -46,10 +47,12 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
       Default data type for internal matrices.
       Set to np.float32 for lower memory consumption.
 
-    solver : string (default='lu')
+    solver : string or LaplacianFactorization (default='lu')
        Type of linear solver to use for computing the flow matrix.
        Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       "cg" (uses least memory). A :class:`LaplacianFactorization` of `G`
+       with the same `weight` can be given instead, to share it between
+       several current-flow computations.
 
     epsilon: float
         Absolute error tolerance.
@@ -93,20 +96,9 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
     except ImportError:
         raise ImportError('current_flow_betweenness_centrality requires SciPy ',
                           'http://scipy.org/')
-    if not nx.is_connected(G):
-        raise nx.NetworkXError("Graph not connected.")
-    solvername = {"full": FullInverseLaplacian,
-                  "lu": SuperLUInverseLaplacian,
-                  "cg": CGInverseLaplacian}
-    n = G.number_of_nodes()
-    ordering = list(reverse_cuthill_mckee_ordering(G))
-    # make a copy with integer labels according to rcm ordering
-    # this could be done without a copy if we really wanted to
-    H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
-    L = laplacian_sparse_matrix(H, nodelist=range(n), weight=weight,
-                                dtype=dtype, format='csc')
-    C = solvername[solver](L, dtype=dtype)  # initialize solver
-    betweenness = dict.fromkeys(H, 0.0)
+    F = _factorization(G, weight, dtype, solver)
+    H = F.H
+    n = F.n
     nb = (n-1.0)*(n-2.0)  # normalization factor
     cstar = n*(n-1)/nb
     l = 1  # parameter in approximation, adjustable
@@ -115,24 +107,36 @@ def approximate_current_flow_betweenness_centrality(G, normalized=True,
         raise nx.NetworkXError('Number random pairs k>kmax (%d>%d) ' % (k, kmax),
                                'Increase kmax or epsilon')
     cstar2k = cstar/(2*k)
-    for i in range(k):
-        s, t = random.sample(range(n), 2)
-        b = np.zeros(n, dtype=dtype)
-        b[s] = 1
-        b[t] = -1
-        p = C.solve(b)
-        for v in H:
-            if v == s or v == t:
-                continue
-            for nbr in H[v]:
-                w = H[v][nbr].get(weight, 1.0)
-                betweenness[v] += w*np.abs(p[v]-p[nbr])*cstar2k
+    pairs = np.array([random.sample(range(n), 2) for i in range(k)])
+    # Both orientations of the edges, summed into their first node by
+    # the incidence matrix A.
+    edges = [(u, v, d.get(weight, 1.0)) for u, v, d in H.edges(data=True)]
+    edges += [(v, u, c) for u, v, c in edges]
+    src = np.array([u for u, v, c in edges], dtype=np.intp)
+    dst = np.array([v for u, v, c in edges], dtype=np.intp)
+    weights = np.array([c for u, v, c in edges], dtype=dtype)
+    A = sparse.csr_matrix((np.ones(len(edges)), (src, np.arange(len(edges)))),
+                          shape=(n, len(edges)))
+    betweenness = np.zeros(n)
+    size = max(_BATCH // (len(edges) + n), 1)
+    for start in range(0, k, size):
+        s, t = pairs[start:start + size].T
+        columns = np.arange(len(s))
+        b = np.zeros((n, len(s)), dtype=dtype)
+        b[s, columns] = 1
+        b[t, columns] = -1
+        p = F.solve(b)
+        flow = A.dot(weights[:, np.newaxis]*np.abs(p[src]-p[dst]))
+        flow[s, columns] = 0
+        flow[t, columns] = 0
+        betweenness += flow.sum(axis=1)*cstar2k
     if normalized:
         factor = 1.0
     else:
         factor = nb/2.0
     # remap to original node names and "unnormalize" if required
-    return dict((ordering[k], float(v*factor)) for k, v in betweenness.items())
+    return dict((F.ordering[k], float(v*factor))
+                for k, v in enumerate(betweenness))
 
 
 @not_implemented_for('directed')
@@ -164,10 +168,12 @@ def current_flow_betweenness_centrality(G, normalized=True, weight=None,
       Default data type for internal matrices.
       Set to np.float32 for lower memory consumption.
 
-    solver : string (default='lu')
+    solver : string or LaplacianFactorization (default='lu')
        Type of linear solver to use for computing the flow matrix.
        Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       "cg" (uses least memory). A :class:`LaplacianFactorization` of `G`
+       with the same `weight` can be given instead, to share it between
+       several current-flow computations.
 
     Returns
     -------
@@ -180,6 +186,7 @@ def current_flow_betweenness_centrality(G, normalized=True, weight=None,
     betweenness_centrality
     edge_betweenness_centrality
     edge_current_flow_betweenness_centrality
+    LaplacianFactorization
 
     Notes
     -----
@@ -216,27 +223,21 @@ def current_flow_betweenness_centrality(G, normalized=True, weight=None,
     except ImportError:
         raise ImportError('current_flow_betweenness_centrality requires SciPy ',
                           'http://scipy.org/')
-    if not nx.is_connected(G):
-        raise nx.NetworkXError("Graph not connected.")
-    n = G.number_of_nodes()
-    ordering = list(reverse_cuthill_mckee_ordering(G))
-    # make a copy with integer labels according to rcm ordering
-    # this could be done without a copy if we really wanted to
-    H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
-    betweenness = dict.fromkeys(H, 0.0)  # b[v]=0 for v in H
-    for row, (s, t) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                       solver=solver):
-        pos = dict(zip(row.argsort()[::-1], range(n)))
-        for i in range(n):
-            betweenness[s] += (i-pos[i])*row[i]
-            betweenness[t] += (n-i-1-pos[i])*row[i]
+    F = _factorization(G, weight, dtype, solver)
+    n = F.n
+    betweenness = np.zeros(n)
+    for rows, edges in F.flow_rows():
+        for row, (s, t) in zip(rows, edges):
+            pos = np.empty(n)
+            pos[row.argsort()[::-1]] = np.arange(n)
+            betweenness[s] += np.dot(np.arange(n)-pos, row)
+            betweenness[t] += np.dot(n-np.arange(n)-1-pos, row)
     if normalized:
         nb = (n-1.0)*(n-2.0)  # normalization factor
     else:
         nb = 2.0
-    for v in H:
-        betweenness[v] = float((betweenness[v]-v)*2.0/nb)
-    return dict((ordering[k], v) for k, v in betweenness.items())
+    betweenness = (betweenness-np.arange(n))*2.0/nb
+    return dict((F.ordering[k], float(v)) for k, v in enumerate(betweenness))
 
 
 @not_implemented_for('directed')
@@ -269,10 +270,12 @@ def edge_current_flow_betweenness_centrality(G, normalized=True,
       Default data type for internal matrices.
       Set to np.float32 for lower memory consumption.
 
-    solver : string (default='lu')
+    solver : string or LaplacianFactorization (default='lu')
        Type of linear solver to use for computing the flow matrix.
        Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       "cg" (uses least memory). A :class:`LaplacianFactorization` of `G`
+       with the same `weight` can be given instead, to share it between
+       several current-flow computations.
 
     Returns
     -------
@@ -317,7 +320,6 @@ def edge_current_flow_betweenness_centrality(G, normalized=True,
     .. [2] A measure of betweenness centrality based on random walks,
        M. E. J. Newman, Social Networks 27, 39-54 (2005).
     """
-    from networkx.utils import reverse_cuthill_mckee_ordering
     try:
         import numpy as np
     except ImportError:
@@ -328,26 +330,19 @@ def edge_current_flow_betweenness_centrality(G, normalized=True,
     except ImportError:
         raise ImportError('current_flow_betweenness_centrality requires SciPy ',
                           'http://scipy.org/')
-    if not nx.is_connected(G):
-        raise nx.NetworkXError("Graph not connected.")
-    n = G.number_of_nodes()
-    ordering = list(reverse_cuthill_mckee_ordering(G))
-    # make a copy with integer labels according to rcm ordering
-    # this could be done without a copy if we really wanted to
-    H = nx.relabel_nodes(G, dict(zip(ordering,range(n))))
-    edges = (tuple(sorted((u, v))) for u, v in H.edges())
-    betweenness= dict.fromkeys(edges, 0.0)
+    F = _factorization(G, weight, dtype, solver)
+    n = F.n
+    betweenness = {}
     if normalized:
         nb = (n-1.0)*(n-2.0)  # normalization factor
     else:
         nb = 2.0
-    for row, (e) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                    solver=solver):
-        pos = dict(zip(row.argsort()[::-1], range(1, n+1)))
-        for i in range(n):
-            betweenness[e] += (i+1-pos[i])*row[i]
-            betweenness[e] += (n-i-pos[i])*row[i]
-        betweenness[e] /= nb
+    for rows, edges in F.flow_rows():
+        for row, e in zip(rows, edges):
+            pos = np.empty(n)
+            pos[row.argsort()[::-1]] = np.arange(1, n+1)
+            betweenness[e] = np.dot(n+1-2*pos, row)/nb
+    ordering = F.ordering
     return dict(((ordering[s], ordering[t]), float(v))
                 for (s, t), v in betweenness.items())
 
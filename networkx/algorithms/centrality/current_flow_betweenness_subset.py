@@ -9,9 +9,9 @@
 """Current-flow betweenness centrality measures for subsets of nodes."""
 import itertools
 
-import networkx as nx
-from networkx.algorithms.centrality.flow_matrix import *
-from networkx.utils import not_implemented_for, reverse_cuthill_mckee_ordering
+from networkx.algorithms.centrality.flow_matrix import _BATCH
+from networkx.algorithms.centrality.flow_matrix import _factorization
+from networkx.utils import not_implemented_for
 
 __all__ = ['current_flow_betweenness_centrality_subset',
            'edge_current_flow_betweenness_centrality_subset']
@@ -54,10 +54,12 @@ def current_flow_betweenness_centrality_subset(G, sources, targets,
       Default data type for internal matrices.
       Set to np.float32 for lower memory consumption.
 
-    solver: string (default='lu')
+    solver: string or LaplacianFactorization (default='lu')
        Type of linear solver to use for computing the flow matrix.
        Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       "cg" (uses least memory). A :class:`LaplacianFactorization` of `G`
+       with the same `weight` can be given instead, to share it between
+       several current-flow computations.
 
     Returns
     -------
@@ -96,7 +98,6 @@ def current_flow_betweenness_centrality_subset(G, sources, targets,
     .. [2] A measure of betweenness centrality based on random walks,
        M. E. J. Newman, Social Networks 27, 39-54 (2005).
     """
-    from networkx.utils import reverse_cuthill_mckee_ordering
     try:
         import numpy as np
     except ImportError:
@@ -107,30 +108,22 @@ def current_flow_betweenness_centrality_subset(G, sources, targets,
     except ImportError:
         raise ImportError('current_flow_betweenness_centrality requires SciPy ',
                           'http://scipy.org/')
-    if not nx.is_connected(G):
-        raise nx.NetworkXError("Graph not connected.")
-    n = G.number_of_nodes()
-    ordering = list(reverse_cuthill_mckee_ordering(G))
-    # make a copy with integer labels according to rcm ordering
-    # this could be done without a copy if we really wanted to
-    mapping = dict(zip(ordering, range(n)))
-    H = nx.relabel_nodes(G, mapping)
-    betweenness = dict.fromkeys(H, 0.0)  # b[v]=0 for v in H
-    for row, (s, t) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                       solver=solver):
-        for ss in sources:
-            i = mapping[ss]
-            for tt in targets:
-                j = mapping[tt]
-                betweenness[s] += 0.5*np.abs(row[i]-row[j])
-                betweenness[t] += 0.5*np.abs(row[i]-row[j])
+    F = _factorization(G, weight, dtype, solver)
+    n = F.n
+    i = np.array([F.mapping[ss] for ss in sources], dtype=np.intp)
+    j = np.array([F.mapping[tt] for tt in targets], dtype=np.intp)
+    betweenness = np.zeros(n)
+    for rows, edges in F.flow_rows():
+        flow = _subset_flow(rows, i, j)
+        for (s, t), f in zip(edges, flow):
+            betweenness[s] += f
+            betweenness[t] += f
     if normalized:
         nb = (n-1.0)*(n-2.0)  # normalization factor
     else:
         nb = 2.0
-    for v in H:
-        betweenness[v] = betweenness[v]/nb + 1.0/(2-n)
-    return dict((ordering[k], v) for k, v in betweenness.items())
+    betweenness = betweenness/nb + 1.0/(2-n)
+    return dict((F.ordering[k], float(v)) for k, v in enumerate(betweenness))
 
 
 @not_implemented_for('directed')
@@ -171,10 +164,12 @@ def edge_current_flow_betweenness_centrality_subset(G, sources, targets,
       Default data type for internal matrices.
       Set to np.float32 for lower memory consumption.
 
-    solver: string (default='lu')
+    solver: string or LaplacianFactorization (default='lu')
        Type of linear solver to use for computing the flow matrix.
        Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       "cg" (uses least memory). A :class:`LaplacianFactorization` of `G`
+       with the same `weight` can be given instead, to share it between
+       several current-flow computations.
 
     Returns
     -------
@@ -222,32 +217,36 @@ def edge_current_flow_betweenness_centrality_subset(G, sources, targets,
     except ImportError:
         raise ImportError('current_flow_betweenness_centrality requires SciPy ',
                           'http://scipy.org/')
-    if not nx.is_connected(G):
-        raise nx.NetworkXError("Graph not connected.")
-    n = G.number_of_nodes()
-    ordering = list(reverse_cuthill_mckee_ordering(G))
-    # make a copy with integer labels according to rcm ordering
-    # this could be done without a copy if we really wanted to
-    mapping = dict(zip(ordering, range(n)))
-    H = nx.relabel_nodes(G, mapping)
-    edges = (tuple(sorted((u, v))) for u, v in H.edges())
-    betweenness = dict.fromkeys(edges, 0.0)
+    F = _factorization(G, weight, dtype, solver)
+    n = F.n
+    ordering = F.ordering
+    i = np.array([F.mapping[ss] for ss in sources], dtype=np.intp)
+    j = np.array([F.mapping[tt] for tt in targets], dtype=np.intp)
     if normalized:
         nb = (n-1.0)*(n-2.0)  # normalization factor
     else:
         nb = 2.0
-    for row, (e) in flow_matrix_row(H, weight=weight, dtype=dtype,
-                                    solver=solver):
-        for ss in sources:
-            i = mapping[ss]
-            for tt in targets:
-                j = mapping[tt]
-                betweenness[e] += 0.5*np.abs(row[i]-row[j])
-        betweenness[e] /= nb
+    betweenness = {}
+    for rows, edges in F.flow_rows():
+        for e, f in zip(edges, _subset_flow(rows, i, j)):
+            betweenness[e] = float(f/nb)
     return dict(((ordering[s], ordering[t]), v)
                 for (s, t), v in betweenness.items())
 
 
+def _subset_flow(rows, i, j):
+    # half the sum of |row[i] - row[j]| over the source indices i and the
+    # target indices j, for each row
+    import numpy as np
+    flow = np.zeros(len(rows))
+    size = max(_BATCH // (len(rows) * max(len(i), 1)), 1)
+    for start in range(0, len(j), size):
+        jj = j[start:start + size]
+        diff = rows[:, i, np.newaxis] - rows[:, np.newaxis, jj]
+        flow += 0.5*np.abs(diff).sum(axis=(1, 2))
+    return flow
+
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
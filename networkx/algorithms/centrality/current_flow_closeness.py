@@ -7,10 +7,9 @@
 #
 # Author: Aric Hagberg (hagberg@lanl.gov)
 """Current-flow closeness centrality measures."""
-import networkx as nx
-
-from networkx.utils import not_implemented_for, reverse_cuthill_mckee_ordering
-from networkx.algorithms.centrality.flow_matrix import *
+from networkx.utils import not_implemented_for
+from networkx.algorithms.centrality.flow_matrix import _BATCH
+from networkx.algorithms.centrality.flow_matrix import _factorization
 
 __all__ = ['current_flow_closeness_centrality', 'information_centrality']
 
@@ -37,10 +36,12 @@ def current_flow_closeness_centrality(G, weight=None,
       Default data type for internal matrices.
       Set to np.float32 for lower memory consumption.
 
-    solver: string (default='lu')
+    solver: string or LaplacianFactorization (default='lu')
        Type of linear solver to use for computing the flow matrix.
        Options are "full" (uses most memory), "lu" (recommended), and
-       "cg" (uses least memory).
+       "cg" (uses least memory). A :class:`LaplacianFactorization` of `G`
+       with the same `weight` can be given instead, to share it between
+       several current-flow computations.
 
     Returns
     -------
@@ -50,6 +51,7 @@ def current_flow_closeness_centrality(G, weight=None,
     See Also
     --------
     closeness_centrality
+    LaplacianFactorization
 
     Notes
     -----
@@ -72,29 +74,21 @@ def current_flow_closeness_centrality(G, weight=None,
     """
     import numpy as np
     import scipy
-    if not nx.is_connected(G):
-        raise nx.NetworkXError("Graph not connected.")
-    solvername = {"full": FullInverseLaplacian,
-                  "lu": SuperLUInverseLaplacian,
-                  "cg": CGInverseLaplacian}
-    n = G.number_of_nodes()
-    ordering = list(reverse_cuthill_mckee_ordering(G))
-    # make a copy with integer labels according to rcm ordering
-    # this could be done without a copy if we really wanted to
-    H = nx.relabel_nodes(G, dict(zip(ordering, range(n))))
-    betweenness = dict.fromkeys(H, 0.0)  # b[v]=0 for v in H
-    n = H.number_of_nodes()
-    L = laplacian_sparse_matrix(H, nodelist=range(n), weight=weight,
-                                dtype=dtype, format='csc')
-    C2 = solvername[solver](L, width=1, dtype=dtype)  # initialize solver
-    for v in H:
-        col = C2.get_row(v)
-        for w in H:
-            betweenness[v] += col[v]-2*col[w]
-            betweenness[w] += col[v]
-    for v in H:
-        betweenness[v] = 1.0 / (betweenness[v])
-    return dict((ordering[k], float(v)) for k, v in betweenness.items())
+    F = _factorization(G, weight, dtype, solver)
+    n = F.n
+    # The sum of the effective resistances between v and the other nodes
+    # is n IL[v, v] - 2 sum(IL[v]) + trace(IL).
+    diagonal = np.zeros(n)
+    rowsum = np.zeros(n)
+    size = max(_BATCH // n, 1)
+    for start in range(0, n, size):
+        rows = np.arange(start, min(start + size, n))
+        R = F.inverse_rows(rows)
+        diagonal[rows] = R[np.arange(len(rows)), rows]
+        rowsum[rows] = R.sum(axis=1)
+    betweenness = n * diagonal - 2 * rowsum + diagonal.sum()
+    return dict((F.ordering[k], float(1.0 / v))
+                for k, v in enumerate(betweenness))
 
 information_centrality = current_flow_closeness_centrality
 
@@ -23,7 +23,7 @@ __all__ = ['eigenvector_centrality', 'eigenvector_centrality_numpy']
 
 @not_implemented_for('multigraph')
 def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
-                           weight=None):
+                           weight=None, callback=None):
     r"""Compute the eigenvector centrality for the graph `G`.
 
     Eigenvector centrality computes the centrality for a node based on the
@@ -51,12 +51,20 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
       Error tolerance used to check convergence in power method iteration.
 
     nstart : dictionary, optional (default=None)
-      Starting value of eigenvector iteration for each node.
+      Starting value of eigenvector iteration for each node, such as a
+      previous result on a slightly different graph. Nodes missing from
+      `nstart` start at zero and keys that are not nodes are ignored.
 
     weight : None or string, optional (default=None)
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    callback : function, optional (default=None)
+      Function called after each iteration as ``callback(i, err)``, where
+      `i` is the number of the iteration, from zero, and `err` is the
+      change in the vector, in the L_1 norm, which is compared with
+      ``G.number_of_nodes() * tol``.
+
     Returns
     -------
     nodes : dictionary
@@ -69,6 +77,16 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
     >>> sorted((v, '{:0.2f}'.format(c)) for v, c in centrality.items())
     [(0, '0.37'), (1, '0.60'), (2, '0.60'), (3, '0.37')]
 
+    A previous result can be the starting value after a change of the
+    graph, and the callback records the error of each iteration:
+
+    >>> G.add_edge(3, 4)
+    >>> errors = []
+    >>> c = nx.eigenvector_centrality(G, nstart=centrality,
+    ...                               callback=lambda i, err: errors.append(err))
+    >>> errors[-1] < G.number_of_nodes() * 1.0e-6
+    True
+
     Raises
     ------
     NetworkXPointlessConcept
@@ -101,6 +119,10 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
     to enable discerning the correct eigenvector even for networks with
     multiple dominant eigenvalues.
 
+    When SciPy is available the iterations multiply a sparse adjacency
+    matrix built once; otherwise they run over the adjacency of `G`. Both
+    give the same result.
+
     For directed graphs this is "left" eigenvector centrality which corresponds
     to the in-edges in the graph. For out-edges eigenvector centrality
     first reverse the graph with ``G.reverse()``.
@@ -122,11 +144,25 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
     # If no initial vector is provided, start with the all-ones vector.
     if nstart is None:
         nstart = {v: 1 for v in G}
+    else:
+        nstart = {v: nstart[v] for v in G if v in nstart}
     if all(v == 0 for v in nstart.values()):
         raise nx.NetworkXError('initial vector cannot have all zero values')
-    # Normalize the initial vector so that each entry is in [0, 1]. This is
-    # guaranteed to never have a divide-by-zero error by the previous line.
-    x = {k: v / sum(nstart.values()) for k, v in nstart.items()}
+    # Normalize the initial vector as the iterations do, so that a previous
+    # result is already converged. This is guaranteed to never have a
+    # divide-by-zero error by the previous line.
+    norm = sqrt(sum(v ** 2 for v in nstart.values()))
+    x = {k: nstart.get(k, 0) / norm for k in G}
+    try:
+        import scipy.sparse  # noqa: F401 -- only checks that SciPy is available
+    except ImportError:
+        return _eigenvector_centrality_python(G, x, max_iter, tol, weight,
+                                              callback)
+    return _eigenvector_centrality_scipy(G, x, max_iter, tol, weight,
+                                         callback)
+
+
+def _eigenvector_centrality_python(G, x, max_iter, tol, weight, callback):
     nnodes = G.number_of_nodes()
     # make up to max_iter iterations
     for i in range(max_iter):
@@ -143,11 +179,37 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None,
         norm = sqrt(sum(z ** 2 for z in x.values())) or 1
         x = {k: v / norm for k, v in x.items()}
         # Check for convergence (in the L_1 norm).
-        if sum(abs(x[n] - xlast[n]) for n in x) < nnodes * tol:
+        err = sum(abs(x[n] - xlast[n]) for n in x)
+        if callback is not None:
+            callback(i, err)
+        if err < nnodes * tol:
             return x
     raise nx.PowerIterationFailedConvergence(max_iter)
 
 
+def _eigenvector_centrality_scipy(G, x, max_iter, tol, weight, callback):
+    # The same iterations as _eigenvector_centrality_python, with the
+    # transposed adjacency matrix in CSR format.
+    import numpy as np
+    nodelist = list(G)
+    nnodes = len(nodelist)
+    A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                  dtype=float, format='csc')
+    AT = A.T
+    x = np.array([x[n] for n in nodelist], dtype=float)
+    for i in range(max_iter):
+        xlast = x
+        x = xlast + AT.dot(xlast)
+        norm = np.linalg.norm(x) or 1
+        x /= norm
+        err = float(np.abs(x - xlast).sum())
+        if callback is not None:
+            callback(i, err)
+        if err < nnodes * tol:
+            return dict(zip(nodelist, map(float, x)))
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
 def eigenvector_centrality_numpy(G, weight=None, max_iter=50, tol=0):
     r"""Compute the eigenvector centrality for the graph G.
 
@@ -1,31 +1,179 @@
 # Helpers for current-flow betweenness and current-flow closness
 # Lazy computations for inverse Laplacian and flow-matrix rows.
 import networkx as nx
+from networkx.utils import reverse_cuthill_mckee_ordering
+
+__all__ = ['LaplacianFactorization']
+
+# Largest number of matrix entries computed by one batch of solves, which
+# bounds the memory of the current-flow routines independently of the
+# number of nodes.
+_BATCH = 1 << 22
+
+
+class LaplacianFactorization(object):
+    """Factorization of the Laplacian matrix of a connected graph, shared
+    by the current-flow centralities.
+
+    The nodes are ordered by the reverse Cuthill-McKee ordering and the
+    Laplacian matrix, without its first row and column, is factorized or
+    preconditioned once. The object can then be passed as the `solver` of
+    :func:`current_flow_closeness_centrality`,
+    :func:`current_flow_betweenness_centrality`,
+    :func:`edge_current_flow_betweenness_centrality`,
+    :func:`approximate_current_flow_betweenness_centrality` and their
+    subset variants, which solve the Laplacian systems they need in
+    batches of right-hand sides.
+
+    Parameters
+    ----------
+    G : graph
+      A connected undirected NetworkX graph. The graph is not copied; the
+      factorization records the weights of its edges and is rejected by
+      the current-flow routines once `G` changes.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    dtype : data type (default=float)
+      Default data type for internal matrices.
+      Set to np.float32 for lower memory consumption.
+
+    solver : string (default='lu')
+      Type of linear solver. Options are "full" (the inverse matrix, uses
+      most memory), "lu" (a sparse LU factorization, recommended), and
+      "cg" (preconditioned conjugate gradient, uses least memory).
+
+    preconditioner : string, optional (default=None)
+      Preconditioner of the "cg" solver: "amg" (smoothed aggregation
+      algebraic multigrid, requires PyAMG), "ilu" (incomplete LU) or
+      "jacobi" (the diagonal). If None, "amg" is used when PyAMG is
+      installed and "ilu" otherwise.
+
+    Raises
+    ------
+    NetworkXError
+      If `G` is not connected or the solver or preconditioner is unknown.
+
+    NetworkXNotImplemented
+      If `G` is directed.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> F = nx.LaplacianFactorization(G)
+    >>> b = nx.current_flow_betweenness_centrality(G, solver=F)
+    >>> c = nx.current_flow_closeness_centrality(G, solver=F)
+    >>> b == nx.current_flow_betweenness_centrality(G, solver='lu')
+    True
+
+    Notes
+    -----
+    The ordering keeps the factors of the sparse LU factorization narrow.
+    Conjugate gradient solves one right-hand side at a time, so its
+    batches only save the Python overhead of the calling routines.
+    """
+
+    def __init__(self, G, weight=None, dtype=float, solver='lu',
+                 preconditioner=None):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'directed type')
+        if not nx.is_connected(G):
+            raise nx.NetworkXError("Graph not connected.")
+        if solver not in _solvers:
+            raise nx.NetworkXError("Unknown solver %s." % (solver,))
+        self.weight = weight
+        self.dtype = dtype
+        self.solver = solver
+        self.n = n = G.number_of_nodes()
+        self.ordering = list(reverse_cuthill_mckee_ordering(G))
+        self.mapping = dict(zip(self.ordering, range(n)))
+        # make a copy with integer labels according to rcm ordering
+        self.H = nx.relabel_nodes(G, self.mapping)
+        self._weights = self._edge_weights(G)
+        L = laplacian_sparse_matrix(self.H, nodelist=range(n), weight=weight,
+                                    dtype=dtype, format='csc')
+        if solver == 'cg':
+            self.C = CGInverseLaplacian(L, width=1, dtype=dtype,
+                                        preconditioner=preconditioner)
+        else:
+            self.C = _solvers[solver](L, width=1, dtype=dtype)
+
+    def _edge_weights(self, G):
+        return dict((frozenset((u, v)), d.get(self.weight, 1))
+                    for u, v, d in G.edges(data=True))
+
+    def matches(self, G, weight=None):
+        """Return True if the factorization is that of the Laplacian of `G`
+        with edge weights `weight`."""
+        if weight != self.weight or len(G) != self.n:
+            return False
+        if any(v not in self.mapping for v in G):
+            return False
+        return self._edge_weights(G) == self._weights
+
+    def inverse_rows(self, rows):
+        """Return the rows of the inverse of the Laplacian matrix, with the
+        first row and column set to zero, at the indices `rows` of the
+        ordering, as an array of shape ``(len(rows), n)``."""
+        import numpy as np
+        return self.C.inverse_rows(np.asarray(rows, dtype=np.intp))
+
+    def solve(self, rhs):
+        """Return the solution `x` of ``L x = rhs``, with ``x[0] = 0``, for
+        an array `rhs` of one or more columns indexed by the ordering."""
+        return self.C.solve(rhs)
+
+    def flow_rows(self):
+        """Yield ``(rows, edges)`` for batches of edges `(u, v)` of the
+        relabeled graph, where each row is the current flowing through the
+        edge when a unit of current is injected at each node in turn and
+        removed at the first node of the ordering."""
+        import numpy as np
+        H = self.H
+        n = self.n
+        edges = sorted(tuple(sorted((u, v))) for u, v in H.edges())
+        size = max(_BATCH // (2 * n), 1)
+        for start in range(0, len(edges), size):
+            batch = edges[start:start + size]
+            k = len(batch)
+            ends = np.array(batch, dtype=np.intp).T.ravel()
+            c = np.array([H[u][v].get(self.weight, 1.0) for u, v in batch],
+                         dtype=self.dtype)
+            nodes, index = np.unique(ends, return_inverse=True)
+            R = self.C.inverse_rows(nodes)
+            yield c[:, np.newaxis] * (R[index[:k]] - R[index[k:]]), batch
+
+
+def _factorization(G, weight, dtype, solver):
+    """Return the factorization `solver`, after checking that it matches
+    `G`, or a new factorization with the solver named `solver`."""
+    if isinstance(solver, LaplacianFactorization):
+        if not solver.matches(G, weight):
+            raise nx.NetworkXError("The factorization does not match the "
+                                   "graph or the weight.")
+        return solver
+    return LaplacianFactorization(G, weight=weight, dtype=dtype,
+                                  solver=solver)
 
 
 def flow_matrix_row(G, weight=None, dtype=float, solver='lu'):
     # Generate a row of the current-flow matrix
+    # G must be connected with nodes labeled 0, ..., n-1
     import numpy as np
-    from scipy import sparse
-    from scipy.sparse import linalg
-    solvername = {"full": FullInverseLaplacian,
-                  "lu": SuperLUInverseLaplacian,
-                  "cg": CGInverseLaplacian}
     n = G.number_of_nodes()
     L = laplacian_sparse_matrix(G, nodelist=range(n), weight=weight,
                                 dtype=dtype, format='csc')
-    C = solvername[solver](L, dtype=dtype)  # initialize solver
-    w = C.w  # w is the Laplacian matrix width
+    C = _solvers[solver](L, width=1, dtype=dtype)  # initialize solver
     # row-by-row flow matrix
     for u, v in sorted(sorted((u, v)) for u, v in G.edges()):
-        B = np.zeros(w, dtype=dtype)
         c = G[u][v].get(weight, 1.0)
-        B[u%w] = c
-        B[v%w] = -c
-        # get only the rows needed in the inverse laplacian 
-        # and multiply to get the flow matrix row
-        row = np.dot(B, C.get_rows(u, v))
-        yield row, (u, v)
+        # get only the rows needed in the inverse laplacian
+        # and subtract them to get the flow matrix row
+        R = C.inverse_rows(np.array([u, v]))
+        yield c * (R[0] - R[1]), (u, v)
 
 
 # Class to compute the inverse laplacian only for specified rows
@@ -64,6 +212,13 @@ class InverseLaplacian(object):
         self.C[r % self.w, 1:] = self.solve_inverse(r)
         return self.C[r % self.w]
 
+    def inverse_rows(self, rows):
+        # one full row of the inverse laplacian per index in rows
+        R = np.zeros((len(rows), self.n), dtype=self.dtype)
+        for i, r in enumerate(rows):
+            R[i, 1:] = self.solve_inverse(r)
+        return R
+
     def width(self, L):
         m = 0
         for i, row in enumerate(L):
@@ -89,11 +244,15 @@ class FullInverseLaplacian(InverseLaplacian):
     def solve_inverse(self, r):
         return self.IL[r, 1:]
 
+    def inverse_rows(self, rows):
+        return self.IL[rows]
+
 
 class SuperLUInverseLaplacian(InverseLaplacian):
     def init_solver(self, L):
         from scipy.sparse import linalg
-        self.lusolve = linalg.factorized(self.L1.tocsc())
+        self.lu = linalg.splu(self.L1.tocsc())
+        self.lusolve = self.lu.solve
 
     def solve_inverse(self, r):
         rhs = np.zeros(self.n, dtype=self.dtype)
@@ -105,18 +264,60 @@ class SuperLUInverseLaplacian(InverseLaplacian):
         s[1:] = self.lusolve(rhs[1:])
         return s
 
+    def inverse_rows(self, rows):
+        # the laplacian is symmetric, so the rows are the solutions for
+        # the columns of the identity matrix, all solved at once
+        k = len(rows)
+        rhs = np.zeros((self.n, k), dtype=self.dtype)
+        rhs[rows, np.arange(k)] = 1
+        R = np.zeros((k, self.n), dtype=self.dtype)
+        if self.n > 1:
+            R[:, 1:] = self.lusolve(rhs[1:]).T
+        return R
+
 
 class CGInverseLaplacian(InverseLaplacian):
+    def __init__(self, L, width=None, dtype=None, preconditioner=None):
+        self.preconditioner = preconditioner
+        super(CGInverseLaplacian, self).__init__(L, width=width, dtype=dtype)
+
     def init_solver(self, L):
         global linalg
+        from scipy import sparse
         from scipy.sparse import linalg
-        ilu = linalg.spilu(self.L1.tocsc())
         n = self.n-1
-        self.M = linalg.LinearOperator(shape=(n, n), matvec=ilu.solve)
+        self.L1 = self.L1.tocsr()
+        preconditioner = self.preconditioner
+        if preconditioner in (None, 'amg'):
+            # Algebraic multigrid is the default when pyamg is installed.
+            try:
+                import pyamg
+            except ImportError:
+                if preconditioner == 'amg':
+                    raise
+                preconditioner = 'ilu'
+            else:
+                preconditioner = 'amg'
+        if preconditioner == 'amg':
+            ml = pyamg.smoothed_aggregation_solver(self.L1)
+            self.M = ml.aspreconditioner()
+        elif preconditioner == 'ilu':
+            ilu = linalg.spilu(self.L1.tocsc())
+            self.M = linalg.LinearOperator(shape=(n, n), matvec=ilu.solve)
+        elif preconditioner == 'jacobi':
+            D = sparse.diags(1.0 / self.L1.diagonal(), 0, format='csr')
+            self.M = linalg.aslinearoperator(D)
+        else:
+            raise nx.NetworkXError("Unknown preconditioner %s."
+                                   % (preconditioner,))
 
     def solve(self, rhs):
         s = np.zeros(rhs.shape, dtype=self.dtype)
-        s[1:] = linalg.cg(self.L1, rhs[1:], M=self.M)[0]
+        if rhs.ndim == 1:
+            s[1:] = linalg.cg(self.L1, rhs[1:], M=self.M)[0]
+        else:
+            for j in range(rhs.shape[1]):
+                s[1:, j] = linalg.cg(self.L1, rhs[1:, j], M=self.M)[0]
         return s
 
     def solve_inverse(self, r):
@@ -125,6 +326,11 @@ class CGInverseLaplacian(InverseLaplacian):
         return linalg.cg(self.L1, rhs[1:], M=self.M)[0]
 
 
+_solvers = {"full": FullInverseLaplacian,
+            "lu": SuperLUInverseLaplacian,
+            "cg": CGInverseLaplacian}
+
+
 # graph laplacian, sparse version, will move to linalg/laplacianmatrix.py
 def laplacian_sparse_matrix(G, nodelist=None, weight=None, dtype=None,
                             format='csr'):
@@ -10,6 +10,8 @@ from __future__ import division
 from functools import partial
 
 import networkx as nx
+from networkx.algorithms.traversal.array_bfs import _distance_rows
+from networkx.algorithms.traversal.array_bfs import _has_numpy
 
 __all__ = ['harmonic_centrality']
 
@@ -49,7 +51,7 @@ def harmonic_centrality(G, nbunch=None, distance=None):
     See Also
     --------
     betweenness_centrality, load_centrality, eigenvector_centrality,
-    degree_centrality, closeness_centrality
+    degree_centrality, closeness_centrality, approximate_harmonic_centrality
 
     Notes
     -----
@@ -57,11 +59,19 @@ def harmonic_centrality(G, nbunch=None, distance=None):
     shortest-path length will be computed using Dijkstra's algorithm with
     that edge attribute as the edge weight.
 
+    Otherwise, if NumPy is available, the distances are found by
+    breadth-first searches from 64 nodes at a time, as in
+    :func:`~networkx.bfs_distance_matrix`.
+
     References
     ----------
     .. [1] Boldi, Paolo, and Sebastiano Vigna. "Axioms for centrality."
            Internet Mathematics 10.3-4 (2014): 222-262.
     """
+    if distance is None and _has_numpy():
+        rows = _distance_rows(G, G.nbunch_iter(nbunch),
+                              reverse=G.is_directed())
+        return {u: float((1 / row[row > 0]).sum()) for u, row, _ in rows}
     if G.is_directed():
         G = G.reverse()
     spl = partial(nx.shortest_path_length, G, weight=distance)
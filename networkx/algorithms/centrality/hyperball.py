@@ -0,0 +1,380 @@
+#    Copyright (C) 2017 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""Distance-based measures estimated with HyperLogLog counters.
+
+Each node keeps a HyperLogLog counter [1]_ of the nodes within distance
+`t` of it, its ball of radius `t`. The counter of the ball of radius
+`t + 1` is the union, a register-wise maximum, of the counters of the
+balls of radius `t` of its neighbors, so that all the balls grow by one
+step per pass over the edges [2]_. The registers of all the counters are
+held in one NumPy array and each pass is vectorized.
+"""
+from __future__ import division
+
+from networkx.algorithms.traversal.array_bfs import _csr_adjacency
+from networkx.algorithms.traversal.array_bfs import _gather
+
+__all__ = ['approximate_harmonic_centrality',
+           'approximate_closeness_centrality',
+           'neighborhood_function',
+           'effective_diameter']
+
+# Largest number of registers gathered at once, which bounds the memory of
+# a pass independently of the number of edges.
+_CHUNK = 1 << 22
+
+
+def approximate_harmonic_centrality(G, precision=8, seed=None):
+    r"""Estimate the harmonic centrality of the nodes.
+
+    The harmonic centrality of a node `u` is estimated as
+
+    .. math::
+
+        C(u) = \sum_{t \geq 1} \frac{|B_t(u)| - |B_{t-1}(u)|}{t}
+
+    where :math:`|B_t(u)|` is the estimated number of nodes at distance at
+    most `t` to `u`.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph. Edge weights are ignored.
+
+    precision : integer, optional (default=8)
+      Base 2 logarithm of the number of registers per counter, between 4
+      and 16. The relative standard error of the ball sizes is about
+      :math:`1.04 / \sqrt{2^{precision}}` and each node takes
+      :math:`2^{precision}` bytes.
+
+    seed : integer, optional
+      Seed for the random hash values of the nodes.
+
+    Returns
+    -------
+    nodes : dictionary
+      Dictionary of nodes with estimated harmonic centrality as the value.
+
+    Raises
+    ------
+    ValueError
+      If `precision` is out of range.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.path_graph(4)
+    >>> c = nx.approximate_harmonic_centrality(G, seed=1)
+    >>> exact = nx.harmonic_centrality(G)
+    >>> all(abs(c[v] - exact[v]) < 0.1 for v in G)
+    True
+
+    See Also
+    --------
+    harmonic_centrality, approximate_closeness_centrality
+
+    Notes
+    -----
+    There is one pass over the edges per unit of the diameter of `G`,
+    each taking time proportional to the number of edges leaving the
+    nodes whose counters changed, times the number of registers.
+
+    References
+    ----------
+    .. [1] Philippe Flajolet, Eric Fusy, Olivier Gandouet and Frederic
+       Meunier: HyperLogLog: the analysis of a near-optimal cardinality
+       estimation algorithm. Proceedings of the 2007 Conference on
+       Analysis of Algorithms (AofA 07), pp. 127-146.
+    .. [2] Paolo Boldi and Sebastiano Vigna: In-core computation of
+       geometric centralities with HyperBall: a hundred billion nodes and
+       beyond. Proceedings of the 2013 IEEE 13th International Conference
+       on Data Mining Workshops, pp. 621-628.
+    """
+    import numpy as np
+    nodelist = list(G)
+    harmonic = np.zeros(len(nodelist))
+    previous = None
+    for t, sizes in _hyperball(G, precision, seed=seed):
+        if t > 0:
+            harmonic += (sizes - previous) / t
+        previous = sizes.copy()
+    return dict(zip(nodelist, harmonic.tolist()))
+
+
+def approximate_closeness_centrality(G, precision=8, normalized=True,
+                                     reverse=False, seed=None):
+    r"""Estimate the closeness centrality of the nodes.
+
+    The closeness centrality, as computed by :func:`closeness_centrality`,
+    is estimated from the sizes of the balls around the nodes: the number
+    of nodes reaching a node `u` is the size of its largest ball, and the
+    sum of their distances to `u` is
+
+    .. math::
+
+        \sum_{t \geq 1} t (|B_t(u)| - |B_{t-1}(u)|)
+
+    where :math:`|B_t(u)|` is the estimated number of nodes at distance at
+    most `t` to `u`.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph. Edge weights are ignored.
+
+    precision : integer, optional (default=8)
+      Base 2 logarithm of the number of registers per counter, as for
+      :func:`approximate_harmonic_centrality`.
+
+    normalized : bool, optional
+      If True (default) normalize by the number of nodes in the connected
+      part of the graph.
+
+    reverse : bool, optional (default=False)
+      If True and G is a digraph, reverse the edges of G, using successors
+      instead of predecessors.
+
+    seed : integer, optional
+      Seed for the random hash values of the nodes.
+
+    Returns
+    -------
+    nodes : dictionary
+      Dictionary of nodes with estimated closeness centrality as the
+      value.
+
+    Raises
+    ------
+    ValueError
+      If `precision` is out of range.
+
+    See Also
+    --------
+    closeness_centrality, approximate_harmonic_centrality
+    """
+    import numpy as np
+    nodelist = list(G)
+    n = len(nodelist)
+    farness = np.zeros(n)
+    previous = sizes = np.ones(n)
+    for t, sizes in _hyperball(G, precision, reverse, seed):
+        if t > 0:
+            farness += t * (sizes - previous)
+        previous = sizes.copy()
+    reached = np.maximum(sizes - 1, 0)
+    closeness = np.zeros(n)
+    positive = farness > 0
+    closeness[positive] = reached[positive] / farness[positive]
+    if normalized and n > 1:
+        closeness *= reached / (n - 1)
+    return dict(zip(nodelist, closeness.tolist()))
+
+
+def neighborhood_function(G, precision=8, seed=None):
+    """Estimate the neighborhood function of `G`.
+
+    The neighborhood function maps each distance `t` to the number of
+    pairs of nodes `(u, v)` such that the distance from `u` to `v` is at
+    most `t`, including the pairs `(u, u)`.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph. Edge weights are ignored.
+
+    precision : integer, optional (default=8)
+      Base 2 logarithm of the number of registers per counter, as for
+      :func:`approximate_harmonic_centrality`.
+
+    seed : integer, optional
+      Seed for the random hash values of the nodes.
+
+    Returns
+    -------
+    counts : list
+      The estimated number of pairs at distance at most `t`, for `t` from
+      0 until the counters stop changing, which happens at the latest at
+      the diameter of `G`.
+
+    Raises
+    ------
+    ValueError
+      If `precision` is out of range.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.path_graph(3)
+    >>> [int(round(c)) for c in nx.neighborhood_function(G, seed=1)]
+    [3, 7, 9]
+
+    See Also
+    --------
+    effective_diameter
+
+    References
+    ----------
+    .. [1] Paolo Boldi, Marco Rosa and Sebastiano Vigna: HyperANF:
+       approximating the neighbourhood function of very large graphs on a
+       budget. Proceedings of the 20th International Conference on World
+       Wide Web, pp. 625-634, 2011.
+    """
+    return [float(sizes.sum()) for t, sizes in _hyperball(G, precision,
+                                                          seed=seed)]
+
+
+def effective_diameter(G, q=0.9, precision=8, seed=None):
+    """Estimate the effective diameter of `G`.
+
+    The effective diameter is the smallest distance `d` within which a
+    fraction `q` of the pairs of nodes joined by a path lie, linearly
+    interpolated between integer distances.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph. Edge weights are ignored.
+
+    q : float, optional (default=0.9)
+      The fraction of the pairs of nodes, between 0 and 1.
+
+    precision : integer, optional (default=8)
+      Base 2 logarithm of the number of registers per counter, as for
+      :func:`approximate_harmonic_centrality`.
+
+    seed : integer, optional
+      Seed for the random hash values of the nodes.
+
+    Returns
+    -------
+    d : float
+      The estimated effective diameter.
+
+    Raises
+    ------
+    ValueError
+      If `q` is not between 0 and 1 or `precision` is out of range.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> int(round(nx.effective_diameter(nx.path_graph(3), q=1.0, seed=1)))
+    2
+
+    See Also
+    --------
+    neighborhood_function
+    """
+    if not 0 < q <= 1:
+        raise ValueError('q must be between 0 and 1')
+    counts = neighborhood_function(G, precision, seed)
+    if not counts:
+        return 0.0
+    goal = q * counts[-1]
+    for t, count in enumerate(counts):
+        if count >= goal:
+            if t == 0:
+                return 0.0
+            below = counts[t - 1]
+            return t - 1 + (goal - below) / (count - below)
+    return float(len(counts) - 1)
+
+
+def _hyperball(G, precision, reverse=False, seed=None):
+    """Yields ``(t, sizes)`` for `t` from 0 until the balls stop growing,
+    where ``sizes[i]`` is the estimated number of nodes at distance at
+    most `t` to the `i`-th node of `G`, or from it if `reverse` is True.
+
+    The array `sizes` is updated in place between iterations.
+    """
+    import numpy as np
+    if not 4 <= precision <= 16:
+        raise ValueError('precision must be between 4 and 16')
+    nodelist, index, out_csr, in_csr = _csr_adjacency(G)
+    n = len(nodelist)
+    if n == 0:
+        return
+    m = 1 << precision
+    # The counters of a node are merged into those of the nodes it
+    # reaches in one step, along the edges or against them.
+    ptr, idx = in_csr if reverse else out_csr
+
+    # Each node is hashed to a register and to the position of the lowest
+    # set bit of the other bits of its random value.
+    rng = np.random.RandomState(seed)
+    hashes = np.frombuffer(rng.bytes(8 * n), dtype=np.uint64)
+    register = (hashes & np.uint64(m - 1)).astype(np.intp)
+    rest = hashes >> np.uint64(precision)
+    lowest = rest & (~rest + np.uint64(1))
+    rank = np.full(n, 65 - precision, dtype=np.uint8)
+    nonzero = lowest != 0
+    rank[nonzero] = np.log2(lowest[nonzero].astype(np.float64)) + 1
+    registers = np.zeros((n, m), dtype=np.uint8)
+    registers[np.arange(n), register] = rank
+
+    if m >= 128:
+        alpha = 0.7213 / (1 + 1.079 / m)
+    else:
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+    powers = 2.0 ** -np.arange(66)
+    rows_per_chunk = max(_CHUNK // m, 1)
+
+    def estimate(rows):
+        for start in range(0, len(rows), rows_per_chunk):
+            chunk = rows[start:start + rows_per_chunk]
+            block = registers[chunk]
+            size = alpha * m * m / powers[block].sum(axis=1)
+            zeros = (block == 0).sum(axis=1)
+            # Linear counting for small cardinalities.
+            small = (size <= 2.5 * m) & (zeros > 0)
+            size[small] = m * np.log(m / zeros[small])
+            sizes[chunk] = size
+
+    sizes = np.empty(n)
+    estimate(np.arange(n))
+    t = 0
+    yield t, sizes
+    changed = np.arange(n)
+    position = np.empty(n, dtype=np.intp)
+    while changed.size:
+        # The counters merged in this pass are those of the changed nodes
+        # before the pass.
+        previous = registers[changed]
+        position[changed] = np.arange(changed.size)
+        # Split the changed nodes so that each chunk gathers at most
+        # _CHUNK registers.
+        ends = np.cumsum(ptr[changed + 1] - ptr[changed])
+        bounds = np.searchsorted(ends, np.arange(rows_per_chunk, ends[-1],
+                                                 rows_per_chunk),
+                                 side='right')
+        touched = []
+        for group in np.split(changed, bounds):
+            if not group.size:
+                continue
+            rows, nbrs = _gather(ptr, idx, group)
+            if not nbrs.size:
+                continue
+            order = np.argsort(nbrs, kind='mergesort')
+            nbrs = nbrs[order]
+            heads = np.flatnonzero(np.concatenate(
+                ([True], nbrs[1:] != nbrs[:-1])))
+            merged = np.maximum.reduceat(previous[position[rows[order]]],
+                                         heads, axis=0)
+            targets = nbrs[heads]
+            old = registers[targets]
+            new = np.maximum(old, merged)
+            grown = (new != old).any(axis=1)
+            registers[targets[grown]] = new[grown]
+            touched.append(targets[grown])
+        if not touched:
+            break
+        changed = np.unique(np.concatenate(touched))
+        if not changed.size:
+            break
+        t += 1
+        estimate(changed)
+        yield t, sizes
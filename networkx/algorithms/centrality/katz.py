@@ -21,7 +21,7 @@ __all__ = ['katz_centrality', 'katz_centrality_numpy']
 
 @not_implemented_for('multigraph')
 def katz_centrality(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
-                    nstart=None, normalized=True, weight=None):
+                    nstart=None, normalized=True, weight=None, callback=None):
     r"""Compute the Katz centrality for the nodes of the graph G.
 
     Katz centrality computes the centrality for a node based on the centrality
@@ -71,7 +71,10 @@ def katz_centrality(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
       Error tolerance used to check convergence in power method iteration.
 
     nstart : dictionary, optional
-      Starting value of Katz iteration for each node.
+      Starting value of Katz iteration for each node, such as a previous
+      result with ``normalized=False`` on a slightly different graph.
+      Nodes missing from `nstart` start at zero and keys that are not
+      nodes are ignored.
 
     normalized : bool, optional (default=True)
       If True normalize the resulting values.
@@ -80,6 +83,12 @@ def katz_centrality(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    callback : function, optional (default=None)
+      Function called after each iteration as ``callback(i, err)``, where
+      `i` is the number of the iteration, from zero, and `err` is the
+      change in the vector, in the L_1 norm, which is compared with
+      ``G.number_of_nodes() * tol``.
+
     Returns
     -------
     nodes : dictionary
@@ -128,6 +137,10 @@ def katz_centrality(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
     The iteration will stop after max_iter iterations or an error tolerance of
     number_of_nodes(G)*tol has been reached.
 
+    When SciPy is available the iterations multiply a sparse adjacency
+    matrix built once; otherwise they run over the adjacency of `G`. Both
+    give the same result.
+
     When `\alpha = 1/\lambda_{max}` and `\beta=0`, Katz centrality is the same
     as eigenvector centrality.
 
@@ -148,13 +161,11 @@ def katz_centrality(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
     if len(G) == 0:
         return {}
 
-    nnodes = G.number_of_nodes()
-
     if nstart is None:
         # choose starting vector with entries of 0
         x = dict([(n, 0) for n in G])
     else:
-        x = nstart
+        x = dict((n, nstart.get(n, 0)) for n in G)
 
     try:
         b = dict.fromkeys(G, float(beta))
@@ -164,6 +175,28 @@ def katz_centrality(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
             raise nx.NetworkXError('beta dictionary '
                                    'must have a value for every node')
 
+    try:
+        import scipy.sparse  # noqa: F401 -- only checks that SciPy is available
+    except ImportError:
+        x = _katz_centrality_python(G, alpha, b, x, max_iter, tol, weight,
+                                    callback)
+    else:
+        x = _katz_centrality_scipy(G, alpha, b, x, max_iter, tol, weight,
+                                   callback)
+    if normalized:
+        # normalize vector
+        try:
+            s = 1.0/sqrt(sum(v**2 for v in x.values()))
+        # this should never be zero?
+        except ZeroDivisionError:
+            s = 1.0
+        for n in x:
+            x[n] *= s
+    return x
+
+
+def _katz_centrality_python(G, alpha, b, x, max_iter, tol, weight, callback):
+    nnodes = G.number_of_nodes()
     # make up to max_iter iterations
     for i in range(max_iter):
         xlast = x
@@ -177,22 +210,35 @@ def katz_centrality(G, alpha=0.1, beta=1.0, max_iter=1000, tol=1.0e-6,
 
         # check convergence
         err = sum([abs(x[n]-xlast[n]) for n in x])
+        if callback is not None:
+            callback(i, err)
         if err < nnodes*tol:
-            if normalized:
-                # normalize vector
-                try:
-                    s = 1.0/sqrt(sum(v**2 for v in x.values()))
-                # this should never be zero?
-                except ZeroDivisionError:
-                    s = 1.0
-            else:
-                s = 1
-            for n in x:
-                x[n] *= s
             return x
     raise nx.PowerIterationFailedConvergence(max_iter)
 
 
+def _katz_centrality_scipy(G, alpha, b, x, max_iter, tol, weight, callback):
+    # The same iterations as _katz_centrality_python, with the transposed
+    # adjacency matrix in CSR format.
+    import numpy as np
+    nodelist = list(G)
+    nnodes = len(nodelist)
+    A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                  dtype=float, format='csc')
+    AT = A.T
+    b = np.array([b[n] for n in nodelist], dtype=float)
+    x = np.array([x[n] for n in nodelist], dtype=float)
+    for i in range(max_iter):
+        xlast = x
+        x = alpha * AT.dot(xlast) + b
+        err = float(np.abs(x - xlast).sum())
+        if callback is not None:
+            callback(i, err)
+        if err < nnodes*tol:
+            return dict(zip(nodelist, map(float, x)))
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
 @not_implemented_for('multigraph')
 def katz_centrality_numpy(G, alpha=0.1, beta=1.0, normalized=True,
                           weight=None):
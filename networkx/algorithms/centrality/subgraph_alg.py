@@ -14,6 +14,7 @@ __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Franck Kalala (franckkalala@yahoo.fr'])
 __all__ = ['subgraph_centrality_exp',
            'subgraph_centrality',
+           'subgraph_centrality_lanczos',
            'communicability_betweenness_centrality',
            'estrada_index'
            ]
@@ -112,6 +113,8 @@ def subgraph_centrality(G):
     --------
     subgraph_centrality_exp:
         Alternative algorithm of the subgraph centrality for each node of G.
+    subgraph_centrality_lanczos:
+        Sparse algorithm of the subgraph centrality for nodes of G.
 
     Notes
     -----
@@ -158,6 +161,102 @@ def subgraph_centrality(G):
     sc = dict(zip(nodelist,map(float,xg)))
     return sc
 
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def subgraph_centrality_lanczos(G, nbunch=None, tol=1e-8, max_iter=100):
+    r"""Return the subgraph centrality of nodes in G using Lanczos
+    quadrature on the sparse adjacency matrix.
+
+    Subgraph centrality  of a node `n` is the sum of weighted closed
+    walks of all lengths starting and ending at node `n`. The weights
+    decrease with path length. Each closed walk is associated with a
+    connected subgraph ([1]_).
+
+    Parameters
+    ----------
+    G: graph
+
+    nbunch : iterable container, optional (default=None)
+        Nodes whose subgraph centrality is computed. If None, all the
+        nodes of G.
+
+    tol : float, optional (default=1e-8)
+        Relative error tolerance of each value.
+
+    max_iter : integer, optional (default=100)
+        Maximum number of Lanczos steps per node.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with subgraph centrality as the value.
+
+    Raises
+    ------
+    NetworkXError
+       If the graph is not undirected and simple.
+
+    ExceededMaxIterations
+       If a value does not reach the tolerance within `max_iter` steps.
+
+    See Also
+    --------
+    subgraph_centrality:
+        Alternative algorithm of the subgraph centrality for each node of G.
+    communicability_lanczos
+
+    Notes
+    -----
+    The subgraph centrality :math:`SC(u) = e_u^T e^A e_u` is a quadratic
+    form of the matrix exponential, which the Lanczos process started at
+    `e_u` approximates by a Gauss quadrature rule from below and a
+    Gauss-Radau rule from above [2]_. The steps stop once the two bounds
+    are within `tol` of each other, and their mean is returned.
+
+    Each step multiplies the sparse adjacency matrix by a block of
+    vectors, one per node, so that the time is proportional to the
+    number of edges times the number of steps for each node in `nbunch`
+    and the memory is linear in the size of G. For all the nodes of a
+    large graph this is still quadratic; use `nbunch` to compute the
+    centrality of some nodes only.
+
+    References
+    ----------
+    .. [1] Ernesto Estrada, Juan A. Rodriguez-Velazquez,
+       "Subgraph centrality in complex networks",
+       Physical Review E 71, 056103 (2005).
+       http://arxiv.org/abs/cond-mat/0504730
+    .. [2] Michele Benzi and Paola Boito,
+       "Quadrature rule-based bounds for functions of adjacency matrices",
+       Linear Algebra and its Applications 433, 637-652 (2010).
+       http://dx.doi.org/10.1016/j.laa.2010.03.035
+
+    Examples
+    --------
+    (Example from [1]_)
+    >>> G = nx.Graph([(1,2),(1,5),(1,8),(2,3),(2,8),(3,4),(3,6),(4,5),(4,7),(5,6),(6,7),(7,8)])
+    >>> sc = nx.subgraph_centrality_lanczos(G, nbunch=[1, 3])
+    >>> print(['%s %0.2f'%(node,sc[node]) for node in sorted(sc)])
+    ['1 3.90', '3 3.64']
+    """
+    import numpy
+    nodelist = list(G)  # ordering of nodes in matrix
+    index = dict(zip(nodelist, range(len(nodelist))))
+    if nbunch is None:
+        nbunch = nodelist
+    else:
+        nbunch = [u for u in nbunch if u in index]
+    A = _adjacency(G, nodelist)
+    upper = _spectral_upper_bound(A)
+    rows = numpy.array([index[u] for u in nbunch], dtype=numpy.intp)
+    sc = {}
+    size = max(_BATCH // max(len(nodelist), 1), 1)
+    for start in range(0, len(rows), size):
+        block = rows[start:start + size]
+        values = _exp_quadrature(A, block, upper, tol, max_iter)
+        sc.update(zip(nbunch[start:start + size], map(float, values)))
+    return sc
+
 @not_implemented_for('directed')
 @not_implemented_for('multigraph')
 def communicability_betweenness_centrality(G, normalized=True):
@@ -311,6 +410,155 @@ def estrada_index(G):
     """
     return sum(subgraph_centrality(G).values())
 
+# Largest number of vector entries in one block of Lanczos processes,
+# which bounds the memory independently of the number of nodes.
+_BATCH = 1 << 22
+
+
+def _adjacency(G, nodelist):
+    # sparse 0-1 adjacency matrix
+    A = nx.to_scipy_sparse_matrix(G, nodelist, weight=None, dtype=float,
+                                  format='csr')
+    A.data[:] = 1
+    return A
+
+
+def _spectral_upper_bound(A):
+    # an upper bound on the largest eigenvalue of the symmetric matrix A,
+    # strictly above it so that the Gauss-Radau rule is well defined
+    import numpy
+    from scipy.sparse import linalg
+    n = A.shape[0]
+    bound = float(abs(A).sum(axis=1).max()) if n else 0.0
+    if n >= 3:
+        try:
+            w, v = linalg.eigsh(A, k=1, which='LA', tol=1e-6)
+            # some eigenvalue is within the residual norm of the Ritz value
+            residual = numpy.linalg.norm(A.dot(v[:, 0]) - w[0] * v[:, 0])
+            bound = min(bound, float(w[0] + residual))
+        except linalg.ArpackNoConvergence:
+            pass
+    return bound + 1e-8 * (1 + abs(bound))
+
+
+def _exp_tridiagonal(alpha, beta):
+    # exp(T) e_1 for the stack of symmetric tridiagonal matrices T with
+    # diagonals alpha and off-diagonals beta, of shapes (b, k), (b, k-1)
+    import numpy
+    b, k = alpha.shape
+    T = numpy.zeros((b, k, k))
+    diagonal = numpy.arange(k)
+    T[:, diagonal, diagonal] = alpha
+    T[:, diagonal[1:], diagonal[:-1]] = beta
+    T[:, diagonal[:-1], diagonal[1:]] = beta
+    w, V = numpy.linalg.eigh(T)
+    return numpy.einsum('bij,bj->bi', V, V[:, 0, :] * numpy.exp(w))
+
+
+def _lanczos_steps(A, Q, max_iter):
+    # Lanczos processes from the unit columns of Q in lockstep, yielding
+    # the Lanczos vectors and the entries of T as (Q, alpha, beta); the
+    # caller can send the indices of the processes to continue
+    import numpy
+    Qprev = numpy.zeros_like(Q)
+    beta = numpy.zeros(Q.shape[1])
+    for j in range(max_iter):
+        W = A.dot(Q)
+        W -= beta * Qprev
+        alpha = numpy.einsum('ij,ij->j', Q, W)
+        W -= alpha * Q
+        beta = numpy.sqrt(numpy.einsum('ij,ij->j', W, W))
+        keep = yield Q, alpha, beta
+        if keep is not None:
+            W, Q, beta = W[:, keep], Q[:, keep], beta[keep]
+        Qprev = Q
+        Q = W / numpy.where(beta > 0, beta, 1)
+
+
+def _exp_quadrature(A, rows, upper, tol, max_iter):
+    # e_u^T exp(A) e_u for the indices u in rows, between the Gauss and
+    # Gauss-Radau bounds, with the prescribed eigenvalue upper >= lambda_max
+    import numpy
+    n = A.shape[0]
+    b = len(rows)
+    Q = numpy.zeros((n, b))
+    Q[rows, numpy.arange(b)] = 1
+    result = numpy.zeros(b)
+    active = numpy.arange(b)
+    alphas = numpy.zeros((b, 0))
+    betas = numpy.zeros((b, 0))
+    scale = max(upper, 1.0)
+    steps = _lanczos_steps(A, Q, max_iter)
+    keep = None
+    for j in range(max_iter):
+        try:
+            Q, alpha, beta = steps.send(keep)
+        except StopIteration:
+            break
+        alphas = numpy.column_stack((alphas, alpha))
+        gauss = _exp_tridiagonal(alphas, betas)[:, 0]
+        # Extend T with the diagonal entry that makes `upper` one of its
+        # eigenvalues: phi = upper + d[-1] where (T - upper I) d = beta^2 e_j
+        k = j + 1
+        T = numpy.zeros((len(active), k, k))
+        diagonal = numpy.arange(k)
+        T[:, diagonal, diagonal] = alphas - upper
+        T[:, diagonal[1:], diagonal[:-1]] = betas
+        T[:, diagonal[:-1], diagonal[1:]] = betas
+        rhs = numpy.zeros((len(active), k))
+        rhs[:, -1] = beta ** 2
+        d = numpy.linalg.solve(T, rhs[:, :, numpy.newaxis])[:, -1, 0]
+        radau = _exp_tridiagonal(numpy.column_stack((alphas, upper + d)),
+                                 numpy.column_stack((betas, beta)))[:, 0]
+        exact = beta <= 1e-12 * scale
+        done = exact | (radau - gauss <= tol * gauss)
+        result[active[done]] = numpy.where(exact[done], gauss[done],
+                                           (gauss[done] + radau[done]) / 2)
+        keep = numpy.flatnonzero(~done)
+        if not len(keep):
+            return result
+        active = active[keep]
+        alphas = alphas[keep]
+        betas = numpy.column_stack((betas[keep], beta[keep]))
+    raise nx.ExceededMaxIterations('Lanczos quadrature failed to converge '
+                                   'within %d steps.' % max_iter)
+
+
+def _expm_multiply(A, B, tol, max_iter):
+    # exp(A) B for the symmetric matrix A, by Lanczos approximations
+    # exp(A) b = |b| V exp(T) e_1 of each column b, computed in two passes
+    # so that the Lanczos vectors need not be stored
+    import numpy
+    norms = numpy.sqrt(numpy.einsum('ij,ij->j', B, B))
+    b = B.shape[1]
+    alphas = numpy.zeros((b, 0))
+    betas = numpy.zeros((b, 0))
+    y = numpy.zeros((b, 0))
+    done = norms == 0
+    scale = float(abs(A).sum(axis=1).max()) if A.shape[0] else 0.0
+    start = B / numpy.where(done, 1, norms)
+    steps = _lanczos_steps(A, start, max_iter)
+    for j, (Q, alpha, beta) in enumerate(steps):
+        alphas = numpy.column_stack((alphas, alpha))
+        previous = numpy.column_stack((y, numpy.zeros(b)))
+        y = _exp_tridiagonal(alphas, betas)
+        change = numpy.sqrt(((y - previous) ** 2).sum(axis=1))
+        norm = numpy.sqrt((y ** 2).sum(axis=1))
+        done |= (beta <= 1e-12 * max(scale, 1.0)) | (change <= tol * norm)
+        if done.all():
+            break
+        betas = numpy.column_stack((betas, beta))
+    else:
+        raise nx.ExceededMaxIterations('Lanczos approximation failed to '
+                                       'converge within %d steps.'
+                                       % max_iter)
+    y *= norms[:, numpy.newaxis]
+    X = numpy.zeros(B.shape)
+    for j, (Q, alpha, beta) in enumerate(_lanczos_steps(A, start,
+                                                        y.shape[1])):
+        X += y[:, j] * Q
+    return X
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
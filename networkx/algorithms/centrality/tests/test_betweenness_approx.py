@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+from nose.tools import *
+import networkx as nx
+from networkx.algorithms.centrality.betweenness_approx import \
+    _vertex_diameter_bound
+from networkx.algorithms.shortest_paths.weighted import _weight_snapshot
+
+
+class TestApproximateBetweennessCentrality:
+
+    def check(self, G, epsilon, **kwds):
+        exact = nx.betweenness_centrality(G, weight=kwds.get('weight'),
+                                          normalized=kwds.get('normalized',
+                                                              True))
+        b, samples = nx.approximate_betweenness_centrality(G, epsilon,
+                                                           seed=1, **kwds)
+        assert_equal(set(b), set(G))
+        assert_true(samples > 0)
+        scale = 1
+        if not kwds.get('normalized', True):
+            n = len(G)
+            scale = (n - 1) * (n - 2)
+            if not G.is_directed():
+                scale *= 0.5
+        for v in G:
+            assert_true(abs(b[v] - exact[v]) <= epsilon * scale)
+        return samples
+
+    def test_graphs(self):
+        G = nx.gnp_random_graph(60, 0.08, seed=1)
+        for method in ('kadabra', 'rk'):
+            self.check(G, 0.05, method=method)
+            self.check(nx.DiGraph(G), 0.05, method=method)
+        self.check(nx.karate_club_graph(), 0.05, normalized=False)
+        self.check(nx.path_graph(8), 0.05)
+
+    def test_weighted(self):
+        G = nx.gnp_random_graph(40, 0.15, seed=2)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 4 + 1
+        self.check(G, 0.05, weight='weight')
+        self.check(nx.MultiGraph(G), 0.05, weight='weight')
+
+    def test_adaptive(self):
+        # The stopping condition is met before the bound on a graph with
+        # small betweenness values.
+        G = nx.gnm_random_graph(300, 1500, seed=3)
+        adaptive = self.check(G, 0.05, method='kadabra')
+        fixed = self.check(G, 0.05)
+        assert_true(adaptive < fixed)
+
+    def test_seed(self):
+        G = nx.gnp_random_graph(50, 0.1, seed=4)
+        first = nx.approximate_betweenness_centrality(G, 0.1, seed=5)
+        second = nx.approximate_betweenness_centrality(G, 0.1, seed=5)
+        assert_equal(first, second)
+
+    def test_no_inner_nodes(self):
+        for G in (nx.empty_graph(5), nx.Graph([(0, 1), (2, 3)]),
+                  nx.path_graph(2)):
+            b, samples = nx.approximate_betweenness_centrality(G)
+            assert_equal(b, dict.fromkeys(G, 0.0))
+            assert_equal(samples, 0)
+
+    def test_vertex_diameter_bound(self):
+        G = nx.path_graph(7)
+        assert_equal(_vertex_diameter_bound(G), 7)
+        G.add_edge(10, 11)
+        assert_equal(_vertex_diameter_bound(G), 7)
+        D = nx.DiGraph([(0, 1), (1, 2), (3, 2)])
+        assert_equal(_vertex_diameter_bound(D), 4)
+        W = nx.Graph()
+        W.add_weighted_edges_from([(0, 1, 2), (1, 2, 2), (2, 3, 1)])
+        snapshot = _weight_snapshot(W, 'weight')
+        assert_equal(_vertex_diameter_bound(W, snapshot), 4)
+
+    def test_bad_arguments(self):
+        G = nx.path_graph(4)
+        f = nx.approximate_betweenness_centrality
+        assert_raises(ValueError, f, G, 0)
+        assert_raises(ValueError, f, G, 1.5)
+        assert_raises(ValueError, f, G, 0.1, 1)
+        assert_raises(ValueError, f, G, method='exact')
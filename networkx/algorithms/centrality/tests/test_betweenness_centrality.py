@@ -329,6 +329,30 @@ class TestWeightedBetweennessCentrality(object):
         for n in sorted(G):
             assert_almost_equal(b[n],b_answer[n])
 
+    def test_multigraph(self):
+        """Weighted betweenness centrality: parallel edges"""
+        # The lightest of parallel edges is used.
+        G = nx.MultiGraph(weighted_G())
+        G.add_edge(0, 3, weight=1)
+        G.add_edge(0, 3, weight=9)
+        H = weighted_G()
+        H[0][3]['weight'] = 1
+        b = nx.betweenness_centrality(G, weight='weight', normalized=False)
+        b_answer = nx.betweenness_centrality(H, weight='weight',
+                                             normalized=False)
+        for n in sorted(G):
+            assert_almost_equal(b[n], b_answer[n])
+
+    def test_weight_function(self):
+        """Weighted betweenness centrality: weight function"""
+        G = weighted_G()
+        b = nx.betweenness_centrality(G, weight=lambda u, v, d: d['weight'],
+                                      normalized=False)
+        b_answer = nx.betweenness_centrality(G, weight='weight',
+                                             normalized=False)
+        for n in sorted(G):
+            assert_almost_equal(b[n], b_answer[n])
+
 
 class TestEdgeBetweennessCentrality(object):
         
@@ -460,3 +484,58 @@ class TestWeightedEdgeBetweennessCentrality(object):
         for n in sorted(G.edges()):
             assert_almost_equal(b[n],b_answer[n]/norm)
 
+
+
+class MapExecutor(object):
+    """Executor running the tasks sequentially."""
+    def __init__(self):
+        self.tasks = 0
+
+    def map(self, func, iterable):
+        tasks = list(iterable)
+        self.tasks += len(tasks)
+        return map(func, tasks)
+
+
+class TestParallelBetweennessCentrality(object):
+
+    def check(self, f, G, **kwds):
+        b_answer = f(G, **kwds)
+        executor = MapExecutor()
+        b = f(G, executor=executor, **kwds)
+        assert_true(executor.tasks > 1)
+        assert_equal(sorted(b), sorted(b_answer))
+        for n in b:
+            assert_almost_equal(b[n], b_answer[n])
+
+    def test_executor(self):
+        G = nx.gnp_random_graph(30, 0.2, seed=1)
+        D = nx.gnp_random_graph(30, 0.2, seed=1, directed=True)
+        for f in (nx.betweenness_centrality,
+                  nx.edge_betweenness_centrality):
+            for H in (G, D, weighted_G(), nx.MultiGraph(weighted_G())):
+                self.check(f, H)
+                self.check(f, H, weight='weight', normalized=False)
+                self.check(f, H, k=4, seed=2)
+        self.check(nx.betweenness_centrality, G, endpoints=True)
+
+    def test_processes(self):
+        G = nx.gnp_random_graph(40, 0.1, seed=3)
+        b_answer = nx.betweenness_centrality(G, k=10, seed=1)
+        b = nx.betweenness_centrality(G, k=10, seed=1, n_jobs=2)
+        for n in G:
+            assert_almost_equal(b[n], b_answer[n])
+        # The result does not depend on the run.
+        assert_equal(b, nx.betweenness_centrality(G, k=10, seed=1,
+                                                  n_jobs=2))
+        b_answer = nx.edge_betweenness_centrality(G, weight='weight')
+        b = nx.edge_betweenness_centrality(G, weight='weight', n_jobs=2)
+        for e in b_answer:
+            assert_almost_equal(b[e], b_answer[e])
+
+    def test_invalid_n_jobs(self):
+        G = nx.path_graph(4)
+        for f in (nx.betweenness_centrality,
+                  nx.edge_betweenness_centrality):
+            for n_jobs in (0, -2):
+                assert_raises(ValueError, f, G, n_jobs=n_jobs)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+import random
+
+from nose.tools import *
+import networkx as nx
+
+
+class TestDynamicBetweenness:
+
+    def check(self, dynamic, **kwds):
+        G = dynamic.G
+        for normalized in (True, False):
+            b = dynamic.betweenness(normalized=normalized)
+            expected = nx.betweenness_centrality(G, normalized=normalized,
+                                                 weight=dynamic.weight,
+                                                 **kwds)
+            assert_equal(set(b), set(expected))
+            for v in G:
+                assert_almost_equal(b[v], expected[v])
+
+    def changes(self, dynamic, count=40, weights=False, seed=1):
+        rng = random.Random(seed)
+        G = dynamic.G
+        nodes = list(G)
+        for _ in range(count):
+            u, v = rng.sample(nodes, 2)
+            if rng.random() < 0.1:
+                v = u
+            if G.has_edge(u, v) and rng.random() < 0.7:
+                dynamic.remove_edge(u, v)
+            elif weights:
+                dynamic.add_edge(u, v, weight=rng.randint(1, 3))
+            else:
+                dynamic.add_edge(u, v)
+            yield
+
+    def test_graphs(self):
+        for directed in (False, True):
+            G = nx.gnp_random_graph(30, 0.08, seed=2, directed=directed)
+            dynamic = nx.DynamicBetweenness(G)
+            self.check(dynamic)
+            for _ in self.changes(dynamic):
+                self.check(dynamic)
+
+    def test_weighted(self):
+        for directed in (False, True):
+            G = nx.gnp_random_graph(25, 0.1, seed=3, directed=directed)
+            for u, v, d in G.edges(data=True):
+                d['weight'] = (u * v) % 3 + 1
+            dynamic = nx.DynamicBetweenness(G, weight='weight')
+            self.check(dynamic)
+            for _ in self.changes(dynamic, weights=True):
+                self.check(dynamic)
+
+    def test_sampled_sources(self):
+        G = nx.gnp_random_graph(30, 0.1, seed=4)
+        dynamic = nx.DynamicBetweenness(G, k=10, seed=5)
+        self.check(dynamic, k=10, seed=5)
+        for _ in self.changes(dynamic):
+            self.check(dynamic, k=10, seed=5)
+
+    def test_affected_sources(self):
+        # Only the sources whose shortest paths use the edge are searched
+        # again.
+        G = nx.path_graph(6)
+        dynamic = nx.DynamicBetweenness(G)
+        assert_equal(dynamic.add_edge(0, 2), 5)
+        assert_equal(dynamic.add_edge(0, 2), 0)
+        assert_equal(dynamic.remove_edge(4, 5), 6)
+        assert_equal(dynamic.add_edge(6, 7), 2)
+        self.check(dynamic)
+        D = nx.DiGraph([(0, 1), (1, 2), (3, 2)])
+        dynamic = nx.DynamicBetweenness(D)
+        assert_equal(dynamic.add_edge(3, 1), 1)
+        self.check(dynamic)
+
+    def test_weight_change(self):
+        G = nx.cycle_graph(5)
+        nx.set_edge_attributes(G, 'weight', 1)
+        dynamic = nx.DynamicBetweenness(G, weight='weight')
+        dynamic.add_edge(0, 1, weight=5)
+        self.check(dynamic)
+        assert_equal(dynamic.add_edge(0, 1, weight=5), 0)
+        dynamic.add_edge(0, 1, weight=1)
+        self.check(dynamic)
+
+    def test_nodes(self):
+        G = nx.gnp_random_graph(20, 0.15, seed=6, directed=True)
+        dynamic = nx.DynamicBetweenness(G)
+        dynamic.add_node('new')
+        dynamic.add_edge('new', 0)
+        self.check(dynamic)
+        for n in (3, 'new', 0):
+            dynamic.remove_node(n)
+            self.check(dynamic)
+        assert_raises(nx.NetworkXError, dynamic.remove_node, 0)
+
+    def test_self_loops(self):
+        for directed in (False, True):
+            G = nx.path_graph(4, create_using=nx.DiGraph() if directed
+                              else nx.Graph())
+            dynamic = nx.DynamicBetweenness(G, weight='weight')
+            dynamic.add_edge(1, 1, weight=2)
+            self.check(dynamic)
+            dynamic.remove_edge(1, 1)
+            assert_false(G.has_edge(1, 1))
+            self.check(dynamic)
+            dynamic.add_edge(2, 2)
+            dynamic.remove_node(2)
+            self.check(dynamic)
+
+    def test_rebuild(self):
+        G = nx.gnp_random_graph(20, 0.15, seed=7)
+        dynamic = nx.DynamicBetweenness(G)
+        G.add_edge(0, 1)
+        G.remove_edge(*next(iter(G.edges())))
+        dynamic.rebuild()
+        self.check(dynamic)
+
+    def test_errors(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.DynamicBetweenness,
+                      nx.MultiGraph())
+        dynamic = nx.DynamicBetweenness(nx.path_graph(3))
+        assert_raises(nx.NetworkXError, dynamic.remove_edge, 0, 2)
@@ -91,3 +91,54 @@ class TestClosenessCentrality:
         for n in sorted(XG):
             assert_almost_equal(c[n],d[n],places=3)
 
+
+
+class TestTopKCloseness:
+
+    def check(self, G, k, **kwds):
+        closeness = nx.closeness_centrality(G, **kwds)
+        top = nx.top_k_closeness(G, k, **kwds)
+        assert_equal(len(top), min(k, len(G)))
+        expected = sorted(closeness.values(), reverse=True)[:k]
+        for (v, c), e in zip(top, expected):
+            assert_almost_equal(c, e)
+            assert_almost_equal(c, closeness[v])
+
+    def test_graphs(self):
+        for seed in range(3):
+            G = nx.gnp_random_graph(60, 0.06, seed=seed)
+            for k in (1, 5, 60, 100):
+                self.check(G, k)
+                self.check(G, k, normalized=False)
+        self.check(nx.florentine_families_graph(), 3)
+        self.check(nx.path_graph(9), 4)
+        self.check(nx.Graph([(0, 1), (2, 3), (3, 4)]), 2)
+
+    def test_directed(self):
+        for seed in range(3):
+            G = nx.gnp_random_graph(60, 0.04, seed=seed, directed=True)
+            for k in (1, 5, 60):
+                self.check(G, k)
+                self.check(G, k, reverse=True)
+                self.check(G, k, normalized=False)
+
+    def test_weighted(self):
+        for directed in (False, True):
+            G = nx.gnp_random_graph(50, 0.08, seed=3, directed=directed)
+            for u, v, d in G.edges(data=True):
+                d['weight'] = (u * v) % 5 + 0.5
+            for k in (1, 5, 50):
+                self.check(G, k, distance='weight')
+                self.check(G, k, distance='weight', reverse=True)
+        # Zero distances tell nothing about the remaining ones.
+        G = nx.gnp_random_graph(40, 0.1, seed=4)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3
+        self.check(G, 5, distance='weight')
+
+    def test_ties(self):
+        G = nx.cycle_graph(6)
+        assert_equal([v for v, c in nx.top_k_closeness(G, 3)], [0, 1, 2])
+
+    def test_bad_k(self):
+        assert_raises(ValueError, nx.top_k_closeness, nx.path_graph(3), 0)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
+import random
+
 import networkx as nx
-from nose.tools import assert_almost_equal
+from nose.tools import assert_almost_equal, assert_equal, assert_raises
 from nose import SkipTest
 from nose.plugins.attrib import attr
 from networkx import edge_current_flow_betweenness_centrality \
@@ -201,3 +203,93 @@ class TestEdgeFlowBetweennessCentrality(object):
         for (s, t), v1 in b_answer.items():
             v2 = b.get((s, t), b.get((t, s)))
             assert_almost_equal(v1,  v2)
+
+
+class TestLaplacianFactorization(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+            import scipy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G = nx.connected_watts_strogatz_graph(40, 4, 0.3, seed=1)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3 + 1
+        self.G = nx.relabel_nodes(G, lambda v: 'n%d' % v)
+
+    def check(self, F, weight, places=7):
+        G = self.G
+        S = ['n1', 'n7']
+        T = ['n20', 'n33', 'n38']
+        for f, args in ((nx.current_flow_betweenness_centrality, ()),
+                        (edge_current_flow, ()),
+                        (nx.current_flow_closeness_centrality, ()),
+                        (nx.current_flow_betweenness_centrality_subset,
+                         (S, T)),
+                        (nx.edge_current_flow_betweenness_centrality_subset,
+                         (S, T))):
+            b = f(G, *args, weight=weight, solver=F)
+            b_answer = f(G, *args, weight=weight, solver='full')
+            assert_equal(set(b), set(b_answer))
+            for k, v in b_answer.items():
+                assert_almost_equal(b[k], v, places=places)
+
+    def test_reuse(self):
+        for weight in (None, 'weight'):
+            for solver in ('full', 'lu'):
+                F = nx.LaplacianFactorization(self.G, weight=weight,
+                                              solver=solver)
+                self.check(F, weight)
+
+    def test_cg(self):
+        for preconditioner in ('ilu', 'jacobi'):
+            F = nx.LaplacianFactorization(self.G, weight='weight',
+                                          solver='cg',
+                                          preconditioner=preconditioner)
+            self.check(F, 'weight', places=3)
+
+    def test_amg(self):
+        try:
+            import pyamg
+        except ImportError:
+            raise SkipTest('PyAMG not available.')
+        F = nx.LaplacianFactorization(self.G, solver='cg',
+                                      preconditioner='amg')
+        self.check(F, None, places=3)
+
+    def test_approximate(self):
+        F = nx.LaplacianFactorization(self.G, solver='lu')
+        random.seed(1)
+        b = approximate_cfbc(self.G, solver=F, epsilon=0.5)
+        random.seed(1)
+        b_answer = approximate_cfbc(self.G, solver='full', epsilon=0.5)
+        for v in self.G:
+            assert_almost_equal(b[v], b_answer[v])
+
+    def test_mismatch(self):
+        F = nx.LaplacianFactorization(self.G, weight='weight')
+        f = nx.current_flow_betweenness_centrality
+        assert_raises(nx.NetworkXError, f, self.G, solver=F)
+        u, v = next(iter(self.G.edges()))
+        self.G[u][v]['weight'] = 10
+        assert_raises(nx.NetworkXError, f, self.G, weight='weight', solver=F)
+        F = nx.LaplacianFactorization(self.G, weight='weight')
+        f(self.G, weight='weight', solver=F)
+        self.G.add_edge(u, 'new')
+        assert_raises(nx.NetworkXError, f, self.G, weight='weight', solver=F)
+
+    def test_errors(self):
+        assert_raises(nx.NetworkXError, nx.LaplacianFactorization,
+                      nx.Graph([(0, 1), (2, 3)]))
+        assert_raises(nx.NetworkXError, nx.LaplacianFactorization,
+                      self.G, solver='qr')
+        assert_raises(nx.NetworkXError, nx.LaplacianFactorization,
+                      self.G, solver='cg', preconditioner='ssor')
+        assert_raises(nx.NetworkXNotImplemented, nx.LaplacianFactorization,
+                      nx.DiGraph(self.G))
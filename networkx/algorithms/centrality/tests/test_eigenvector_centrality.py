@@ -61,6 +61,44 @@ class TestEigenvectorCentrality(object):
         G=nx.path_graph(3)
         b=nx.eigenvector_centrality(G,max_iter=0)
 
+    def test_python_and_scipy(self):
+        from networkx.algorithms.centrality.eigenvector import \
+            _eigenvector_centrality_python, _eigenvector_centrality_scipy
+        G = nx.gnp_random_graph(50, 0.1, seed=1, directed=True)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3 + 1
+        G.add_edge(0, 0)
+        for weight in (None, 'weight'):
+            x = dict.fromkeys(G, 1.0 / len(G))
+            errors = [], []
+            a = _eigenvector_centrality_python(G, x, 100, 1e-6, weight,
+                                               lambda i, e: errors[0].append(e))
+            b = _eigenvector_centrality_scipy(G, x, 100, 1e-6, weight,
+                                              lambda i, e: errors[1].append(e))
+            for n in G:
+                assert_almost_equal(a[n], b[n])
+            assert_equal(len(errors[0]), len(errors[1]))
+            for e0, e1 in zip(*errors):
+                assert_almost_equal(e0, e1)
+
+    def test_warm_start(self):
+        G = nx.karate_club_graph()
+        b = nx.eigenvector_centrality(G, tol=1e-8)
+        errors = []
+        c = nx.eigenvector_centrality(G, tol=1e-8, nstart=b,
+                                      callback=lambda i, e: errors.append(e))
+        assert_equal(len(errors), 1)
+        for n in G:
+            assert_almost_equal(b[n], c[n])
+        # Nodes missing from nstart start at zero, extra keys are ignored.
+        G.add_edge(0, 'new')
+        b['gone'] = 1
+        c = nx.eigenvector_centrality(G, nstart=b)
+        d = nx.eigenvector_centrality_numpy(G)
+        assert_equal(set(c), set(G))
+        for n in G:
+            assert_almost_equal(c[n], d[n], places=4)
+
 class TestEigenvectorCentralityDirected(object):
     numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
     @classmethod
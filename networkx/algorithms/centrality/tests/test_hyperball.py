@@ -0,0 +1,78 @@
+from nose import SkipTest
+from nose.tools import *
+import networkx as nx
+
+
+class TestHyperBall(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def graphs(self):
+        yield nx.gnp_random_graph(200, 0.02, seed=1)
+        yield nx.gnp_random_graph(200, 0.012, seed=2, directed=True)
+        yield nx.grid_2d_graph(10, 10)
+
+    def assert_close(self, estimate, exact, tolerance):
+        for v in exact:
+            assert_true(abs(estimate[v] - exact[v]) <=
+                        tolerance * max(exact[v], 1))
+
+    def test_harmonic_centrality(self):
+        for G in self.graphs():
+            c = nx.approximate_harmonic_centrality(G, precision=10, seed=1)
+            self.assert_close(c, nx.harmonic_centrality(G), 0.05)
+
+    def test_closeness_centrality(self):
+        for G in self.graphs():
+            for reverse in (False, True):
+                c = nx.approximate_closeness_centrality(G, precision=10,
+                                                        reverse=reverse,
+                                                        seed=1)
+                exact = nx.closeness_centrality(G, reverse=reverse)
+                self.assert_close(c, exact, 0.05)
+            c = nx.approximate_closeness_centrality(G, precision=10,
+                                                    normalized=False, seed=1)
+            self.assert_close(c, nx.closeness_centrality(G, normalized=False),
+                              0.05)
+
+    def test_neighborhood_function(self):
+        for G in self.graphs():
+            lengths = dict(nx.all_pairs_shortest_path_length(G))
+            distances = [d for u in lengths for d in lengths[u].values()]
+            counts = nx.neighborhood_function(G, precision=10, seed=1)
+            assert_equal(len(counts), max(distances) + 1)
+            for t, count in enumerate(counts):
+                exact = sum(1 for d in distances if d <= t)
+                assert_true(abs(count - exact) <= 0.05 * exact)
+
+    def test_effective_diameter(self):
+        G = nx.path_graph(10)
+        # 88 of the 100 pairs are at distance at most 6, and 94 at most 7.
+        assert_almost_equal(nx.effective_diameter(G, precision=12, seed=1),
+                            6 + 2 / 6.0, places=1)
+        assert_equal(nx.effective_diameter(nx.empty_graph(3)), 0.0)
+        assert_equal(nx.effective_diameter(nx.Graph()), 0.0)
+        assert_raises(ValueError, nx.effective_diameter, G, 0)
+
+    def test_seed(self):
+        G = nx.gnp_random_graph(50, 0.1, seed=3)
+        assert_equal(nx.neighborhood_function(G, seed=4),
+                     nx.neighborhood_function(G, seed=4))
+
+    def test_small_graphs(self):
+        assert_equal(nx.approximate_harmonic_centrality(nx.Graph()), {})
+        assert_equal(nx.approximate_closeness_centrality(nx.empty_graph(2)),
+                     {0: 0.0, 1: 0.0})
+        assert_equal(nx.neighborhood_function(nx.Graph()), [])
+
+    def test_precision(self):
+        G = nx.path_graph(3)
+        assert_raises(ValueError, nx.neighborhood_function, G, 3)
+        assert_raises(ValueError, nx.approximate_harmonic_centrality, G, 17)
@@ -43,6 +43,49 @@ class TestKatzCentrality(object):
             assert str(max_iter) in e.args[0], "max_iter value not in error msg"
             raise  # So that the decorater sees the exception.
 
+    def test_python_and_scipy(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        from networkx.algorithms.centrality.katz import \
+            _katz_centrality_python, _katz_centrality_scipy
+        G = nx.gnp_random_graph(50, 0.1, seed=1, directed=True)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3 + 1
+        G.add_edge(0, 0)
+        b = dict((n, n % 2 + 1.0) for n in G)
+        for weight in (None, 'weight'):
+            x = dict.fromkeys(G, 0)
+            errors = [], []
+            a = _katz_centrality_python(G, 0.05, b, x, 1000, 1e-6, weight,
+                                        lambda i, e: errors[0].append(e))
+            c = _katz_centrality_scipy(G, 0.05, b, x, 1000, 1e-6, weight,
+                                       lambda i, e: errors[1].append(e))
+            for n in G:
+                assert_almost_equal(a[n], c[n])
+            assert_equal(len(errors[0]), len(errors[1]))
+            for e0, e1 in zip(*errors):
+                assert_almost_equal(e0, e1)
+
+    def test_warm_start(self):
+        G = nx.karate_club_graph()
+        b = nx.katz_centrality(G, 0.1, tol=1e-8, normalized=False)
+        errors = []
+        c = nx.katz_centrality(G, 0.1, tol=1e-8, nstart=b, normalized=False,
+                               callback=lambda i, e: errors.append(e))
+        assert_equal(len(errors), 1)
+        for n in G:
+            assert_almost_equal(b[n], c[n])
+        # Nodes missing from nstart start at zero, extra keys are ignored.
+        G.add_edge(0, 'new')
+        b['gone'] = 1
+        c = nx.katz_centrality(G, 0.1, nstart=b)
+        d = nx.katz_centrality(G, 0.1)
+        assert_equal(set(c), set(G))
+        for n in G:
+            assert_almost_equal(c[n], d[n], places=5)
+
     def test_beta_as_scalar(self):
         alpha = 0.1
         beta = 0.1
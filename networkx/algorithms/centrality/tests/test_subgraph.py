@@ -48,6 +48,24 @@ class TestSubgraph:
         comm200 = nx.subgraph_centrality(g200)
         comm200_exp = nx.subgraph_centrality_exp(g200)
 
+    def test_subgraph_centrality_lanczos(self):
+        for G in (nx.path_graph(2), nx.karate_club_graph(),
+                  nx.barabasi_albert_graph(200, 3, seed=1),
+                  nx.Graph([('a', 'b'), ('c', 'd'), ('d', 'e')])):
+            answer = subgraph_centrality(G)
+            result = subgraph_centrality_lanczos(G)
+            assert_equal(set(answer), set(result))
+            for k, v in answer.items():
+                assert_true(abs(result[k] - v) <= 1e-8 * v)
+        G = nx.karate_club_graph()
+        answer = subgraph_centrality(G)
+        result = subgraph_centrality_lanczos(G, nbunch=[0, 33, 'x'], tol=1e-3)
+        assert_equal(set(result), set([0, 33]))
+        for k, v in result.items():
+            assert_true(abs(answer[k] - v) <= 1e-3 * answer[k])
+        assert_raises(nx.ExceededMaxIterations, subgraph_centrality_lanczos,
+                      G, max_iter=2)
+
     def test_communicability_betweenness_centrality(self):
         answer={0: 0.07017447951484615, 1: 0.71565598701107991,
                 2: 0.71565598701107991, 3: 0.07017447951484615}
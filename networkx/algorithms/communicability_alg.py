@@ -11,10 +11,14 @@ Communicability.
 #    BSD license.
 import networkx as nx
 from networkx.utils import *
+from networkx.algorithms.centrality.subgraph_alg import _BATCH
+from networkx.algorithms.centrality.subgraph_alg import _adjacency
+from networkx.algorithms.centrality.subgraph_alg import _expm_multiply
 __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Franck Kalala (franckkalala@yahoo.fr'])
 __all__ = ['communicability',
            'communicability_exp',
+           'communicability_lanczos',
            ]
 
 @not_implemented_for('directed')
@@ -126,6 +130,8 @@ def communicability_exp(G):
        Communicability between pairs of nodes in G.
     communicability_betweenness_centrality:
        Communicability betweeness centrality for each node in G.
+    communicability_lanczos:
+       Communicability between nodes in G using sparse matrices.
 
     Notes
     -----
@@ -167,6 +173,101 @@ def communicability_exp(G):
             c[u][v] = float(expA[mapping[u],mapping[v]])
     return c
 
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def communicability_lanczos(G, nbunch=None, tol=1e-8, max_iter=100):
+    r"""Return communicability between nodes in G and all the nodes using
+    Lanczos approximations on the sparse adjacency matrix.
+
+    Communicability between pair of node (u,v) of node in G is the sum of
+    closed walks of different lengths starting at node u and ending at node v.
+
+    Parameters
+    ----------
+    G: graph
+
+    nbunch : iterable container, optional (default=None)
+        Nodes whose communicability with all the nodes is computed. If
+        None, all the nodes of G.
+
+    tol : float, optional (default=1e-8)
+        Relative error tolerance, in the Euclidean norm, of the
+        communicabilities of each node in `nbunch`.
+
+    max_iter : integer, optional (default=100)
+        Maximum number of Lanczos steps.
+
+    Returns
+    -------
+    comm: dictionary of dictionaries
+        Dictionary keyed by the nodes in `nbunch` of dictionaries keyed by
+        all the nodes with communicability as the value.
+
+    Raises
+    ------
+    NetworkXError
+        If the graph is not undirected and simple.
+
+    ExceededMaxIterations
+        If the tolerance is not reached within `max_iter` steps.
+
+    See Also
+    --------
+    communicability_exp:
+       Communicability between all pairs of nodes in G.
+    subgraph_centrality_lanczos:
+       Communicability of each node with itself.
+
+    Notes
+    -----
+    The communicabilities of a node `u` are the column
+    :math:`e^A e_u` of the matrix exponential, which is approximated from
+    the Krylov space of `A` and `e_u` built by the Lanczos process [1]_.
+    The steps stop when the approximation changes by less than `tol`, and
+    the Lanczos vectors are computed a second time instead of being kept.
+
+    Each step multiplies the sparse adjacency matrix by a block of
+    vectors, one per node in `nbunch`, so that the time is proportional to
+    the number of edges times the number of steps for each node in
+    `nbunch` and no dense matrix of all the nodes is built unless all the
+    nodes are in `nbunch`.
+
+    References
+    ----------
+    .. [1] Marlis Hochbruck and Christian Lubich,
+       "On Krylov subspace approximations to the matrix exponential
+       operator", SIAM Journal on Numerical Analysis 34(5), 1911-1925
+       (1997).
+       http://dx.doi.org/10.1137/S0036142995280572
+
+    Examples
+    --------
+    >>> G = nx.Graph([(0,1),(1,2),(1,5),(5,4),(2,4),(2,3),(4,3),(3,6)])
+    >>> c = nx.communicability_lanczos(G, nbunch=[0])
+    >>> c_exp = nx.communicability_exp(G)
+    >>> all(abs(c[0][v] - c_exp[0][v]) < 1e-6 for v in G)
+    True
+    """
+    import numpy
+    nodelist = list(G)  # ordering of nodes in matrix
+    n = len(nodelist)
+    mapping = dict(zip(nodelist, range(n)))
+    if nbunch is None:
+        nbunch = nodelist
+    else:
+        nbunch = [u for u in nbunch if u in mapping]
+    A = _adjacency(G, nodelist)
+    c = {}
+    size = max(_BATCH // max(n, 1), 1)
+    for start in range(0, len(nbunch), size):
+        block = nbunch[start:start + size]
+        B = numpy.zeros((n, len(block)))
+        B[[mapping[u] for u in block], numpy.arange(len(block))] = 1
+        X = _expm_multiply(A, B, tol, max_iter)
+        for j, u in enumerate(block):
+            c[u] = dict(zip(nodelist, map(float, X[:, j])))
+    return c
+
 # fixture for nose tests
 def setup_module(module):
     from nose import SkipTest
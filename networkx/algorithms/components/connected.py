@@ -24,7 +24,7 @@ __all__ = [
 
 
 @not_implemented_for('directed')
-def connected_components(G):
+def connected_components(G, method=None):
     """Generate connected components.
 
     Parameters
@@ -32,6 +32,12 @@ def connected_components(G):
     G : NetworkX graph
        An undirected graph
 
+    method : None or 'numpy', optional (default=None)
+       If 'numpy', the graph is converted to arrays and all the
+       components are labelled in one vectorized union-find sweep over the
+       edges, which requires NumPy. The components are generated in the
+       same order.
+
     Returns
     -------
     comp : generator of sets
@@ -66,6 +72,14 @@ def connected_components(G):
     For undirected graphs only.
 
     """
+    if method == 'numpy':
+        from networkx.algorithms.traversal.array_bfs import \
+            _connected_components
+        for c in _connected_components(G):
+            yield c
+        return
+    if method is not None:
+        raise ValueError("method must be None or 'numpy'")
     seen = set()
     for v in G:
         if v not in seen:
@@ -126,7 +140,7 @@ def connected_component_subgraphs(G, copy=True):
             yield G.subgraph(c)
 
 
-def number_connected_components(G):
+def number_connected_components(G, method=None):
     """Return the number of connected components.
 
     Parameters
@@ -134,6 +148,9 @@ def number_connected_components(G):
     G : NetworkX graph
        An undirected graph.
 
+    method : None or 'numpy', optional (default=None)
+       Passed to :func:`connected_components`.
+
     Returns
     -------
     n : integer
@@ -150,7 +167,7 @@ def number_connected_components(G):
     For undirected graphs only.
 
     """
-    return len(list(connected_components(G)))
+    return len(list(connected_components(G, method)))
 
 
 @not_implemented_for('directed')
@@ -12,6 +12,9 @@
 #          Ben Edwards (bedwards@cs.unm.edu)
 """Strongly connected components."""
 import networkx as nx
+from networkx.algorithms.traversal.depth_first_search import (FORWARD,
+                                                              NONTREE,
+                                                              _dfs_events)
 from networkx.utils.decorators import not_implemented_for
 
 __all__ = ['number_strongly_connected_components',
@@ -182,7 +185,8 @@ def kosaraju_strongly_connected_components(G, source=None):
 def strongly_connected_components_recursive(G):
     """Generate nodes in strongly connected components of graph.
 
-    Recursive version of algorithm.
+    Version of the algorithm driven by the events of a depth-first search.
+    In spite of its name, it is no longer recursive.
 
     Parameters
     ----------
@@ -221,7 +225,9 @@ def strongly_connected_components_recursive(G):
 
     Notes
     -----
-    Uses Tarjan's algorithm[1]_ with Nuutila's modifications[2]_.
+    Uses Tarjan's algorithm[1]_ with Nuutila's modifications[2]_, on the
+    iterative depth-first search of :func:`~networkx.dfs_labeled_edges`,
+    so deep graphs do not hit the recursion limit.
 
     References
     ----------
@@ -233,36 +239,27 @@ def strongly_connected_components_recursive(G):
        Information Processing Letters 49(1): 9-14, (1994)..
 
     """
-    def visit(v, cnt):
-        root[v] = cnt
-        visited[v] = cnt
-        cnt += 1
-        stack.append(v)
-        for w in G[v]:
-            if w not in visited:
-                for c in visit(w, cnt):
-                    yield c
-            if w not in component:
-                root[v] = min(root[v], root[w])
-        if root[v] == visited[v]:
-            component[v] = root[v]
-            tmpc = {v}  # hold nodes in this component
-            while stack[-1] != v:
-                w = stack.pop()
-                component[w] = root[v]
-                tmpc.add(w)
-            stack.remove(v)
-            yield tmpc
-
-    visited = {}
-    component = {}
-    root = {}
-    cnt = 0
+    preorder = {}
+    lowlink = {}
+    component = set()  # nodes already assigned to a component
     stack = []
-    for source in G:
-        if source not in visited:
-            for c in visit(source, cnt):
-                yield c
+    for u, v, d in _dfs_events(G._succ, G):
+        if d == FORWARD:
+            lowlink[v] = preorder[v] = len(preorder)
+            stack.append(v)
+        elif d == NONTREE:
+            if v not in component:
+                lowlink[u] = min(lowlink[u], lowlink[v])
+        else:
+            # All the descendants of v are finished.
+            if lowlink[v] == preorder[v]:
+                scc = set()
+                while stack and preorder[stack[-1]] >= preorder[v]:
+                    scc.add(stack.pop())
+                component.update(scc)
+                yield scc
+            elif u is not v:
+                lowlink[u] = min(lowlink[u], lowlink[v])
 
 
 @not_implemented_for('undirected')
@@ -50,6 +50,13 @@ class TestStronglyConnected:
         for G, C in self.gc:
             assert_equal({frozenset(g) for g in scc(G)}, C)
 
+    def test_tarjan_recursive_deep(self):
+        # Deeper than the recursion limit.
+        G = nx.cycle_graph(5000, create_using=nx.DiGraph())
+        G.add_edge(0, 'a')
+        scc = nx.strongly_connected_components_recursive(G)
+        assert_equal(sorted(map(len, scc)), [1, 5000])
+
     def test_kosaraju(self):
         scc = nx.kosaraju_strongly_connected_components
         for G, C in self.gc:
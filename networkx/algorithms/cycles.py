@@ -18,6 +18,9 @@ from collections import defaultdict
 
 import networkx as nx
 from networkx.utils import *
+from networkx.algorithms.traversal.depth_first_search import (FORWARD,
+                                                              NONTREE,
+                                                              _dfs_events)
 from networkx.algorithms.traversal.edgedfs import helper_funcs, edge_dfs
 
 __all__ = [
@@ -184,36 +187,28 @@ def simple_cycles(G):
         # order of scc determines ordering of nodes
         startnode = scc.pop()
         # Processing node runs "circuit" routine from recursive version
-        path = [startnode]
+        path = []
         blocked = set()  # vertex: blocked from search?
         closed = set()   # nodes involved in a cycle
-        blocked.add(startnode)
         B = defaultdict(set)  # graph portions that yield no elementary circuit
-        stack = [(startnode, list(subG[startnode]))]  # subG gives comp nbrs
-        while stack:
-            thisnode, nbrs = stack[-1]
-            if nbrs:
-                nextnode = nbrs.pop()
+        # The search discovers the nodes that are not blocked, so it is
+        # told about the nodes that get unblocked through `blocked`.
+        events = _dfs_events(subG._succ, [startnode], visited=blocked)
+        for thisnode, nextnode, d in events:
+            if d == FORWARD:
+                path.append(nextnode)
+                closed.discard(nextnode)
+            elif d == NONTREE:
                 if nextnode == startnode:
                     yield path[:]
                     closed.update(path)
-#                        print "Found a cycle", path, closed
-                elif nextnode not in blocked:
-                    path.append(nextnode)
-                    stack.append((nextnode, list(subG[nextnode])))
-                    closed.discard(nextnode)
-                    blocked.add(nextnode)
-                    continue
-            # done with nextnode... look for more neighbors
-            if not nbrs:  # no more nbrs
-                if thisnode in closed:
-                    _unblock(thisnode, blocked, B)
+            else:
+                # done with all the neighbors of nextnode
+                if nextnode in closed:
+                    _unblock(nextnode, blocked, B)
                 else:
-                    for nbr in subG[thisnode]:
-                        if thisnode not in B[nbr]:
-                            B[nbr].add(thisnode)
-                stack.pop()
-#                assert path[-1] == thisnode
+                    for nbr in subG[nextnode]:
+                        B[nbr].add(nextnode)
                 path.pop()
         # done processing this node
         subG.remove_node(startnode)
@@ -48,6 +48,10 @@ def descendants(G, source):
     -------
     set()
         The descendants of `source` in `G`
+
+    See Also
+    --------
+    ReachabilityIndex
     """
     if not G.has_node(source):
         raise nx.NetworkXError("The node %s is not in the graph." % source)
@@ -68,6 +72,10 @@ def ancestors(G, source):
     -------
     set()
         The ancestors of source in G
+
+    See Also
+    --------
+    ReachabilityIndex
     """
     if not G.has_node(source):
         raise nx.NetworkXError("The node %s is not in the graph." % source)
@@ -9,14 +9,20 @@
 # Authors: Aric Hagberg (hagberg@lanl.gov)
 #          Dan Schult (dschult@colgate.edu)
 """Graph diameter, radius, eccentricity and other properties."""
+from heapq import heappush, heappop
+from itertools import count
+
 import networkx
+from networkx.algorithms.shortest_paths.unweighted import \
+    _single_shortest_path_length
+from networkx.algorithms.shortest_paths.weighted import _weight_function
 
-__all__ = ['extrema_bounding', 'eccentricity', 'diameter',
-           'radius', 'periphery', 'center']
+__all__ = ['extrema_bounding', 'eccentricity_bounds', 'eccentricity',
+           'diameter', 'radius', 'periphery', 'center']
 
 
-def extrema_bounding(G, compute="diameter"):
-    """Compute requested extreme distance metric of undirected graph G
+def extrema_bounding(G, compute="diameter", weight=None):
+    """Compute requested extreme distance metric of graph G
 
     Computation is based on smart lower and upper bounds, and in practice
     linear in the number of nodes, rather than quadratic (except for some
@@ -25,24 +31,32 @@ def extrema_bounding(G, compute="diameter"):
     Parameters
     ----------
     G : NetworkX graph
-       An undirected graph
+       An undirected connected graph or a strongly connected directed graph
 
     compute : string denoting the requesting metric
        "diameter" for the maximal eccentricity value,
        "radius" for the minimal eccentricity value,
        "periphery" for the set of nodes with eccentricity equal to the diameter
        "center" for the set of nodes with eccentricity equal to the radius
+       "eccentricities" for the dictionary of eccentricities keyed by node
+
+    weight : None or string, optional (default = None)
+       If None, every edge has weight/distance/cost 1.
+       If a string, use this edge attribute as the edge weight.
+       Any edge attribute not present defaults to 1.
 
     Returns
     -------
     value : value of the requested metric
-       int for "diameter" and "radius" or
-       list of nodes for "center" and "periphery"
+       int for "diameter" and "radius" (a number if `weight` is given),
+       list of nodes for "center" and "periphery" or
+       dictionary for "eccentricities"
 
     Raises
     ------
     NetworkXError
-        If the graph consists of multiple components
+        If the graph consists of multiple components, or is directed and
+        not strongly connected
 
     Notes
     -----
@@ -61,25 +75,129 @@ def extrema_bounding(G, compute="diameter"):
     Fast Graph Diameter and Radius BFS-Based Computation in (Weakly Connected)
     Real-World Graphs, Theoretical Computer Science 586: 59-80, 2015.
     doi: http://dx.doi.org/10.1016/j.tcs.2015.02.033
+
+    For a directed graph the eccentricity of a node is the largest distance
+    from it to another node. Each step then runs a forward and a backward
+    search from the selected node `u`, and the bounds of every other node
+    `v` follow from the triangle inequality:
+    ``max(d(v, u), ecc(u) - d(u, v)) <= ecc(v) <= d(v, u) + ecc(u)``.
+    The same bounds hold for weighted graphs.
+
+    See Also
+    --------
+    eccentricity_bounds
+    """
+    for ecc_lower, ecc_upper, extremes in _bounding(G, compute, weight):
+        pass
+    minlower, maxlower, minupper, maxupper = extremes
+    tol = _tolerance(weight, maxupper)
+
+    # return the correct value of the requested metric
+    if compute == 'diameter':
+        return maxlower
+    elif compute == 'radius':
+        return minupper
+    elif compute == 'periphery':
+        p = [v for v in G if ecc_lower[v] >= maxlower - tol]
+        return p
+    elif compute == 'center':
+        c = [v for v in G if ecc_upper[v] <= minupper + tol]
+        return c
+    elif compute == 'eccentricities':
+        return ecc_lower
+    return None
+
+
+def eccentricity_bounds(G, weight=None):
+    """Yields lower and upper bounds on the eccentricities of all nodes,
+    improving after each shortest path search.
+
+    The eccentricity of a node is the largest distance from it to another
+    node. Rather than running a search from every node, this selects one
+    node at a time, alternating between the node with the smallest lower
+    bound and the node with the largest upper bound, and tightens the
+    bounds of all nodes from its distances [1]_. On large sparse graphs
+    the bounds of most nodes usually become tight after a small number of
+    searches, so callers can stop as soon as the bounds they need are good
+    enough.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected connected graph or a strongly connected directed graph
+
+    weight : None or string, optional (default = None)
+       If None, every edge has weight/distance/cost 1.
+       If a string, use this edge attribute as the edge weight.
+       Any edge attribute not present defaults to 1.
+
+    Returns
+    -------
+    bounds : iterator
+       Iterator of (lower, upper) pairs of dictionaries keyed by node,
+       yielded after each search. The same two dictionaries are updated in
+       place by the next searches, so copy them to keep a snapshot. The
+       iterator is exhausted once all bounds are tight, and then ``lower``
+       and ``upper`` both hold the eccentricities.
+
+    Raises
+    ------
+    NetworkXError
+        If the graph consists of multiple components, or is directed and
+        not strongly connected
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.path_graph(5)
+    >>> for lower, upper in nx.eccentricity_bounds(G):
+    ...     if max(lower.values()) == max(upper.values()):
+    ...         break
+    >>> max(lower.values())  # the diameter
+    4
+
+    See Also
+    --------
+    eccentricity
+    extrema_bounding
+
+    References
+    ----------
+    .. [1] F.W. Takes and W.A. Kosters, Computing the Eccentricity
+       Distribution of Large Graphs, Algorithms 6(1): 100-118, 2013.
+       doi: http://dx.doi.org/10.3390/a6010100
     """
+    for ecc_lower, ecc_upper, _ in _bounding(G, 'eccentricities', weight):
+        yield ecc_lower, ecc_upper
+
 
+def _bounding(G, compute, weight):
+    """Bounding algorithm behind :func:`extrema_bounding`.
+
+    Yields ``(ecc_lower, ecc_upper, extremes)`` after each search, where
+    `extremes` is ``(minlower, maxlower, minupper, maxupper)``. The
+    candidates kept for the next searches depend on `compute`.
+    """
+    directed = G.is_directed()
+    if directed:
+        succ, pred = G._succ, G._pred
+    else:
+        succ = pred = G._adj
+    if weight is not None:
+        weight = _weight_function(G, weight)
     # init variables
     degrees = dict(G.degree())  # start with the highest degree node
     minlowernode = max(degrees, key=degrees.get)
     N = len(degrees)  # number of nodes
+    # initial upper bound, larger than any eccentricity
+    inf = N if weight is None else float('inf')
     # alternate between smallest lower and largest upper bound
     high = False
     # status variables
     ecc_lower = dict.fromkeys(G, 0)
-    ecc_upper = dict.fromkeys(G, N)
+    ecc_upper = dict.fromkeys(G, inf)
     candidates = set(G)
 
-    # (re)set bound extremes
-    minlower = N
-    maxlower = 0
-    minupper = N
-    maxupper = 0
-
     # repeat the following until there are no more candidates
     while candidates:
         if high:
@@ -89,17 +207,22 @@ def extrema_bounding(G, compute="diameter"):
         high = not high
 
         # get distances from/to current node and derive eccentricity
-        dist = dict(networkx.single_source_shortest_path_length(G, current))
-        if len(dist) != N:
-            msg = ('Cannot compute metric because graph is not connected.')
+        dist = _distances(succ, current, weight)
+        if directed:
+            dist_to = _distances(pred, current, weight)
+        else:
+            dist_to = dist
+        if len(dist) != N or len(dist_to) != N:
+            if directed:
+                msg = ('Cannot compute metric because digraph is not '
+                       'strongly connected.')
+            else:
+                msg = ('Cannot compute metric because graph is not '
+                       'connected.')
             raise networkx.NetworkXError(msg)
         current_ecc = max(dist.values())
-
-        # print status update
-#        print ("ecc of " + str(current) + " (" + str(ecc_lower[current]) + "/"
-#        + str(ecc_upper[current]) + ", deg: " + str(dist[current]) + ") is "
-#        + str(current_ecc))
-#        print(ecc_upper)
+        ecc_lower[current] = ecc_upper[current] = current_ecc
+        candidates.discard(current)
 
         # (re)set bound extremes
         maxuppernode = None
@@ -109,48 +232,52 @@ def extrema_bounding(G, compute="diameter"):
         for i in candidates:
             # update eccentricity bounds
             d = dist[i]
-            ecc_lower[i] = low = max(ecc_lower[i], max(d, (current_ecc - d)))
-            ecc_upper[i] = upp = min(ecc_upper[i], current_ecc + d)
-
-            # update min/max values of lower and upper bounds
-            minlower = min(ecc_lower[i], minlower)
-            maxlower = max(ecc_lower[i], maxlower)
-            minupper = min(ecc_upper[i], minupper)
-            maxupper = max(ecc_upper[i], maxupper)
+            d_to = dist_to[i]
+            ecc_lower[i] = max(ecc_lower[i], d_to, current_ecc - d)
+            ecc_upper[i] = min(ecc_upper[i], current_ecc + d_to)
+
+        # min/max values of lower and upper bounds, over all nodes since
+        # the bounds of ruled out nodes remain valid
+        minlower = min(ecc_lower.values())
+        maxlower = max(ecc_lower.values())
+        minupper = min(ecc_upper.values())
+        maxupper = max(ecc_upper.values())
+        # weighted bounds are sums of floats, compared up to rounding
+        tol = _tolerance(weight, maxupper)
 
         # update candidate set
         if compute == 'diameter':
-            ruled_out = {i for i in candidates if ecc_upper[i] <= maxlower and
-                         2 * ecc_lower[i] >= maxupper}
+            ruled_out = {i for i in candidates
+                         if ecc_upper[i] <= maxlower + tol and
+                         2 * ecc_lower[i] >= maxupper - tol}
 
         elif compute == 'radius':
-            ruled_out = {i for i in candidates if ecc_lower[i] >= minupper and
-                         ecc_upper[i] + 1 <= 2 * minlower}
+            ruled_out = {i for i in candidates
+                         if ecc_lower[i] >= minupper - tol and
+                         ecc_upper[i] + 1 <= 2 * minlower + tol}
 
         elif compute == 'periphery':
-            ruled_out = {i for i in candidates if ecc_upper[i] < maxlower and
-                         (maxlower == maxupper or ecc_lower[i] > maxupper)}
+            ruled_out = {i for i in candidates
+                         if ecc_upper[i] < maxlower - tol and
+                         (maxupper - maxlower <= tol or
+                          ecc_lower[i] > maxupper + tol)}
 
         elif compute == 'center':
-            ruled_out = {i for i in candidates if ecc_lower[i] > minupper and
-                     (minlower == minupper or ecc_upper[i] + 1 < 2 * minlower)}
+            ruled_out = {i for i in candidates
+                         if ecc_lower[i] > minupper + tol and
+                         (minupper - minlower <= tol or
+                          ecc_upper[i] + 1 < 2 * minlower - tol)}
 
         elif compute == 'eccentricities':
-            ruled_out = {}
+            ruled_out = set()
 
-        ruled_out.update(i for i in candidates if ecc_lower[i] == ecc_upper[i])
+        for i in candidates:
+            # rounding can leave the lower bound just above the upper one
+            if ecc_lower[i] >= ecc_upper[i]:
+                ecc_lower[i] = ecc_upper[i]
+                ruled_out.add(i)
         candidates -= ruled_out
 
-#        for i in ruled_out:
-#            print("removing %g: ecc_u: %g maxl: %g ecc_l: %g maxu: %g"%
-#                    (i,ecc_upper[i],maxlower,ecc_lower[i],maxupper))
-#        print("node %g: ecc_u: %g maxl: %g ecc_l: %g maxu: %g"%
-#                    (4,ecc_upper[4],maxlower,ecc_lower[4],maxupper))
-#        print("NODE 4: %g"%(ecc_upper[4] <= maxlower))
-#        print("NODE 4: %g"%(2 * ecc_lower[4] >= maxupper))
-#        print("NODE 4: %g"%(ecc_upper[4] <= maxlower
-#                            and 2 * ecc_lower[4] >= maxupper))
-
         # updating maxuppernode and minlowernode for selection in next round
         for i in candidates:
             if minlowernode is None \
@@ -165,32 +292,46 @@ def extrema_bounding(G, compute="diameter"):
                     or (ecc_upper[i] > ecc_upper[maxuppernode]):
                 maxuppernode = i
 
-        # print status update
-#        print (" min=" + str(minlower) + "/" + str(minupper) +
-#        " max=" + str(maxlower) + "/" + str(maxupper) +
-#        " candidates: " + str(len(candidates)))
-#        print("cand:",candidates)
-#        print("ecc_l",ecc_lower)
-#        print("ecc_u",ecc_upper)
-#        wait = input("press Enter to continue")
+        yield ecc_lower, ecc_upper, (minlower, maxlower, minupper, maxupper)
 
-    # return the correct value of the requested metric
-    if compute == 'diameter':
-        return maxlower
-    elif compute == 'radius':
-        return minupper
-    elif compute == 'periphery':
-        p = [v for v in G if ecc_lower[v] == maxlower]
-        return p
-    elif compute == 'center':
-        c = [v for v in G if ecc_upper[v] == minupper]
-        return c
-    elif compute == 'eccentricities':
-        return ecc_lower
-    return None
+
+def _tolerance(weight, scale):
+    """Returns the rounding tolerance of eccentricity bounds of
+    magnitude `scale`, zero for unit weights."""
+    if weight is None:
+        return 0
+    return 1e-9 * scale
 
 
-def eccentricity(G, v=None, sp=None):
+def _distances(adj, source, weight):
+    """Returns the shortest path lengths from `source` along the
+    adjacency `adj`, using the weight function `weight` or unit weights
+    if it is None.
+    """
+    if weight is None:
+        return dict(_single_shortest_path_length(adj, {source: 1},
+                                                 float('inf')))
+    dist = {}
+    seen = {source: 0}
+    c = count()
+    fringe = [(0, next(c), source)]
+    while fringe:
+        d, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        for u, e in adj[v].items():
+            cost = weight(v, u, e)
+            if cost is None:
+                continue
+            vu_dist = d + cost
+            if u not in dist and (u not in seen or vu_dist < seen[u]):
+                seen[u] = vu_dist
+                heappush(fringe, (vu_dist, next(c), u))
+    return dist
+
+
+def eccentricity(G, v=None, sp=None, weight=None, usebounds=False):
     """Return the eccentricity of nodes in G.
 
     The eccentricity of a node v is the maximum distance from v to
@@ -207,6 +348,16 @@ def eccentricity(G, v=None, sp=None):
     sp : dict of dicts, optional
        All pairs shortest path lengths as a dictionary of dictionaries
 
+    weight : None or string, optional (default = None)
+       If None, every edge has weight/distance/cost 1.
+       If a string, use this edge attribute as the edge weight.
+       Any edge attribute not present defaults to 1.
+
+    usebounds : bool, optional (default = False)
+       If True and neither `v` nor `sp` is given, compute the
+       eccentricities of all nodes with :func:`extrema_bounding` instead
+       of a search from every node.
+
     Returns
     -------
     ecc : dictionary
@@ -219,11 +370,15 @@ def eccentricity(G, v=None, sp=None):
 #    else:                      # assume v is a container of nodes
 #        nodes=v
     order = G.order()
+    if usebounds is True and v is None and sp is None and order > 0:
+        return extrema_bounding(G, compute="eccentricities", weight=weight)
+    if weight is not None:
+        weight = _weight_function(G, weight)
 
     e = {}
     for n in G.nbunch_iter(v):
         if sp is None:
-            length = dict(networkx.single_source_shortest_path_length(G, n))
+            length = _distances(G._adj, n, weight)
             L = len(length)
         else:
             try:
@@ -248,7 +403,7 @@ def eccentricity(G, v=None, sp=None):
         return e
 
 
-def diameter(G, e=None, usebounds=False):
+def diameter(G, e=None, usebounds=False, weight=None):
     """Return the diameter of the graph G.
 
     The diameter is the maximum eccentricity.
@@ -261,6 +416,14 @@ def diameter(G, e=None, usebounds=False):
     e : eccentricity dictionary, optional
       A precomputed dictionary of eccentricities.
 
+    usebounds : bool, optional (default = False)
+      If True and `e` is not given, use :func:`extrema_bounding`.
+
+    weight : None or string, optional (default = None)
+      If None, every edge has weight/distance/cost 1.
+      If a string, use this edge attribute as the edge weight.
+      Any edge attribute not present defaults to 1.
+
     Returns
     -------
     d : integer
@@ -270,14 +433,14 @@ def diameter(G, e=None, usebounds=False):
     --------
     eccentricity
     """
-    if usebounds is True and e is None and not G.is_directed():
-        return extrema_bounding(G, compute="diameter")
+    if usebounds is True and e is None:
+        return extrema_bounding(G, compute="diameter", weight=weight)
     if e is None:
-        e = eccentricity(G)
+        e = eccentricity(G, weight=weight)
     return max(e.values())
 
 
-def periphery(G, e=None, usebounds=False):
+def periphery(G, e=None, usebounds=False, weight=None):
     """Return the periphery of the graph G.
 
     The periphery is the set of nodes with eccentricity equal to the diameter.
@@ -290,21 +453,29 @@ def periphery(G, e=None, usebounds=False):
     e : eccentricity dictionary, optional
       A precomputed dictionary of eccentricities.
 
+    usebounds : bool, optional (default = False)
+      If True and `e` is not given, use :func:`extrema_bounding`.
+
+    weight : None or string, optional (default = None)
+      If None, every edge has weight/distance/cost 1.
+      If a string, use this edge attribute as the edge weight.
+      Any edge attribute not present defaults to 1.
+
     Returns
     -------
     p : list
        List of nodes in periphery
     """
-    if usebounds is True and e is None and not G.is_directed():
-        return extrema_bounding(G, compute="periphery")
+    if usebounds is True and e is None:
+        return extrema_bounding(G, compute="periphery", weight=weight)
     if e is None:
-        e = eccentricity(G)
+        e = eccentricity(G, weight=weight)
     diameter = max(e.values())
     p = [v for v in e if e[v] == diameter]
     return p
 
 
-def radius(G, e=None, usebounds=False):
+def radius(G, e=None, usebounds=False, weight=None):
     """Return the radius of the graph G.
 
     The radius is the minimum eccentricity.
@@ -317,19 +488,27 @@ def radius(G, e=None, usebounds=False):
     e : eccentricity dictionary, optional
       A precomputed dictionary of eccentricities.
 
+    usebounds : bool, optional (default = False)
+      If True and `e` is not given, use :func:`extrema_bounding`.
+
+    weight : None or string, optional (default = None)
+      If None, every edge has weight/distance/cost 1.
+      If a string, use this edge attribute as the edge weight.
+      Any edge attribute not present defaults to 1.
+
     Returns
     -------
     r : integer
        Radius of graph
     """
-    if usebounds is True and e is None and not G.is_directed():
-        return extrema_bounding(G, compute="radius")
+    if usebounds is True and e is None:
+        return extrema_bounding(G, compute="radius", weight=weight)
     if e is None:
-        e = eccentricity(G)
+        e = eccentricity(G, weight=weight)
     return min(e.values())
 
 
-def center(G, e=None, usebounds=False):
+def center(G, e=None, usebounds=False, weight=None):
     """Return the center of the graph G.
 
     The center is the set of nodes with eccentricity equal to radius.
@@ -342,15 +521,23 @@ def center(G, e=None, usebounds=False):
     e : eccentricity dictionary, optional
       A precomputed dictionary of eccentricities.
 
+    usebounds : bool, optional (default = False)
+      If True and `e` is not given, use :func:`extrema_bounding`.
+
+    weight : None or string, optional (default = None)
+      If None, every edge has weight/distance/cost 1.
+      If a string, use this edge attribute as the edge weight.
+      Any edge attribute not present defaults to 1.
+
     Returns
     -------
     c : list
        List of nodes in center
     """
-    if usebounds is True and e is None and not G.is_directed():
-        return extrema_bounding(G, compute="center")
+    if usebounds is True and e is None:
+        return extrema_bounding(G, compute="center", weight=weight)
     if e is None:
-        e = eccentricity(G)
+        e = eccentricity(G, weight=weight)
     radius = min(e.values())
     p = [v for v in e if e[v] == radius]
     return p
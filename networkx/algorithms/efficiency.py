@@ -82,6 +82,7 @@ def global_efficiency(G):
     See also
     --------
     local_efficiency
+    networkx.algorithms.approximation.distance_measures.global_efficiency
 
     References
     ----------
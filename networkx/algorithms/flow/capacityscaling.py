@@ -49,6 +49,8 @@ def _detect_unboundedness(R):
 def _build_residual_network(G, demand, capacity, weight):
     """Build a residual network and initialize a zero flow.
     """
+    if len(G) == 0:
+        raise nx.NetworkXError('graph has no nodes')
     if sum(G.node[u].get(demand, 0) for u in G) != 0:
         raise nx.NetworkXUnfeasible("Sum of the demands should be 0.")
 
@@ -11,13 +11,18 @@ from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 __author__ = """\n""".join(["Aric Hagberg <aric.hagberg@gmail.com>",
                             "Brandon Liu <brandon.k.liu@gmail.com"])
-__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix']
+__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix',
+           'personalized_pagerank']
+
+# Largest number of entries in a block of PageRank vectors iterated
+# together, unless a chunk size is given.
+_BATCH = 1 << 22
 
 
 @not_implemented_for('multigraph')
 def pagerank(G, alpha=0.85, personalization=None,
              max_iter=100, tol=1.0e-6, nstart=None, weight='weight',
-             dangling=None):
+             dangling=None, dtype=float):
     """Return the PageRank of the nodes in the graph.
 
     PageRank computes a ranking of the nodes in the graph G based on
@@ -47,7 +52,8 @@ def pagerank(G, alpha=0.85, personalization=None,
       Error tolerance used to check convergence in power method solver.
 
     nstart : dictionary, optional
-      Starting value of PageRank iteration for each node.
+      Starting value of PageRank iteration for each node. If not
+      specified, a nodes starting value will be zero.
 
     weight : key, optional
       Edge data key to use as weight.  If None weights are set to 1.
@@ -61,6 +67,10 @@ def pagerank(G, alpha=0.85, personalization=None,
       matrix (see notes under google_matrix). It may be common to have the
       dangling dict to be the same as the personalization dict.
 
+    dtype : data type, optional (default=float)
+      Data type of the transition matrix and of the iterated vector when
+      SciPy is available. Set to numpy.float32 to halve their memory.
+
     Returns
     -------
     pagerank : dictionary
@@ -80,6 +90,13 @@ def pagerank(G, alpha=0.85, personalization=None,
     :exc:`networkx.exception.PowerIterationFailedConvergence` exception
     is raised.
 
+    When SciPy is available the iterations multiply a sparse transition
+    matrix built once, as :func:`pagerank_scipy` does; otherwise they
+    run over a stochastic copy of the graph. Both give the same result:
+    the `personalization`, `nstart` and `dangling` dictionaries are
+    normalized over the nodes of `G`, ignoring other keys, and
+    ZeroDivisionError is raised if their values on the nodes sum to zero.
+
     The PageRank algorithm was designed for directed graphs but this
     algorithm does not check if the input graph is directed and will
     execute on undirected graphs by converting each edge in the
@@ -109,6 +126,17 @@ def pagerank(G, alpha=0.85, personalization=None,
     if len(G) == 0:
         return {}
 
+    try:
+        import scipy.sparse  # noqa: F401 -- only checks that SciPy is available
+    except ImportError:
+        return _pagerank_python(G, alpha, personalization, max_iter, tol,
+                                nstart, weight, dangling)
+    return _pagerank_scipy(G, alpha, personalization, max_iter, tol, nstart,
+                           weight, dangling, dtype)
+
+
+def _pagerank_python(G, alpha, personalization, max_iter, tol, nstart,
+                     weight, dangling):
     if not G.is_directed():
         D = G.to_directed()
     else:
@@ -123,22 +151,19 @@ def pagerank(G, alpha=0.85, personalization=None,
         x = dict.fromkeys(W, 1.0 / N)
     else:
         # Normalized nstart vector
-        s = float(sum(nstart.values()))
-        x = dict((k, v / s) for k, v in nstart.items())
+        x = _node_dict(nstart, W)
 
     if personalization is None:
         # Assign uniform personalization vector if not given
         p = dict.fromkeys(W, 1.0 / N)
     else:
-        s = float(sum(personalization.values()))
-        p = dict((k, v / s) for k, v in personalization.items())
+        p = _node_dict(personalization, W)
 
     if dangling is None:
         # Use personalization vector if dangling vector not specified
         dangling_weights = p
     else:
-        s = float(sum(dangling.values()))
-        dangling_weights = dict((k, v/s) for k, v in dangling.items())
+        dangling_weights = _node_dict(dangling, W)
     dangling_nodes = [n for n in W if W.out_degree(n, weight=weight) == 0.0]
 
     # power iteration: make up to max_iter iterations
@@ -151,7 +176,7 @@ def pagerank(G, alpha=0.85, personalization=None,
             # doing a left multiply x^T=xlast^T*W
             for nbr in W[n]:
                 x[nbr] += alpha * xlast[n] * W[n][nbr][weight]
-            x[n] += danglesum * dangling_weights.get(n,0) + (1.0 - alpha) * p.get(n,0)
+            x[n] += danglesum * dangling_weights[n] + (1.0 - alpha) * p[n]
         # check convergence, l1 norm
         err = sum([abs(x[n] - xlast[n]) for n in x])
         if err < N*tol:
@@ -159,6 +184,100 @@ def pagerank(G, alpha=0.85, personalization=None,
     raise nx.PowerIterationFailedConvergence(max_iter)
 
 
+def _node_dict(values, nodes):
+    """Return the values of the dictionary `values` for `nodes`, zero for
+    the missing nodes, normalized to sum to one. Keys which are not in
+    `nodes` are ignored."""
+    s = float(sum(values.get(n, 0) for n in nodes))
+    return dict((n, values.get(n, 0) / s) for n in nodes)
+
+
+def _pagerank_scipy(G, alpha, personalization, max_iter, tol, nstart,
+                    weight, dangling, dtype):
+    import numpy as np
+    nodelist = list(G)
+    N = len(nodelist)
+    MT, is_dangling = _transition_matrix(G, nodelist, weight, dtype)
+    if nstart is None:
+        x = np.repeat(1.0 / N, N).astype(dtype)
+    else:
+        x = _node_vector(nstart, nodelist, dtype)
+    if personalization is None:
+        p = np.repeat(1.0 / N, N).astype(dtype)
+    else:
+        p = _node_vector(personalization, nodelist, dtype)
+    if dangling is None:
+        dangling_weights = p
+    else:
+        dangling_weights = _node_vector(dangling, nodelist, dtype)
+    x = _pagerank_iterate(MT, is_dangling, x[:, None], p[:, None],
+                          dangling_weights[:, None], alpha, max_iter, tol)
+    return dict(zip(nodelist, map(float, x[:, 0])))
+
+
+def _transition_matrix(G, nodelist, weight, dtype=float):
+    """Return the transpose, in CSR format, of the right stochastic
+    transition matrix of `G` and a boolean array marking the dangling
+    nodes, both in `nodelist` order."""
+    import numpy as np
+    import scipy.sparse
+    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                  dtype=dtype, format='csr')
+    S = np.asarray(M.sum(axis=1), dtype=dtype).ravel()
+    is_dangling = S == 0
+    S[~is_dangling] = 1 / S[~is_dangling]
+    M = scipy.sparse.diags(S, 0, format='csr').dot(M)
+    return M.T.tocsr(), is_dangling
+
+
+def _node_vector(values, nodelist, dtype=float):
+    """Return the values of the dictionary `values` in `nodelist` order,
+    zero for the missing nodes, normalized to sum to one, like
+    :func:`_node_dict`."""
+    import numpy as np
+    v = np.array([values.get(n, 0) for n in nodelist], dtype=dtype)
+    # Dividing by a Python float raises ZeroDivisionError for a zero sum,
+    # as the dictionary iterations do.
+    v *= 1.0 / float(v.sum())
+    return v
+
+
+def _pagerank_iterate(MT, is_dangling, X, P, D, alpha, max_iter, tol):
+    """Power iteration of PageRank with the transposed transition matrix
+    `MT`, from the columns of `X`, with the personalization vectors in
+    the columns of `P` and the dangling vectors in the columns of `D`,
+    which may be a single column shared by all.
+
+    The columns are iterated together and dropped from the block as soon
+    as they converge.
+    """
+    import numpy as np
+    N = MT.shape[0]
+    result = np.empty_like(X)
+    active = np.arange(X.shape[1])
+    teleport = (1 - alpha) * P
+    for _ in range(max_iter):
+        Xlast = X
+        X = MT.dot(Xlast)
+        X *= alpha
+        X += D * (alpha * Xlast[is_dangling].sum(axis=0))
+        X += teleport
+        # check convergence, l1 norm of each column
+        err = abs(X - Xlast).sum(axis=0)
+        done = err < N * tol
+        if done.any():
+            result[:, active[done]] = X[:, done]
+            if done.all():
+                return result
+            keep = ~done
+            active = active[keep]
+            X = X[:, keep]
+            teleport = teleport[:, keep]
+            if D.shape[1] > 1:
+                D = D[:, keep]
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
 def google_matrix(G, alpha=0.85, personalization=None,
                   nodelist=None, weight='weight', dangling=None):
     """Return the Google matrix of the graph.
@@ -338,7 +457,7 @@ def pagerank_numpy(G, alpha=0.85, personalization=None, weight='weight',
 
 def pagerank_scipy(G, alpha=0.85, personalization=None,
                    max_iter=100, tol=1.0e-6, weight='weight',
-                   dangling=None):
+                   dangling=None, dtype=float):
     """Return the PageRank of the nodes in the graph.
 
     PageRank computes a ranking of the nodes in the graph G based on
@@ -379,6 +498,10 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
       matrix (see notes under google_matrix). It may be common to have the
       dangling dict to be the same as the personalization dict.
 
+    dtype : data type, optional (default=float)
+      Data type of the transition matrix and of the iterated vector.
+      Set to numpy.float32 to halve their memory.
+
     Returns
     -------
     pagerank : dictionary
@@ -418,50 +541,163 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
        The PageRank citation ranking: Bringing order to the Web. 1999
        http://dbpubs.stanford.edu:8090/pub/showDoc.Fulltext?lang=en&doc=1999-66&format=pdf
     """
-    import scipy.sparse
-
-    N = len(G)
-    if N == 0:
+    if len(G) == 0:
         return {}
+    return _pagerank_scipy(G, alpha, personalization, max_iter, tol, None,
+                           weight, dangling, dtype)
 
-    nodelist = list(G)
-    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
-                                  dtype=float)
-    S = scipy.array(M.sum(axis=1)).flatten()
-    S[S != 0] = 1.0 / S[S != 0]
-    Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format='csr')
-    M = Q * M
 
-    # initial vector
-    x = scipy.repeat(1.0 / N, N)
+def personalized_pagerank(G, personalization, alpha=0.85, max_iter=100,
+                          tol=1.0e-6, weight='weight', dangling=None,
+                          nodelist=None, k=None, chunk_size=None,
+                          dtype=float):
+    """Return the personalized PageRank of the nodes for many
+    personalization vectors at once.
 
-    # Personalization vector
-    if personalization is None:
-        p = scipy.repeat(1.0 / N, N)
-    else:
-        p = scipy.array([personalization.get(n, 0) for n in nodelist], dtype=float)
-        p = p / p.sum()
+    The PageRank vectors of a chunk of personalization vectors are
+    iterated together, each iteration multiplying the sparse transition
+    matrix by a dense block with one column per vector.
 
-    # Dangling nodes
-    if dangling is None:
-        dangling_weights = p
-    else:
-        # Convert the dangling dictionary into an array in nodelist order
-        dangling_weights = scipy.array([dangling.get(n, 0) for n in nodelist],
-                                       dtype=float)
-        dangling_weights /= dangling_weights.sum()
-    is_dangling = scipy.where(S == 0)[0]
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
 
-    # power iteration: make up to max_iter iterations
-    for _ in range(max_iter):
-        xlast = x
-        x = alpha * (x * M + sum(x[is_dangling]) * dangling_weights) + \
-            (1 - alpha) * p
-        # check convergence, l1 norm
-        err = scipy.absolute(x - xlast).sum()
-        if err < N * tol:
-            return dict(zip(nodelist, map(float, x)))
-    raise nx.PowerIterationFailedConvergence(max_iter)
+    personalization : SciPy sparse matrix or NumPy array
+      Matrix of shape ``(seeds, len(nodelist))`` with one personalization
+      vector per row, its columns in `nodelist` order. Each row is
+      normalized to sum to one.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    max_iter : integer, optional
+      Maximum number of iterations in power method eigenvalue solver.
+
+    tol : float, optional
+      Error tolerance used to check convergence of each vector.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, shared by all
+      the vectors, as for :func:`pagerank`. By default, dangling nodes are
+      given outedges according to the personalization vector of each row.
+
+    nodelist : list, optional
+      The order of the nodes in the columns of `personalization` and of
+      the result. If None, the order is given by ``G.nodes()``.
+
+    k : integer, optional
+      If None, return all the PageRank values. Otherwise return the `k`
+      nodes with largest PageRank for each row.
+
+    chunk_size : integer, optional
+      Number of rows iterated together. The memory used is proportional
+      to ``chunk_size * len(G)``. By default the chunks hold about four
+      million values.
+
+    dtype : data type, optional (default=float)
+      Data type of the transition matrix and of the iterated block.
+
+    Returns
+    -------
+    pagerank : NumPy array or list
+      If `k` is None, an array of shape ``(seeds, len(nodelist))`` with
+      the PageRank vector of each row. Otherwise a list with, for each
+      row, a list of the `k` pairs ``(node, value)`` with largest values,
+      in decreasing order of value.
+
+    Raises
+    ------
+    NetworkXError
+      If the shape of `personalization` does not match `nodelist` or if a
+      row sums to zero.
+
+    PowerIterationFailedConvergence
+      If a vector fails to converge to the specified tolerance within the
+      specified number of iterations of the power iteration method.
+
+    Examples
+    --------
+    >>> import scipy.sparse
+    >>> G = nx.cycle_graph(6)
+    >>> seeds = scipy.sparse.csr_matrix(([1.0, 1.0], ([0, 1], [1, 3])),
+    ...                                 shape=(2, 6))
+    >>> [top[0][0] for top in nx.personalized_pagerank(G, seeds, k=2)]
+    [1, 3]
+    >>> pr = nx.personalized_pagerank(G, seeds)
+    >>> abs(pr[0, 1] - nx.pagerank(G, personalization={1: 1})[1]) < 1e-6
+    True
+
+    See Also
+    --------
+    pagerank, pagerank_scipy
+
+    Notes
+    -----
+    Each row converges to the same result as :func:`pagerank` with the
+    corresponding personalization dictionary; its iterations start from
+    the personalization vector and stop when the error falls below
+    ``len(G) * tol``. Rows which converge are dropped from the block.
+
+    An iteration over a chunk of `c` rows costs one product of the
+    transition matrix by an ``n`` by ``c`` block, which reads the
+    matrix once for all the rows.
+    """
+    import numpy as np
+    import scipy.sparse
+    if nodelist is None:
+        nodelist = list(G)
+    N = len(nodelist)
+    if scipy.sparse.issparse(personalization):
+        personalization = personalization.tocsr()
+    else:
+        personalization = np.atleast_2d(np.asarray(personalization))
+    seeds, columns = personalization.shape
+    if columns != N:
+        raise NetworkXError('personalization has %d columns for %d nodes'
+                            % (columns, N))
+    sums = np.asarray(personalization.sum(axis=1), dtype=float).ravel()
+    if (sums == 0).any():
+        raise NetworkXError('row %d of personalization sums to zero'
+                            % np.flatnonzero(sums == 0)[0])
+    if N == 0:
+        return np.zeros((seeds, 0), dtype=dtype) if k is None else \
+            [[] for _ in range(seeds)]
+    MT, is_dangling = _transition_matrix(G, nodelist, weight, dtype)
+    if dangling is not None:
+        D = _node_vector(dangling, nodelist, dtype)[:, None]
+    if chunk_size is None:
+        chunk_size = max(_BATCH // N, 1)
+    if k is None:
+        result = np.empty((seeds, N), dtype=dtype)
+    else:
+        result = []
+    for start in range(0, seeds, chunk_size):
+        stop = min(start + chunk_size, seeds)
+        P = personalization[start:stop]
+        if scipy.sparse.issparse(P):
+            P = P.toarray()
+        P = np.array(P.T, dtype=dtype)
+        P /= sums[start:stop].astype(dtype)
+        X = _pagerank_iterate(MT, is_dangling, P.copy(), P,
+                              P if dangling is None else D, alpha,
+                              max_iter, tol)
+        if k is None:
+            result[start:stop] = X.T
+            continue
+        if k < N:
+            top = np.argpartition(-X, k - 1, axis=0)[:k]
+        else:
+            top = np.tile(np.arange(N)[:, None], (1, X.shape[1]))
+        for j in range(X.shape[1]):
+            column = top[:, j]
+            column = column[np.argsort(-X[column, j], kind='mergesort')]
+            result.append([(nodelist[i], float(X[i, j])) for i in column])
+    return result
 
 
 # fixture for nose tests
@@ -173,3 +173,146 @@ class TestPageRankScipy(TestPageRank):
     def test_empty_scipy(self):
         G = networkx.Graph()
         assert_equal(networkx.pagerank_scipy(G), {})
+
+    def test_python_and_scipy(self):
+        from networkx.algorithms.link_analysis.pagerank_alg import \
+            _pagerank_python
+        G = networkx.gnp_random_graph(50, 0.08, seed=1, directed=True)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 4 + 1
+        rng = random.Random(2)
+        personalize = dict((n, rng.random()) for n in G)
+        dangling = dict((n, rng.random()) for n in G)
+        for kwds in ({}, {'personalization': personalize},
+                     {'personalization': personalize, 'dangling': dangling},
+                     {'nstart': personalize}):
+            expected = _pagerank_python(G, 0.85, kwds.get('personalization'),
+                                        100, 1e-10, kwds.get('nstart'),
+                                        'weight', kwds.get('dangling'))
+            p = networkx.pagerank(G, tol=1e-10, **kwds)
+            for n in G:
+                assert_almost_equal(p[n], expected[n])
+
+    def test_python_and_scipy_keys(self):
+        from networkx.algorithms.link_analysis.pagerank_alg import \
+            _pagerank_python, _pagerank_scipy
+        G = networkx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3)])
+        # Keys which are not nodes are ignored and missing nodes are zero.
+        for kwds in ({'personalization': {0: 1, 'x': 1}},
+                     {'dangling': {3: 1, 'x': 1}},
+                     {'nstart': {0: 1, 1: 1}},
+                     {'personalization': {0: 1}, 'nstart': {3: 2, 'x': 5}}):
+            args = (G, 0.85, kwds.get('personalization'), 100, 1e-10,
+                    kwds.get('nstart'), 'weight', kwds.get('dangling'))
+            p = _pagerank_python(*args)
+            q = _pagerank_scipy(*(args + (float,)))
+            assert_equal(set(p), set(G))
+            assert_almost_equal(sum(p.values()), 1)
+            for n in G:
+                assert_almost_equal(p[n], q[n])
+        args = (G, 0.85, {'x': 1}, 100, 1e-10, None, 'weight', None)
+        assert_raises(ZeroDivisionError, _pagerank_python, *args)
+        assert_raises(ZeroDivisionError, _pagerank_scipy, *(args + (float,)))
+
+    def test_float32(self):
+        G = self.G
+        for func in (networkx.pagerank, networkx.pagerank_scipy):
+            p = func(G, alpha=0.9, dtype=numpy.float32)
+            for n in G:
+                assert_almost_equal(p[n], G.pagerank[n], places=4)
+
+
+class TestPersonalizedPageRank(object):
+
+    @classmethod
+    def setupClass(cls):
+        global numpy, scipy
+        try:
+            import numpy
+            import scipy.sparse
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+
+    def setUp(self):
+        G = networkx.gnp_random_graph(40, 0.1, seed=3, directed=True)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u * v) % 3 + 1
+        self.G = G
+        self.nodelist = list(G)
+        rng = random.Random(4)
+        self.seeds = [dict((n, rng.random()) for n in rng.sample(G.nodes(), 3))
+                      for _ in range(7)]
+        rows, cols, values = [], [], []
+        for i, seed in enumerate(self.seeds):
+            for n, v in seed.items():
+                rows.append(i)
+                cols.append(self.nodelist.index(n))
+                values.append(v)
+        self.P = scipy.sparse.csr_matrix((values, (rows, cols)),
+                                         shape=(len(self.seeds), len(G)))
+
+    def test_dense(self):
+        for P in (self.P, self.P.toarray()):
+            for chunk_size in (None, 1, 3):
+                pr = networkx.personalized_pagerank(self.G, P, tol=1e-10,
+                                                    chunk_size=chunk_size)
+                assert_equal(pr.shape, P.shape)
+                for i, seed in enumerate(self.seeds):
+                    expected = networkx.pagerank(self.G, personalization=seed,
+                                                 tol=1e-10)
+                    for j, n in enumerate(self.nodelist):
+                        assert_almost_equal(pr[i, j], expected[n])
+
+    def test_top_k(self):
+        pr = networkx.personalized_pagerank(self.G, self.P, tol=1e-10)
+        top = networkx.personalized_pagerank(self.G, self.P, tol=1e-10, k=5,
+                                             chunk_size=2)
+        assert_equal(len(top), len(self.seeds))
+        for i, row in enumerate(top):
+            assert_equal(len(row), 5)
+            values = [v for n, v in row]
+            assert_equal(values, sorted(values, reverse=True))
+            assert_almost_equal(values[0], pr[i].max())
+            assert_almost_equal(values[-1], numpy.sort(pr[i])[-5])
+            for n, v in row:
+                assert_almost_equal(v, pr[i, self.nodelist.index(n)])
+        top = networkx.personalized_pagerank(self.G, self.P, k=100)
+        assert_equal(len(top[0]), len(self.G))
+
+    def test_dangling(self):
+        G = networkx.DiGraph([(1, 2), (1, 3), (3, 1), (3, 2)])
+        dangling = {1: 1, 3: 2}
+        P = numpy.array([[1, 0, 0], [0, 1, 1]])
+        pr = networkx.personalized_pagerank(G, P, dangling=dangling,
+                                            nodelist=[1, 2, 3], tol=1e-10)
+        for i in range(2):
+            seed = {1: P[i, 0], 2: P[i, 1], 3: P[i, 2]}
+            expected = networkx.pagerank(G, personalization=seed,
+                                         dangling=dangling, tol=1e-10)
+            for j, n in enumerate([1, 2, 3]):
+                assert_almost_equal(pr[i, j], expected[n])
+
+    def test_float32(self):
+        pr = networkx.personalized_pagerank(self.G, self.P,
+                                            dtype=numpy.float32)
+        assert_equal(pr.dtype, numpy.float32)
+        expected = networkx.personalized_pagerank(self.G, self.P)
+        assert_true(abs(pr - expected).max() < 1e-4)
+
+    def test_errors(self):
+        assert_raises(networkx.NetworkXError,
+                      networkx.personalized_pagerank, self.G,
+                      self.P[:, :-1])
+        P = self.P.toarray()
+        P[2] = 0
+        assert_raises(networkx.NetworkXError,
+                      networkx.personalized_pagerank, self.G, P)
+        assert_raises(networkx.PowerIterationFailedConvergence,
+                      networkx.personalized_pagerank, self.G, self.P,
+                      max_iter=1)
+
+    def test_empty(self):
+        G = networkx.Graph()
+        P = numpy.zeros((0, 0))
+        assert_equal(networkx.personalized_pagerank(G, P).shape, (0, 0))
+        assert_equal(networkx.personalized_pagerank(G, P, k=3), [])
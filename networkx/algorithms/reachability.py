@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2017 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+Index answering repeated reachability queries on directed graphs.
+"""
+import random
+
+import networkx as nx
+from networkx.algorithms.traversal.depth_first_search import (_dfs_events,
+                                                              FORWARD,
+                                                              REVERSE)
+
+__all__ = ['ReachabilityIndex']
+
+
+class ReachabilityIndex(object):
+    """Reachability queries answered from labels of the condensation.
+
+    The strongly connected components of `G` are computed once and each
+    component of the condensation, a directed acyclic graph, gets two
+    kinds of interval labels from depth-first searches:
+
+    * the interval of postorder numbers of its subtree in a depth-first
+      spanning forest; a component reaches every component whose number
+      falls in it;
+    * `labels` GRAIL intervals [1]_, from searches visiting the children
+      in random order, each covering the intervals of all the components
+      it reaches; a component whose intervals do not all contain the
+      intervals of another component cannot reach it.
+
+    Most queries are answered by comparing these intervals. The others
+    fall back to a depth-first search of the condensation that skips the
+    components whose intervals exclude the target.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph
+        The graph is not copied. Edges must be added through
+        :meth:`add_edge`; after any other change, call :meth:`rebuild`.
+
+    labels : integer, optional (default=2)
+        Number of GRAIL intervals per component. More intervals answer
+        more negative queries without a search, at the cost of memory.
+
+    seed : integer, optional
+        Seed for the random order of the searches.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is undirected.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 1), (3, 2)])
+    >>> index = nx.ReachabilityIndex(G)
+    >>> index.has_path(0, 2), index.has_path(2, 0)
+    (True, False)
+    >>> sorted(index.descendants(0))
+    [1, 2]
+    >>> sorted(index.ancestors(2))
+    [0, 1, 3]
+    >>> index.add_edge(2, 3)
+    >>> index.has_path(0, 3)
+    True
+
+    Notes
+    -----
+    Building the index takes time linear in the size of `G` for each
+    label. Inserting an edge enlarges the intervals of the components
+    that reach its tail, as far as needed, and merges the components on
+    the cycles it closes.
+
+    References
+    ----------
+    .. [1] Hilmi Yildirim, Vineet Chaoji and Mohammed J. Zaki,
+       "GRAIL: scalable reachability index for large graphs",
+       Proceedings of the VLDB Endowment 3(1-2):276--284, 2010.
+
+    """
+
+    def __init__(self, G, labels=2, seed=None):
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented('not implemented for '
+                                            'undirected type')
+        if labels < 1:
+            raise ValueError('labels must be at least 1')
+        self.G = G
+        self._num_labels = labels
+        if seed is not None:
+            random.seed(seed)
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the index from the current edges of the graph."""
+        G = self.G
+        component = {}
+        members = {}
+        for c, nodes in enumerate(nx.strongly_connected_components(G)):
+            members[c] = set(nodes)
+            component.update(dict.fromkeys(nodes, c))
+        succ = {c: set() for c in members}
+        pred = {c: set() for c in members}
+        for u, nbrs in G._succ.items():
+            cu = component[u]
+            for v in nbrs:
+                cv = component[v]
+                if cu != cv:
+                    succ[cu].add(cv)
+                    pred[cv].add(cu)
+        self._component = component
+        self._members = members
+        self._succ = succ
+        self._pred = pred
+        # Fresh numbers, larger than any postorder number, for the
+        # components created later.
+        self._next = len(members)
+
+        self._tree = {}
+        self._labels = {c: [] for c in members}
+        # Every component is reached from the sources of the
+        # condensation.
+        roots = [c for c in members if not pred[c]]
+        adj = succ
+        for i in range(self._num_labels):
+            if i > 0:
+                random.shuffle(roots)
+                adj = {c: random.sample(list(s), len(s))
+                       for c, s in succ.items()}
+            post = 0
+            first = {}
+            low = {}
+            for parent, child, event in _dfs_events(adj, roots):
+                if event == FORWARD:
+                    first[child] = post
+                elif event == REVERSE:
+                    low[child] = min([post] + [low[c] for c in succ[child]])
+                    self._labels[child].append((low[child], post))
+                    if i == 0:
+                        self._tree[child] = (first[child], post, post)
+                    post += 1
+
+    def _new_component(self, n):
+        c = self._next
+        self._next += 1
+        self._component[n] = c
+        self._members[c] = {n}
+        self._succ[c] = set()
+        self._pred[c] = set()
+        self._tree[c] = (c, c, c)
+        self._labels[c] = [(c, c)] * self._num_labels
+        return c
+
+    def _find(self, n):
+        try:
+            return self._component[n]
+        except KeyError:
+            raise nx.NodeNotFound("Node %s is not found in the index" % n)
+
+    def _covers(self, a, b):
+        """Return False if component `a` cannot reach component `b`."""
+        for (low_a, high_a), (low_b, high_b) in zip(self._labels[a],
+                                                    self._labels[b]):
+            if low_b < low_a or high_b > high_a:
+                return False
+        return True
+
+    def _reaches(self, a, b):
+        first, last, _ = self._tree[a]
+        post = self._tree[b][2]
+        if first <= post <= last:
+            return True
+        if not self._covers(a, b):
+            return False
+        # Search the components that may still reach b.
+        tree = self._tree
+        seen = {a}
+        stack = [a]
+        while stack:
+            for c in self._succ[stack.pop()]:
+                if c == b:
+                    return True
+                if c not in seen and self._covers(c, b):
+                    first, last, _ = tree[c]
+                    if first <= post <= last:
+                        return True
+                    seen.add(c)
+                    stack.append(c)
+        return False
+
+    def has_path(self, source, target):
+        """Return True if `G` has a path from `source` to `target`.
+
+        Raises
+        ------
+        NodeNotFound
+            If `source` or `target` is not in the index.
+        """
+        a = self._find(source)
+        b = self._find(target)
+        return a == b or self._reaches(a, b)
+
+    def _closure(self, n, adj):
+        start = self._find(n)
+        seen = {start}
+        stack = [start]
+        nodes = set()
+        while stack:
+            c = stack.pop()
+            nodes.update(self._members[c])
+            for d in adj[c]:
+                if d not in seen:
+                    seen.add(d)
+                    stack.append(d)
+        nodes.discard(n)
+        return nodes
+
+    def descendants(self, source):
+        """Return the set of nodes reachable from `source`, other than
+        `source`."""
+        return self._closure(source, self._succ)
+
+    def ancestors(self, source):
+        """Return the set of nodes having a path to `source`, other than
+        `source`."""
+        return self._closure(source, self._pred)
+
+    def add_node(self, n, **attr):
+        """Add the node `n` to `G` and to the index."""
+        self.G.add_node(n, **attr)
+        if n not in self._component:
+            self._new_component(n)
+
+    def add_edge(self, u, v, **attr):
+        """Add the edge from `u` to `v` to `G` and update the index.
+
+        The nodes are added if they are not in `G` already. Edge
+        attributes can be given as keywords, as for
+        :meth:`DiGraph.add_edge`.
+        """
+        self.G.add_edge(u, v, **attr)
+        a = self._component.get(u)
+        if a is None:
+            a = self._new_component(u)
+        b = self._component.get(v)
+        if b is None:
+            b = self._new_component(v)
+        if a == b or b in self._succ[a]:
+            return
+        if self._reaches(b, a):
+            self._merge(a, b)
+            return
+        self._succ[a].add(b)
+        self._pred[b].add(a)
+        self._enlarge([a], self._labels[b])
+
+    def _enlarge(self, components, labels):
+        """Enlarge the intervals of `components` and of the components
+        reaching them until they contain `labels`."""
+        stack = list(components)
+        while stack:
+            c = stack.pop()
+            old = self._labels[c]
+            new = [(min(low, l), max(high, h))
+                   for (low, high), (l, h) in zip(old, labels)]
+            if new != old:
+                self._labels[c] = new
+                stack.extend(self._pred[c])
+
+    def _merge(self, a, b):
+        """Merge the components on the paths from `b` to `a`, which the
+        edge from `a` to `b` turns into cycles."""
+        # The components reaching a that b may reach...
+        reaching = {a}
+        stack = [a]
+        while stack:
+            for c in self._pred[stack.pop()]:
+                if c not in reaching and self._covers(b, c):
+                    reaching.add(c)
+                    stack.append(c)
+        # ... among which those that b reaches are on the paths.
+        cycle = {b}
+        stack = [b]
+        while stack:
+            for c in self._succ[stack.pop()]:
+                if c in reaching and c not in cycle:
+                    cycle.add(c)
+                    stack.append(c)
+
+        m = self._next
+        self._next += 1
+        members = set()
+        succ = set()
+        pred = set()
+        for c in cycle:
+            members.update(self._members.pop(c))
+            succ.update(self._succ.pop(c))
+            pred.update(self._pred.pop(c))
+        succ -= cycle
+        pred -= cycle
+        for c in succ:
+            self._pred[c] -= cycle
+            self._pred[c].add(m)
+        for c in pred:
+            self._succ[c] -= cycle
+            self._succ[c].add(m)
+        self._members[m] = members
+        self._succ[m] = succ
+        self._pred[m] = pred
+        for n in members:
+            self._component[n] = m
+        # Each GRAIL interval of the new component covers those of the
+        # merged ones. It reaches the subtree of any of them and is
+        # reached by what reached the postorder number of any of them.
+        labels = [self._labels.pop(c) for c in cycle]
+        self._labels[m] = [(min(l[i][0] for l in labels),
+                            max(l[i][1] for l in labels))
+                           for i in range(self._num_labels)]
+        trees = [self._tree.pop(c) for c in cycle]
+        first, last, post = max(trees, key=lambda t: t[1] - t[0])
+        self._tree[m] = (first, last, post)
+        self._enlarge(pred, self._labels[m])
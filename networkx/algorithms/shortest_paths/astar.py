@@ -10,17 +10,22 @@
 #          Matteo Dell'Amico <matteodellamico@gmail.com>
 """Shortest paths and path lengths using the A* ("A star") algorithm.
 """
+from __future__ import division
+
 from heapq import heappush, heappop
 from itertools import count
 
 import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
 from networkx.utils import not_implemented_for
+from networkx.utils.heaps import _heap_factory
 
-__all__ = ['astar_path', 'astar_path_length']
+__all__ = ['astar_path', 'astar_path_length', 'bidirectional_astar']
 
 
 @not_implemented_for('multigraph')
-def astar_path(G, source, target, heuristic=None, weight='weight'):
+def astar_path(G, source, target, heuristic=None, weight='weight',
+               heap=None):
     """Return a list of nodes in a shortest path between source and target
     using the A* ("A-star") algorithm.
 
@@ -44,6 +49,14 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
     weight: string, optional (default='weight')
        Edge data key corresponding to the edge weight.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       'radix' heap requires integer weights and an integer-valued
+       consistent heuristic.
+
     Raises
     ------
     NetworkXNoPath
@@ -78,6 +91,10 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
         def heuristic(u, v):
             return 0
 
+    if heap is not None:
+        return _astar_path_minheap(G, source, target, heuristic, weight,
+                                   _heap_factory(heap))
+
     push = heappush
     pop = heappop
 
@@ -134,7 +151,56 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
     raise nx.NetworkXNoPath("Node %s not reachable from %s" % (source, target))
 
 
-def astar_path_length(G, source, target, heuristic=None, weight='weight'):
+def _astar_path_minheap(G, source, target, heuristic, weight, make_heap):
+    """A* search on top of a :class:`~networkx.utils.MinHeap`.
+
+    Each node has at most one entry in the queue, whose priority is
+    decreased in place when a shorter path to it is found.
+
+    """
+    h = heuristic(source, target)
+    queue = make_heap()
+    queue.insert(source, h)
+    # Maps enqueued nodes to the distance of the best discovered path and
+    # the computed heuristic to target.
+    enqueued = {source: (0, h)}
+    parents = {source: None}
+    explored = set()
+
+    while queue:
+        curnode, _ = queue.pop()
+
+        if curnode == target:
+            path = [curnode]
+            node = parents[curnode]
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            path.reverse()
+            return path
+
+        explored.add(curnode)
+        dist = enqueued[curnode][0]
+
+        for neighbor, w in G[curnode].items():
+            if neighbor in explored:
+                continue
+            ncost = dist + w.get(weight, 1)
+            if neighbor in enqueued:
+                qcost, h = enqueued[neighbor]
+                if qcost <= ncost:
+                    continue
+            else:
+                h = heuristic(neighbor, target)
+            enqueued[neighbor] = ncost, h
+            parents[neighbor] = curnode
+            queue.insert(neighbor, ncost + h)
+
+    raise nx.NetworkXNoPath("Node %s not reachable from %s" % (source, target))
+
+
+def astar_path_length(G, source, target, heuristic=None, weight='weight',
+                      heap=None):
     """Return the length of the shortest path between source and target using
     the A* ("A-star") algorithm.
 
@@ -153,6 +219,17 @@ def astar_path_length(G, source, target, heuristic=None, weight='weight'):
        from the a node to the target.  The function takes
        two nodes arguments and must return a number.
 
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight.
+
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       'radix' heap requires integer weights and an integer-valued
+       consistent heuristic.
+
     Raises
     ------
     NetworkXNoPath
@@ -167,5 +244,200 @@ def astar_path_length(G, source, target, heuristic=None, weight='weight'):
         msg = 'Either source {} or target {} is not in G'
         raise nx.NodeNotFound(msg.format(source, target))
 
-    path = astar_path(G, source, target, heuristic, weight)
+    path = astar_path(G, source, target, heuristic, weight, heap)
     return sum(G[u][v].get(weight, 1) for u, v in zip(path[:-1], path[1:]))
+
+
+def bidirectional_astar(G, source, target, heuristic=None, weight='weight'):
+    r"""Return the length and a shortest path between source and target
+    using bidirectional A* search.
+
+    A forward search from `source` and a backward search from `target`
+    are guided by the average potential [1]_
+
+    .. math::
+
+        p(v) = \frac{h(v, t) - h(s, v)}{2},
+
+    which the forward search adds to and the backward search subtracts
+    from the distance of each node `v`, where `h` is the heuristic, `s`
+    the source and `t` the target. The search stops as soon as the sum of
+    the smallest keys of the two searches reaches the length of the
+    shortest path found so far.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+       Starting node for path
+
+    target : node
+       Ending node for path
+
+    heuristic : function
+       A function to evaluate the estimate of the distance
+       from the a node to the target.  The function takes
+       two nodes arguments and must return a number.
+       It is also called with the source as first argument to estimate
+       the distance from the source to a node.
+
+    weight : string or function, optional (default='weight')
+       If this is a string, then edge weights will be accessed via the
+       edge attribute with this key (that is, the weight of the edge
+       joining `u` to `v` will be ``G.edge[u][v][weight]``). If no
+       such edge attribute exists, the weight of the edge is assumed to
+       be one.
+
+       If this is a function, the weight of an edge is the value
+       returned by the function. The function must accept exactly three
+       positional arguments: the two endpoints of an edge and the
+       dictionary of edge attributes for that edge. The function must
+       return a number or None to hide the edge.
+
+    Returns
+    -------
+    length : number
+        Shortest path length.
+
+    path : list
+        List of nodes in a shortest path.
+
+    Raises
+    ------
+    NodeNotFound
+        If either `source` or `target` is not in `G`.
+
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> def manhattan(a, b):
+    ...    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    >>> length, path = nx.bidirectional_astar(G, (0, 0), (9, 9), manhattan)
+    >>> length
+    18
+    >>> length == nx.astar_path_length(G, (0, 0), (9, 9), manhattan)
+    True
+
+    Notes
+    -----
+    The heuristic must be consistent in both directions, that is
+    ``h(u, t) <= w(u, v) + h(v, t)`` and ``h(s, v) <= h(s, u) + w(u, v)``
+    for every edge `(u, v)` of weight `w(u, v)`, as is the case for a
+    distance between node positions that never exceeds the edge weights.
+    Then the length is the same as the one found by :func:`astar_path`,
+    although the path may differ if there are several shortest paths.
+
+    Without heuristic, this is a bidirectional Dijkstra search.
+
+    See Also
+    --------
+    astar_path, bidirectional_dijkstra
+
+    References
+    ----------
+    .. [1] T. Ikeda, M.-Y. Hsu, H. Imai, S. Nishimura, H. Shimoura,
+       T. Hashimoto, K. Tenmoku and K. Mitoh,
+       "A fast algorithm for finding better routes by AI search
+       techniques", Proceedings of the Vehicle Navigation and Information
+       Systems Conference, 291-296, 1994.
+    """
+    if source not in G or target not in G:
+        msg = 'Either source {} or target {} is not in G'
+        raise nx.NodeNotFound(msg.format(source, target))
+    length, path, _ = _bidirectional_astar(G, source, target, heuristic,
+                                           _weight_function(G, weight))
+    return length, path
+
+
+def _bidirectional_astar(G, source, target, heuristic, weight):
+    """Bidirectional A* search with average potentials.
+
+    Returns the length and a shortest path, and the number of nodes
+    settled by both searches. `weight` is a function as returned by
+    :func:`~networkx.algorithms.shortest_paths.weighted._weight_function`.
+
+    """
+    if source == target:
+        return 0, [source], 0
+    if heuristic is None:
+        def heuristic(u, v):
+            return 0
+    if G.is_directed():
+        adj = [G._succ, G._pred]
+    else:
+        adj = [G._adj, G._adj]
+    cache = {}
+
+    def potential(v):
+        # Potential of the forward search; the backward one is its opposite.
+        try:
+            return cache[v]
+        except KeyError:
+            p = cache[v] = (heuristic(v, target) - heuristic(source, v)) / 2
+            return p
+
+    push = heappush
+    pop = heappop
+    c = count()
+    # Per direction: settled distances, best known distances, parents
+    # and the queue of (key, counter, node, distance).
+    settled = [{}, {}]
+    seen = [{source: 0}, {target: 0}]
+    parents = [{source: None}, {target: None}]
+    fringe = [[(potential(source), next(c), source, 0)],
+              [(-potential(target), next(c), target, 0)]]
+    sign = [1, -1]
+    best = float('inf')
+    meet = None
+    direction = 1
+    while fringe[0] and fringe[1]:
+        if fringe[0][0][0] + fringe[1][0][0] >= best:
+            break
+        direction = 1 - direction
+        _, _, v, dist = pop(fringe[direction])
+        done = settled[direction]
+        if v in done:
+            continue
+        done[v] = dist
+        dist_here = seen[direction]
+        dist_there = seen[1 - direction]
+        parent = parents[direction]
+        for w, d in adj[direction][v].items():
+            if w in done:
+                continue
+            if direction == 0:
+                cost = weight(v, w, d)
+            else:
+                cost = weight(w, v, d)
+            if cost is None:
+                continue
+            vw_dist = dist + cost
+            if w not in dist_here or vw_dist < dist_here[w]:
+                dist_here[w] = vw_dist
+                parent[w] = v
+                push(fringe[direction],
+                     (vw_dist + sign[direction] * potential(w), next(c), w,
+                      vw_dist))
+                if w in dist_there:
+                    total = vw_dist + dist_there[w]
+                    if total < best:
+                        best = total
+                        meet = w
+    if meet is None:
+        raise nx.NetworkXNoPath("Node %s not reachable from %s" %
+                                (target, source))
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = parents[0][node]
+    path.reverse()
+    node = parents[1][meet]
+    while node is not None:
+        path.append(node)
+        node = parents[1][node]
+    return best, path, len(settled[0]) + len(settled[1])
@@ -11,7 +11,210 @@ import networkx as nx
 __author__ = """Aric Hagberg <aric.hagberg@gmail.com>"""
 __all__ = ['floyd_warshall',
            'floyd_warshall_predecessor_and_distance',
-           'floyd_warshall_numpy']
+           'floyd_warshall_numpy',
+           'floyd_warshall_array']
+
+
+def _dense_output(out, shape, dtype):
+    """Return an array of the given shape and dtype to write results to.
+
+    `out` is None (allocate in memory), a filename (create a memory-mapped
+    file) or an existing array of the right shape and dtype.
+    """
+    import numpy as np
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if nx.utils.is_string_like(out):
+        return np.memmap(out, dtype=dtype, mode='w+', shape=shape)
+    if out.shape != shape or out.dtype != dtype:
+        raise nx.NetworkXError('out must be an array of shape %s and dtype %s'
+                               % (shape, dtype))
+    return out
+
+
+def floyd_warshall_array(G, nodelist=None, weight='weight', dtype=None,
+                         predecessors=False, block_size=None, out=None,
+                         pred_out=None):
+    """Find all-pairs shortest path lengths using a blocked, vectorized
+    Floyd's algorithm.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    nodelist : list, optional
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+       If nodelist does not contain every node in `G`, the distances are
+       those of the subgraph induced by the nodes in nodelist.
+
+    weight: string, optional (default= 'weight')
+       Edge data key corresponding to the edge weight. Edges without this
+       attribute have weight one.
+
+    dtype : NumPy floating point data-type, optional (default=numpy.float64)
+       The data type of the distance array. Using `numpy.float32` halves
+       the memory needed.
+
+    predecessors : bool, optional (default=False)
+       If True, also return an array of predecessors.
+
+    block_size : int, optional
+       Number of rows processed together. Temporary arrays hold
+       `block_size` times `n` entries, where `n` is the number of nodes.
+       By default about four million entries are used.
+
+    out : string or array, optional
+       Where to store the distances. If a string, a memory-mapped file of
+       that name is created, so that graphs whose distance matrix does not
+       fit in memory can be handled. If an array, it must have shape
+       ``(n, n)`` and data type `dtype`. By default a new array is
+       allocated.
+
+    pred_out : string or array, optional
+       Where to store the predecessors, as for `out`. The data type of the
+       array is `numpy.int32`, or `numpy.int64` if there are more than
+       ``2**31 - 1`` nodes.
+
+    Returns
+    -------
+    distance : NumPy array
+        An array of shortest path distances between nodes, indexed by the
+        positions of the nodes in nodelist. If there is no path between two
+        nodes the corresponding entry is Inf.
+
+    predecessor : NumPy array
+        Only returned if `predecessors` is True. Entry ``[i, j]`` is the
+        index of the node preceding node ``j`` on a shortest path from node
+        ``i``, or -1 if there is no such path or ``i == j``.
+
+    Raises
+    ------
+    NetworkXError
+        If nodelist contains duplicates, if `dtype` is not a floating point
+        type or if `out` or `pred_out` does not have the right shape and
+        data type.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> dist, pred = nx.floyd_warshall_array(G, predecessors=True)
+    >>> print(dist[0].tolist())
+    [0.0, 1.0, 2.0, 3.0]
+    >>> print(pred[0].tolist())
+    [-1, 0, 1, 2]
+
+    Notes
+    ------
+    The matrix is processed one block of pivot rows at a time. The pivot
+    rows are first closed over their own nodes, and then every other block
+    of rows is relaxed through the pivots with vectorized rank-one updates.
+    This keeps the working set at a few blocks of rows, so a memory-mapped
+    output is accessed in large sequential slices.
+
+    Self loops are ignored. The algorithm can fail if there are negative
+    cycles. It has running time O(n^3) with running space of O(n^2).
+
+    See Also
+    --------
+    floyd_warshall
+    floyd_warshall_numpy
+    floyd_warshall_predecessor_and_distance
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "floyd_warshall_array() requires numpy: http://scipy.org/ ")
+
+    if nodelist is None:
+        nodelist = list(G)
+    n = len(nodelist)
+    index = dict(zip(nodelist, range(n)))
+    if len(index) != n:
+        msg = "Ambiguous ordering: `nodelist` contained duplicates."
+        raise nx.NetworkXError(msg)
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise nx.NetworkXError('dtype must be a floating point type.')
+    if block_size is None:
+        block_size = (1 << 22) // max(n, 1)
+    block_size = max(1, min(n, block_size))
+
+    A = _dense_output(out, (n, n), dtype)
+    if predecessors:
+        pred_dtype = np.dtype(np.int32 if n < 2 ** 31 - 1 else np.int64)
+        P = _dense_output(pred_out, (n, n), pred_dtype)
+
+    # Initialize with the edge weights, one block of rows at a time.
+    G_succ = G._succ if G.is_directed() else G._adj
+    is_multigraph = G.is_multigraph()
+    for i0 in range(0, n, block_size):
+        i1 = min(i0 + block_size, n)
+        A[i0:i1] = np.inf
+        if predecessors:
+            P[i0:i1] = -1
+        rows = []
+        cols = []
+        weights = []
+        for i in range(i0, i1):
+            for v, d in G_succ[nodelist[i]].items():
+                j = index.get(v)
+                if j is None or j == i:
+                    continue
+                if is_multigraph:
+                    w = min(dd.get(weight, 1) for dd in d.values())
+                else:
+                    w = d.get(weight, 1)
+                rows.append(i)
+                cols.append(j)
+                weights.append(w)
+        if rows:
+            np.minimum.at(A, (rows, cols), weights)
+            if predecessors:
+                P[rows, cols] = rows
+        diag = np.arange(i0, i1)
+        A[diag, diag] = 0
+
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+        # Close the pivot rows over the pivots themselves.
+        R = A[k0:k1]
+        PR = P[k0:k1] if predecessors else None
+        _relax_rows(R, PR, R, PR, k0, k1, predecessors)
+        # Relax every other block of rows through the pivots.
+        for i0 in range(0, n, block_size):
+            if i0 == k0:
+                continue
+            i1 = min(i0 + block_size, n)
+            C = A[i0:i1]
+            PC = P[i0:i1] if predecessors else None
+            _relax_rows(C, PC, R, PR, k0, k1, predecessors)
+
+    if predecessors:
+        return A, P
+    return A
+
+
+def _relax_rows(C, PC, R, PR, k0, k1, predecessors):
+    """Relax the rows in C through the pivots k0, ..., k1 - 1, whose rows
+    are R. Arrays are updated in place.
+    """
+    import numpy as np
+    for w in range(k0, k1):
+        col = C[:, w]
+        if not np.isfinite(col).any():
+            continue
+        row = R[w - k0]
+        cand = col[:, None] + row
+        if predecessors:
+            mask = cand < C
+            if mask.any():
+                C[mask] = cand[mask]
+                PC[mask] = np.broadcast_to(PR[w - k0], C.shape)[mask]
+        else:
+            np.minimum(C, cand, out=C)
+
 
 def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
@@ -40,23 +243,19 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     dense graphs or graphs with negative weights when Dijkstra's
     algorithm fails.  This algorithm can still fail if there are
     negative cycles.  It has running time O(n^3) with running space of O(n^2).
+
+    See Also
+    --------
+    floyd_warshall_array
     """
     try:
         import numpy as np
     except ImportError:
         raise ImportError(\
-          "to_numpy_matrix() requires numpy: http://scipy.org/ ")
-
-    # To handle cases when an edge has weight=0, we must make sure that
-    # nonedges are not given the value 0 as well.
-    A = nx.to_numpy_matrix(G, nodelist=nodelist, multigraph_weight=min,
-                              weight=weight, nonedge=np.inf)
-    n,m = A.shape
-    I = np.identity(n)
-    A[I==1] = 0 # diagonal elements should be zero
-    for i in range(n):
-        A = np.minimum(A, A[i,:] + A[:,i])
-    return A
+          "floyd_warshall_numpy() requires numpy: http://scipy.org/ ")
+    return np.asmatrix(floyd_warshall_array(G, nodelist=nodelist,
+                                            weight=weight))
+
 
 def floyd_warshall_predecessor_and_distance(G, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
@@ -81,13 +280,39 @@ def floyd_warshall_predecessor_and_distance(G, weight='weight'):
     fails.  This algorithm can still fail if there are negative cycles.
     It has running time O(n^3) with running space of O(n^2).
 
+    If NumPy is available the distances are computed by
+    :func:`floyd_warshall_array` and are floating point numbers.
+
     See Also
     --------
     floyd_warshall
     floyd_warshall_numpy
+    floyd_warshall_array
     all_pairs_shortest_path
     all_pairs_shortest_path_length
     """
+    try:
+        import numpy as np
+    except ImportError:
+        return _floyd_warshall_python(G, weight=weight)
+    nodelist = list(G)
+    A, P = floyd_warshall_array(G, nodelist=nodelist, weight=weight,
+                                predecessors=True)
+    dist = {u: dict(zip(nodelist, row))
+            for u, row in zip(nodelist, A.tolist())}
+    pred = {}
+    for u, row in zip(nodelist, P):
+        idx = np.flatnonzero(row >= 0)
+        if len(idx):
+            pred[u] = {nodelist[j]: nodelist[i]
+                       for j, i in zip(idx.tolist(), row[idx].tolist())}
+    return pred, dist
+
+
+def _floyd_warshall_python(G, weight='weight'):
+    """Pure Python implementation of
+    :func:`floyd_warshall_predecessor_and_distance`.
+    """
     from collections import defaultdict
     # dictionary-of-dictionaries representation for dist and pred
     # use some defaultdict magick here
@@ -139,15 +364,25 @@ def floyd_warshall(G, weight='weight'):
     fails.  This algorithm can still fail if there are negative cycles.
     It has running time O(n^3) with running space of O(n^2).
 
+    If NumPy is available the distances are computed by
+    :func:`floyd_warshall_array` and are floating point numbers.
+
     See Also
     --------
     floyd_warshall_predecessor_and_distance
     floyd_warshall_numpy
+    floyd_warshall_array
     all_pairs_shortest_path
     all_pairs_shortest_path_length
     """
-    # could make this its own function to reduce memory costs
-    return floyd_warshall_predecessor_and_distance(G, weight=weight)[1]
+    try:
+        import numpy  # noqa: F401 -- only checks that NumPy is available
+    except ImportError:
+        return _floyd_warshall_python(G, weight=weight)[1]
+    nodelist = list(G)
+    A = floyd_warshall_array(G, nodelist=nodelist, weight=weight)
+    return {u: dict(zip(nodelist, row))
+            for u, row in zip(nodelist, A.tolist())}
 
 # fixture for nose tests
 def setup_module(module):
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2017 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""
+Shortest path trees that are kept up to date while the graph changes.
+"""
+from heapq import heappush, heappop
+from itertools import count
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import (_dijkstra,
+                                                         _weight_function)
+
+__all__ = ['DynamicShortestPaths']
+
+
+class DynamicShortestPaths(object):
+    """Single-source shortest paths maintained under edge updates.
+
+    The distances and shortest-path predecessors from `source` are computed
+    once with Dijkstra's algorithm. After that, edge insertions, deletions
+    and weight changes are absorbed incrementally using the algorithm of
+    Ramalingam and Reps [1]_: only the nodes whose distance or predecessors
+    actually change are visited.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph is not copied. Changes to it must either be made through
+        the methods of this object or be reported with :meth:`edge_changed`.
+
+    source : node
+        Starting node for paths.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edge[u][v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number.
+
+    Attributes
+    ----------
+    dist : dict
+        Shortest path length from `source`, keyed by reachable node.
+
+    pred : dict
+        List of predecessors on shortest paths from `source`, keyed by
+        reachable node, as returned by
+        :func:`~networkx.dijkstra_predecessor_and_distance`.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5, create_using=nx.DiGraph())
+    >>> sp = nx.DynamicShortestPaths(G, 0)
+    >>> sp.dist[4]
+    4
+    >>> sp.add_edge(0, 3, weight=2)
+    >>> sp.dist[4]
+    3
+    >>> sp.path(4)
+    [0, 3, 4]
+    >>> sp.remove_edge(0, 3)
+    >>> sp.path(4)
+    [0, 1, 2, 3, 4]
+
+    Notes
+    -----
+    Edge weights must be nonnegative and there must be no cycle of
+    zero-weight edges. The weight function can be used to hide edges by
+    returning None.
+
+    An update costs time proportional to the number of nodes whose
+    distance or set of predecessors changes, plus their incident edges,
+    times a logarithmic factor. To keep trees from several sources up to
+    date, create one object per source.
+
+    References
+    ----------
+    .. [1] G. Ramalingam and T. Reps,
+       "An incremental algorithm for a generalization of the shortest-path
+       problem", Journal of Algorithms 21(2):267-305, 1996.
+
+    """
+
+    def __init__(self, G, source, weight='weight'):
+        if source not in G:
+            raise nx.NodeNotFound("Node %s is not found in the graph" % source)
+        self.G = G
+        self.source = source
+        self._weight = _weight_function(G, weight)
+        self.pred = {source: []}
+        self.dist = _dijkstra(G, source, self._weight, pred=self.pred)
+
+    def _succ(self):
+        G = self.G
+        return G._succ if G.is_directed() else G._adj
+
+    def _preds(self):
+        G = self.G
+        return G._pred if G.is_directed() else G._adj
+
+    def _cost(self, u, v):
+        """Return the weight of the edge from u to v, or None if there is no
+        such edge or it is hidden by the weight function.
+        """
+        nbrs = self._succ().get(u)
+        if nbrs is None or v not in nbrs:
+            return None
+        cost = self._weight(u, v, nbrs[v])
+        if cost is not None and cost < 0:
+            raise ValueError('Contradictory paths found: negative weights?')
+        return cost
+
+    def path(self, target):
+        """Return a shortest path from the source to `target`.
+
+        Raises
+        ------
+        NetworkXNoPath
+            If `target` is not reachable from the source.
+        """
+        if target not in self.dist:
+            raise nx.NetworkXNoPath(
+                "Node %s not reachable from %s" % (target, self.source))
+        path = [target]
+        pred = self.pred
+        while pred[target]:
+            target = pred[target][0]
+            path.append(target)
+        path.reverse()
+        return path
+
+    def add_edge(self, u, v, key=None, **attr):
+        """Add an edge to the graph, or update the attributes of an existing
+        edge, and update the shortest paths.
+
+        The arguments are as for :meth:`Graph.add_edge`; `key` is only used
+        for multigraphs.
+        """
+        if self.G.is_multigraph():
+            self.G.add_edge(u, v, key=key, **attr)
+        else:
+            self.G.add_edge(u, v, **attr)
+        self.edge_changed(u, v)
+
+    def remove_edge(self, u, v, key=None):
+        """Remove an edge from the graph and update the shortest paths.
+
+        The arguments are as for :meth:`Graph.remove_edge`; `key` is only
+        used for multigraphs.
+        """
+        if self.G.is_multigraph():
+            self.G.remove_edge(u, v, key=key)
+        else:
+            self.G.remove_edge(u, v)
+        self.edge_changed(u, v)
+
+    def remove_node(self, n):
+        """Remove a node from the graph and update the shortest paths.
+
+        Raises
+        ------
+        NetworkXError
+            If `n` is the source.
+        """
+        if n == self.source:
+            raise nx.NetworkXError('the source cannot be removed.')
+        succ = list(self._succ().get(n, ()))
+        self.G.remove_node(n)
+        if n in self.dist:
+            del self.dist[n]
+            del self.pred[n]
+            self._update([(n, v) for v in succ if v != n])
+
+    def edge_changed(self, u, v):
+        """Update the shortest paths after the edge joining `u` and `v` was
+        added, removed or had its weight changed directly in the graph.
+
+        Each change must be reported before the graph is changed again.
+        """
+        if self.G.is_directed():
+            self._update([(u, v)])
+        else:
+            self._update([(u, v), (v, u)])
+
+    def _update(self, edges):
+        """Repair the distances and predecessors after the weights of the
+        given directed edges changed.
+        """
+        self._increase(edges)
+        self._decrease(edges)
+
+    def _increase(self, edges):
+        """Handle edges that are no longer tight, that is, no longer lie on
+        a shortest path because they were removed or became heavier.
+        """
+        dist = self.dist
+        pred = self.pred
+        work = []
+        for u, v in edges:
+            if v not in pred or u not in pred[v]:
+                continue
+            cost = self._cost(u, v)
+            if cost is not None and u in dist and dist[u] + cost <= dist[v]:
+                # The edge is still tight, or became lighter.
+                continue
+            pred[v].remove(u)
+            if not pred[v]:
+                work.append(v)
+        if not work:
+            return
+
+        # Phase 1: a node is affected if all of its shortest paths from the
+        # source run through one of the changed edges, that is, if all its
+        # predecessors are affected. The distance of every affected node
+        # strictly increases and every other distance stays the same.
+        succ = self._succ()
+        affected = set()
+        while work:
+            x = work.pop()
+            if x in affected:
+                continue
+            affected.add(x)
+            for y in succ.get(x, ()):
+                if y in affected or y not in pred:
+                    continue
+                pred_y = pred[y]
+                if x in pred_y:
+                    pred_y.remove(x)
+                    if not pred_y:
+                        work.append(y)
+        for x in affected:
+            del dist[x]
+            del pred[x]
+
+        # Phase 2: compute the new distances of the affected nodes with
+        # Dijkstra's algorithm, seeded with the best edge from an unaffected
+        # node into each affected one.
+        preds = self._preds()
+        cost = self._cost
+        push = heappush
+        pop = heappop
+        c = count()
+        fringe = []
+        for x in affected:
+            if x not in preds:
+                # The node was removed from the graph.
+                continue
+            best = None
+            for p in preds[x]:
+                if p in dist:
+                    w = cost(p, x)
+                    if w is not None and (best is None or
+                                          dist[p] + w < best):
+                        best = dist[p] + w
+            if best is not None:
+                push(fringe, (best, next(c), x))
+        while fringe:
+            d, _, x = pop(fringe)
+            if x in dist:
+                continue
+            dist[x] = d
+            for y in succ[x]:
+                if y in affected and y not in dist:
+                    w = cost(x, y)
+                    if w is not None:
+                        push(fringe, (d + w, next(c), y))
+
+        # The predecessors of an affected node are its tight in-neighbors.
+        # Since affected distances strictly increased, no unaffected node
+        # gains an affected predecessor.
+        for x in affected:
+            if x in dist:
+                pred_x = pred[x] = []
+                for p in preds[x]:
+                    if p in dist:
+                        w = cost(p, x)
+                        if w is not None and dist[p] + w == dist[x]:
+                            pred_x.append(p)
+
+    def _decrease(self, edges):
+        """Handle edges that may now lie on shorter paths, because they were
+        added or became lighter.
+        """
+        dist = self.dist
+        pred = self.pred
+        succ = self._succ()
+        cost = self._cost
+        inf = float('inf')
+        push = heappush
+        pop = heappop
+        c = count()
+        source = self.source
+        fringe = []
+        for u, v in edges:
+            if u not in dist or v == source:
+                continue
+            w = cost(u, v)
+            if w is None:
+                continue
+            d = dist[u] + w
+            old = dist.get(v, inf)
+            if d < old:
+                push(fringe, (d, next(c), v, u))
+            elif d == old and u not in pred[v]:
+                pred[v].append(u)
+        while fringe:
+            d, _, x, p = pop(fringe)
+            old = dist.get(x, inf)
+            if d == old:
+                if p not in pred[x]:
+                    pred[x].append(p)
+                continue
+            if d > old:
+                continue
+            dist[x] = d
+            pred[x] = [p]
+            for y in succ[x]:
+                w = cost(x, y)
+                if w is None or y == source:
+                    continue
+                dy = d + w
+                old = dist.get(y, inf)
+                if dy < old:
+                    push(fringe, (dy, next(c), y, x))
+                elif dy == old and x not in pred[y]:
+                    pred[y].append(x)
@@ -16,11 +16,14 @@ These algorithms work with undirected and directed graphs.
 """
 from __future__ import division
 
+import random
+
 import networkx as nx
 
 __all__ = ['shortest_path', 'all_shortest_paths',
            'shortest_path_length', 'average_shortest_path_length',
-           'has_path']
+           'has_path', 'shortest_path_dag', 'number_of_shortest_paths',
+           'sample_shortest_paths']
 
 
 def has_path(G, source, target):
@@ -35,6 +38,10 @@ def has_path(G, source, target):
 
     target : node
        Ending node for path
+
+    See Also
+    --------
+    ReachabilityIndex : answers repeated queries on directed graphs.
     """
     try:
         sp = nx.shortest_path(G, source, target)
@@ -310,6 +317,10 @@ def average_shortest_path_length(G, weight=None):
     1.0
     1.0
 
+    See Also
+    --------
+    networkx.algorithms.approximation.distance_measures.average_shortest_path_length
+
     """
     n = len(G)
     # For the special case of the null graph, raise an exception, since
@@ -371,12 +382,16 @@ def all_shortest_paths(G, source, target, weight=None):
     Notes
     -----
     There may be many shortest paths between the source and target.
+    Use :func:`number_of_shortest_paths` to count them and
+    :func:`sample_shortest_paths` to draw some of them at random.
 
     See Also
     --------
     shortest_path()
     single_source_shortest_path()
     all_pairs_shortest_path()
+    shortest_path_dag()
+    number_of_shortest_paths()
     """
     if weight is not None:
         pred, dist = nx.dijkstra_predecessor_and_distance(G, source,
@@ -405,3 +420,277 @@ def all_shortest_paths(G, source, target, weight=None):
         else:
             stack[top-1][1] += 1
             top -= 1
+
+
+def shortest_path_dag(G, source, target=None, weight=None):
+    """Returns the shortest path DAG of `G` rooted at `source`, together
+    with the number of shortest paths reaching each of its nodes.
+
+    The shortest path DAG contains the edges of `G` that lie on at least
+    one shortest path from `source`. It describes all shortest paths
+    without enumerating them, whose number can grow exponentially.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+       Starting node for paths.
+
+    target : node, optional (default = None)
+       If given, the DAG is restricted to the nodes and edges lying on a
+       shortest path from `source` to `target`.
+
+    weight : None or string, optional (default = None)
+       If None, every edge has weight/distance/cost 1.
+       If a string, use this edge attribute as the edge weight.
+       Any edge attribute not present defaults to 1.
+
+    Returns
+    -------
+    pred : dictionary
+        Keyed by the nodes of the DAG, the list of their predecessors on
+        shortest paths from `source`.
+
+    sigma : dictionary
+        Keyed by the nodes of the DAG, the number of shortest paths from
+        `source` to them.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    NetworkXNoPath
+        If `target` is given and is not reachable from `source`.
+
+    NetworkXError
+        If edges of weight zero form a cycle on shortest paths.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(3, 3)
+    >>> pred, sigma = nx.shortest_path_dag(G, (0, 0))
+    >>> sigma[(2, 2)]
+    6
+    >>> sorted(pred[(1, 1)])
+    [(0, 1), (1, 0)]
+    >>> pred, sigma = nx.shortest_path_dag(G, (0, 0), target=(0, 2))
+    >>> sorted(pred)
+    [(0, 0), (0, 1), (0, 2)]
+
+    Notes
+    -----
+    The counts are exact integers. The predecessors of a node are all the
+    nodes `u` with an edge to it such that the distance to `u` plus the
+    weight of the edge is the distance to the node. Edges of weight zero
+    are allowed as long as those lying on shortest paths form no cycle;
+    an undirected edge of weight zero is such a cycle.
+
+    See Also
+    --------
+    number_of_shortest_paths
+    sample_shortest_paths
+    all_shortest_paths
+    """
+    if source not in G:
+        raise nx.NodeNotFound('Source {} is not in G'.format(source))
+    if weight is not None:
+        pred = _tight_predecessors(G, source, weight)
+    else:
+        pred = nx.predecessor(G, source)
+    if target is not None:
+        if target not in pred:
+            raise nx.NetworkXNoPath('Target {} cannot be reached '
+                                    'from Source {}'.format(target, source))
+        # Keep the nodes from which target is reachable in the DAG.
+        keep = {target}
+        stack = [target]
+        while stack:
+            for p in pred[stack.pop()]:
+                if p not in keep:
+                    keep.add(p)
+                    stack.append(p)
+        pred = {v: pred[v] for v in keep}
+    return pred, _count_paths(pred, source)
+
+
+def _tight_predecessors(G, source, weight):
+    """Returns the lists of predecessors on weighted shortest paths from
+    `source`, found from the final distances over all the edges.
+
+    The predecessor lists kept by Dijkstra's algorithm can miss a
+    predecessor reaching an already settled node over an edge of weight
+    zero.
+    """
+    from networkx.algorithms.shortest_paths.weighted import _weight_function
+    weight = _weight_function(G, weight)
+    dist = nx.single_source_dijkstra_path_length(G, source, weight=weight)
+    dist = dict(dist)
+    succ = G._succ if G.is_directed() else G._adj
+    pred = {v: [] for v in dist}
+    for u, du in dist.items():
+        for v, e in succ[u].items():
+            if v not in dist:
+                continue
+            w = weight(u, v, e)
+            if w is not None and du + w == dist[v] and v != source:
+                pred[v].append(u)
+    return pred
+
+
+def _count_paths(pred, source):
+    """Returns the number of paths from `source` to each node of the DAG
+    given by the predecessor lists `pred`.
+
+    Raises NetworkXError if the predecessors form a cycle.
+    """
+    sigma = {source: 1}
+    for v in pred:
+        if v in sigma:
+            continue
+        # Iterative depth-first search along the predecessors.
+        path = {v}
+        stack = [(v, iter(pred[v]))]
+        while stack:
+            w, preds = stack[-1]
+            for p in preds:
+                if p in sigma:
+                    continue
+                if p in path:
+                    raise nx.NetworkXError('Edges of weight zero form a '
+                                           'cycle on shortest paths.')
+                path.add(p)
+                stack.append((p, iter(pred[p])))
+                break
+            else:
+                stack.pop()
+                path.discard(w)
+                sigma[w] = sum(sigma[p] for p in pred[w])
+    return sigma
+
+
+def number_of_shortest_paths(G, source, target, weight=None):
+    """Returns the number of shortest paths from `source` to `target`.
+
+    The paths are counted on the shortest path DAG, without being
+    enumerated.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+       Starting node for paths.
+
+    target : node
+       Ending node for paths.
+
+    weight : None or string, optional (default = None)
+       If None, every edge has weight/distance/cost 1.
+       If a string, use this edge attribute as the edge weight.
+       Any edge attribute not present defaults to 1.
+
+    Returns
+    -------
+    n : integer
+        The number of shortest paths, or 0 if `target` is not reachable
+        from `source`.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> nx.number_of_shortest_paths(G, (0, 0), (9, 9))
+    48620
+
+    See Also
+    --------
+    shortest_path_dag
+    all_shortest_paths
+    """
+    try:
+        pred, sigma = shortest_path_dag(G, source, target, weight=weight)
+    except nx.NetworkXNoPath:
+        return 0
+    return sigma[target]
+
+
+def sample_shortest_paths(G, source, target, k=1, weight=None, seed=None):
+    """Returns shortest paths from `source` to `target` drawn uniformly at
+    random.
+
+    Each path is drawn independently with the same probability among all
+    shortest paths, by walking back from `target` on the shortest path DAG
+    and choosing each predecessor with probability proportional to its
+    number of shortest paths. The DAG is computed once, so drawing a path
+    costs time proportional to its length.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+       Starting node for paths.
+
+    target : node
+       Ending node for paths.
+
+    k : integer, optional (default = 1)
+       The number of paths to draw, with replacement.
+
+    weight : None or string, optional (default = None)
+       If None, every edge has weight/distance/cost 1.
+       If a string, use this edge attribute as the edge weight.
+       Any edge attribute not present defaults to 1.
+
+    seed : integer, optional
+       Seed for random number generator.
+
+    Returns
+    -------
+    paths : list of lists
+        The `k` paths drawn.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    NetworkXNoPath
+        If `target` is not reachable from `source`.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(4)
+    >>> path, = nx.sample_shortest_paths(G, 0, 2)
+    >>> path in ([0, 1, 2], [0, 3, 2])
+    True
+
+    See Also
+    --------
+    shortest_path_dag
+    all_shortest_paths
+    """
+    if seed is not None:
+        random.seed(seed)
+    pred, sigma = shortest_path_dag(G, source, target, weight=weight)
+    paths = []
+    for _ in range(k):
+        path = [target]
+        v = target
+        while v != source:
+            r = random.randrange(sigma[v])
+            for p in pred[v]:
+                r -= sigma[p]
+                if r < 0:
+                    break
+            path.append(p)
+            v = p
+        path.reverse()
+        paths.append(path)
+    return paths
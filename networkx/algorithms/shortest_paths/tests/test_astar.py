@@ -1,9 +1,10 @@
+from nose.tools import assert_almost_equal
 from nose.tools import assert_equal
 from nose.tools import assert_raises
 from nose.tools import raises
 
 from math import sqrt
-from random import random, choice
+from random import random, choice, seed
 
 import networkx as nx
 from networkx.utils import pairwise
@@ -45,6 +46,26 @@ class TestAStar:
         path = nx.astar_path(G, points[0], points[-1], dist)
         assert_equal(path, nx.dijkstra_path(G, points[0], points[-1]))
 
+    def test_heaps(self):
+        G = nx.grid_2d_graph(6, 6)
+        for u, v in G.edges():
+            G[u][v]['weight'] = (u[0] * 7 + v[1] * 3) % 5 + 1
+
+        def manhattan(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+        expected = nx.dijkstra_path_length(G, (0, 0), (5, 4))
+        for heap in ('binary', 'dary', 'pairing', 'radix'):
+            path = nx.astar_path(G, (0, 0), (5, 4), manhattan, heap=heap)
+            assert_equal(sum(G[u][v]['weight'] for u, v in pairwise(path)),
+                         expected)
+            assert_equal(nx.astar_path_length(G, (0, 0), (5, 4), manhattan,
+                                              heap=heap), expected)
+        assert_equal(nx.astar_path(self.XG, 's', 'v', heap='pairing'),
+                     ['s', 'x', 'u', 'v'])
+        G = nx.Graph([(0, 1), (2, 3)])
+        assert_raises(nx.NetworkXNoPath, nx.astar_path, G, 0, 3, heap='dary')
+
     def test_astar_directed(self):
         assert_equal(nx.astar_path(self.XG, 's', 'v'), ['s', 'x', 'u', 'v'])
         assert_equal(nx.astar_path_length(self.XG, 's', 'v'), 9)
@@ -136,3 +157,84 @@ class TestAStar:
         G.add_edges_from(pairwise(nodes, cyclic=True))
         path = nx.astar_path(G, nodes[0], nodes[2])
         assert_equal(len(path), 3)
+
+
+class TestBidirectionalAStar:
+
+    def setUp(self):
+        edges = [('s', 'u', 10), ('s', 'x', 5), ('u', 'v', 1), ('u', 'x', 2),
+                 ('v', 'y', 1), ('x', 'u', 3), ('x', 'v', 5), ('x', 'y', 2),
+                 ('y', 's', 7), ('y', 'v', 6)]
+        self.XG = nx.DiGraph()
+        self.XG.add_weighted_edges_from(edges)
+
+    def check(self, G, source, target, heuristic=None, weight='weight'):
+        length, path = nx.bidirectional_astar(G, source, target, heuristic,
+                                              weight)
+        assert_equal(path[0], source)
+        assert_equal(path[-1], target)
+        expected = nx.dijkstra_path_length(G, source, target, weight=weight)
+        assert_almost_equal(length, expected)
+        if not callable(weight):
+            assert_almost_equal(sum(G[u][v].get(weight, 1)
+                                    for u, v in pairwise(path)), expected)
+
+    def test_directed(self):
+        assert_equal(nx.bidirectional_astar(self.XG, 's', 'v'),
+                     (9, ['s', 'x', 'u', 'v']))
+        for s in self.XG:
+            for t in self.XG:
+                self.check(self.XG, s, t)
+
+    def test_grid(self):
+        G = nx.grid_2d_graph(8, 8)
+        for u, v in G.edges():
+            G[u][v]['weight'] = (u[0] * 7 + v[1] * 3) % 5 + 1
+
+        def manhattan(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+        for target in [(7, 7), (0, 5), (3, 3)]:
+            self.check(G, (0, 0), target, manhattan)
+            assert_equal(nx.bidirectional_astar(G, (0, 0), target)[0],
+                         nx.astar_path_length(G, (0, 0), target, manhattan))
+
+    def test_random_geometric_graph(self):
+        seed(1)
+        for _ in range(10):
+            G = nx.DiGraph(nx.random_geometric_graph(50, 0.3))
+            pos = nx.get_node_attributes(G, 'pos')
+            for u, v in G.edges():
+                # Longer than the straight line, except some edges.
+                G[u][v]['weight'] = dist(pos[u], pos[v]) * choice([1, 1, 3])
+
+            def heuristic(a, b):
+                return dist(pos[a], pos[b])
+
+            s, t = choice(list(G)), choice(list(G))
+            if nx.has_path(G, s, t):
+                self.check(G, s, t, heuristic)
+            else:
+                assert_raises(nx.NetworkXNoPath, nx.bidirectional_astar,
+                              G, s, t, heuristic)
+
+    def test_weight_function(self):
+        G = nx.MultiGraph([(0, 1, {'w': 3}), (0, 1, {'w': 1}), (1, 2),
+                           (0, 2, {'w': 5})])
+        assert_equal(nx.bidirectional_astar(G, 0, 2, weight='w'),
+                     (2, [0, 1, 2]))
+
+        def hide(u, v, d):
+            return None if {u, v} == {0, 1} else 1
+
+        self.check(nx.cycle_graph(5), 0, 2, weight=hide)
+        assert_equal(nx.bidirectional_astar(nx.cycle_graph(5), 0, 2,
+                                            weight=hide),
+                     (3, [0, 4, 3, 2]))
+
+    def test_trivial_and_errors(self):
+        assert_equal(nx.bidirectional_astar(self.XG, 's', 's'), (0, ['s']))
+        assert_raises(nx.NodeNotFound, nx.bidirectional_astar,
+                      self.XG, 's', 'moon')
+        G = nx.Graph([(0, 1), (2, 3)])
+        assert_raises(nx.NetworkXNoPath, nx.bidirectional_astar, G, 0, 3)
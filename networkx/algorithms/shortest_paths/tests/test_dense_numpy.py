@@ -65,3 +65,100 @@ class TestFloydNumpy(object):
         dist = nx.floyd_warshall_numpy(G)
         assert_equal(int(numpy.min(dist)), -14)
 
+
+    def _random_graph(self, n, p, seed, directed=True):
+        G = nx.gnp_random_graph(n, p, seed=seed, directed=directed)
+        for u, v in G.edges():
+            G[u][v]['weight'] = (u * 7 + v * 3) % 10 + 1
+        return G
+
+    def _expected(self, G, nodelist):
+        n = len(nodelist)
+        index = {u: i for i, u in enumerate(nodelist)}
+        expected = numpy.full((n, n), numpy.inf)
+        for u, lengths in nx.all_pairs_dijkstra_path_length(G):
+            for v, d in lengths.items():
+                expected[index[u], index[v]] = d
+        return expected
+
+    def test_array_blocks(self):
+        for directed in (True, False):
+            G = self._random_graph(30, 0.1, 1, directed)
+            nodelist = list(G)
+            expected = self._expected(G, nodelist)
+            for block_size in (1, 4, 7, 30, None):
+                dist = nx.floyd_warshall_array(G, block_size=block_size)
+                assert_equal(dist, expected)
+
+    def test_array_predecessors(self):
+        G = self._random_graph(25, 0.15, 2)
+        dist, pred = nx.floyd_warshall_array(G, predecessors=True,
+                                             block_size=6)
+        assert_equal(dist, self._expected(G, list(G)))
+        for i in G:
+            assert_equal(pred[i, i], -1)
+            for j in G:
+                if i == j or numpy.isinf(dist[i, j]):
+                    continue
+                # Walking the predecessors back to i gives a shortest path.
+                length = 0
+                v = j
+                while v != i:
+                    u = pred[i, v]
+                    length += G[u][v]['weight']
+                    v = u
+                assert_equal(length, dist[i, j])
+
+    def test_array_dtype_and_nodelist(self):
+        G = self._random_graph(20, 0.2, 3)
+        nodelist = list(reversed(list(G)))[:15]
+        dist = nx.floyd_warshall_array(G, nodelist=nodelist,
+                                       dtype=numpy.float32, block_size=4)
+        assert_equal(dist.dtype, numpy.float32)
+        assert_equal(dist, self._expected(G.subgraph(nodelist), nodelist))
+        assert_raises(nx.NetworkXError, nx.floyd_warshall_array, G,
+                      dtype=int)
+        assert_raises(nx.NetworkXError, nx.floyd_warshall_array, G,
+                      nodelist=[0, 0])
+
+    def test_array_memmap(self):
+        import os
+        import shutil
+        import tempfile
+        G = self._random_graph(20, 0.2, 4)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fname = os.path.join(tmpdir, 'dist.dat')
+            pname = os.path.join(tmpdir, 'pred.dat')
+            dist, pred = nx.floyd_warshall_array(G, predecessors=True,
+                                                 out=fname, pred_out=pname,
+                                                 block_size=3)
+            assert_true(isinstance(dist, numpy.memmap))
+            dist.flush()
+            stored = numpy.memmap(fname, dtype=numpy.float64, mode='r',
+                                  shape=(20, 20))
+            assert_equal(stored, self._expected(G, list(G)))
+            del dist, pred, stored
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_array_out(self):
+        G = self._random_graph(10, 0.3, 5)
+        out = numpy.empty((10, 10))
+        dist = nx.floyd_warshall_array(G, out=out)
+        assert_true(dist is out)
+        assert_raises(nx.NetworkXError, nx.floyd_warshall_array, G,
+                      out=numpy.empty((3, 3)))
+
+    def test_dict_matches_python(self):
+        from networkx.algorithms.shortest_paths.dense import \
+            _floyd_warshall_python
+        G = nx.MultiGraph(self._random_graph(15, 0.3, 6, directed=False))
+        G.add_edge(0, 1, weight=0.5)
+        pred, dist = nx.floyd_warshall_predecessor_and_distance(G)
+        expected_pred, expected_dist = _floyd_warshall_python(G)
+        assert_equal(dist, {u: dict(d) for u, d in expected_dist.items()})
+        assert_equal(nx.floyd_warshall(G), dist)
+        assert_equal(set(pred), set(expected_pred))
+        for u in pred:
+            assert_equal(set(pred[u]), set(expected_pred[u]))
@@ -0,0 +1,102 @@
+import random
+
+from nose.tools import assert_equal
+from nose.tools import assert_raises
+
+import networkx as nx
+
+
+def assert_matches_dijkstra(sp):
+    pred, dist = nx.dijkstra_predecessor_and_distance(sp.G, sp.source)
+    assert_equal(sp.dist, dist)
+    assert_equal({v: sorted(p) for v, p in sp.pred.items()},
+                 {v: sorted(p) for v, p in pred.items()})
+    for v in dist:
+        path = sp.path(v)
+        assert_equal(path[0], sp.source)
+        assert_equal(path[-1], v)
+
+
+class TestDynamicShortestPaths(object):
+
+    def _random_updates(self, G, seed, steps=200):
+        rng = random.Random(seed)
+        sp = nx.DynamicShortestPaths(G, 0)
+        assert_matches_dijkstra(sp)
+        nodes = list(G)
+        for _ in range(steps):
+            u, v = rng.choice(nodes), rng.choice(nodes)
+            op = rng.random()
+            if G.has_edge(u, v) and op < 0.4:
+                sp.remove_edge(u, v)
+            elif op < 0.9:
+                sp.add_edge(u, v, weight=rng.randint(1, 4))
+            else:
+                # Change a weight directly in the graph.
+                if G.has_edge(u, v):
+                    G[u][v]['weight'] = rng.randint(1, 4)
+                    sp.edge_changed(u, v)
+            assert_matches_dijkstra(sp)
+
+    def test_random_directed(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(30, 0.1, seed=seed, directed=True)
+            for u, v in G.edges():
+                G[u][v]['weight'] = (u + v) % 3 + 1
+            self._random_updates(G, seed)
+
+    def test_random_undirected(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(30, 0.08, seed=seed)
+            for u, v in G.edges():
+                G[u][v]['weight'] = (u * v) % 4 + 1
+            self._random_updates(G, seed)
+
+    def test_unreachable_and_back(self):
+        G = nx.path_graph(4, create_using=nx.DiGraph())
+        sp = nx.DynamicShortestPaths(G, 0)
+        sp.remove_edge(1, 2)
+        assert_equal(sp.dist, {0: 0, 1: 1})
+        assert_raises(nx.NetworkXNoPath, sp.path, 3)
+        sp.add_edge(0, 2, weight=5)
+        assert_equal(sp.dist, {0: 0, 1: 1, 2: 5, 3: 6})
+        sp.add_edge(1, 4)
+        assert_equal(sp.dist[4], 2)
+        assert_matches_dijkstra(sp)
+
+    def test_remove_node(self):
+        G = nx.cycle_graph(6)
+        sp = nx.DynamicShortestPaths(G, 0)
+        sp.remove_node(1)
+        assert_equal(sp.dist, {0: 0, 5: 1, 4: 2, 3: 3, 2: 4})
+        assert_matches_dijkstra(sp)
+        assert_raises(nx.NetworkXError, sp.remove_node, 0)
+
+    def test_multigraph(self):
+        G = nx.MultiDiGraph()
+        G.add_edge(0, 1, key='a', weight=5)
+        G.add_edge(1, 2, weight=1)
+        sp = nx.DynamicShortestPaths(G, 0)
+        sp.add_edge(0, 1, key='b', weight=2)
+        assert_equal(sp.dist, {0: 0, 1: 2, 2: 3})
+        sp.remove_edge(0, 1, key='b')
+        assert_equal(sp.dist, {0: 0, 1: 5, 2: 6})
+
+    def test_weight_function(self):
+        G = nx.path_graph(4)
+        G[1][2]['color'] = 'red'
+        weight = lambda u, v, d: None if d.get('color') == 'red' else 1
+        sp = nx.DynamicShortestPaths(G, 0, weight=weight)
+        assert_equal(sp.dist, {0: 0, 1: 1})
+        G[1][2]['color'] = 'blue'
+        sp.edge_changed(1, 2)
+        assert_equal(sp.dist, {0: 0, 1: 1, 2: 2, 3: 3})
+
+    def test_negative_weight(self):
+        G = nx.path_graph(3, create_using=nx.DiGraph())
+        sp = nx.DynamicShortestPaths(G, 0)
+        assert_raises(ValueError, sp.add_edge, 0, 2, weight=-1)
+
+    def test_source_not_in_graph(self):
+        assert_raises(nx.NodeNotFound, nx.DynamicShortestPaths,
+                      nx.path_graph(2), 5)
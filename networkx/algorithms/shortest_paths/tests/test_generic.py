@@ -142,6 +142,94 @@ class TestGenericPath:
         paths = list(nx.all_shortest_paths(G,0,4))
 
 
+class TestShortestPathDAG(object):
+
+    def test_matches_enumeration(self):
+        G = nx.gnp_random_graph(30, 0.15, seed=1)
+        for u, v in G.edges():
+            G[u][v]['weight'] = (u + v) % 3 + 1
+        for weight in (None, 'weight'):
+            pred, sigma = nx.shortest_path_dag(G, 0, weight=weight)
+            for t in pred:
+                paths = list(nx.all_shortest_paths(G, 0, t, weight=weight))
+                assert_equal(sigma[t], len(paths))
+                assert_equal(nx.number_of_shortest_paths(G, 0, t, weight),
+                             len(paths))
+                dag = nx.shortest_path_dag(G, 0, t, weight=weight)[0]
+                edges = {(v, p) for v in dag for p in dag[v]}
+                assert_equal(edges, {(path[i + 1], path[i]) for path in paths
+                                     for i in range(len(path) - 1)})
+
+    def test_directed(self):
+        G = nx.DiGraph([(0, 1), (0, 2), (1, 3), (2, 3), (3, 0)])
+        pred, sigma = nx.shortest_path_dag(G, 0)
+        assert_equal(sigma, {0: 1, 1: 1, 2: 1, 3: 2})
+        assert_equal(sorted(pred[3]), [1, 2])
+        assert_equal(pred[0], [])
+
+    def test_zero_weights(self):
+        edges = [('s', 'a', 1), ('s', 'b', 1), ('a', 'b', 0)]
+        # The result does not depend on the order of the edges.
+        for order in (edges, edges[::-1]):
+            G = nx.DiGraph()
+            G.add_weighted_edges_from(order)
+            assert_equal(nx.number_of_shortest_paths(G, 's', 'b', 'weight'),
+                         2)
+            pred, sigma = nx.shortest_path_dag(G, 's', weight='weight')
+            assert_equal(sorted(pred['b']), ['a', 's'])
+            assert_equal(sigma, {'s': 1, 'a': 1, 'b': 2})
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 0), (1, 2, 0), (0, 2, 0),
+                                   (2, 3, 1), (0, 3, 1)])
+        assert_equal(nx.number_of_shortest_paths(G, 0, 3, 'weight'), 3)
+        paths = nx.sample_shortest_paths(G, 0, 3, k=50, weight='weight',
+                                         seed=1)
+        assert_equal({tuple(path) for path in paths},
+                     {(0, 3), (0, 2, 3), (0, 1, 2, 3)})
+
+    def test_zero_weight_cycle(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, 0), (2, 3, 1)])
+        assert_raises(nx.NetworkXError, nx.number_of_shortest_paths,
+                      G, 0, 3, 'weight')
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 1), (1, 2, 0), (2, 1, 0)])
+        assert_raises(nx.NetworkXError, nx.shortest_path_dag, G, 0,
+                      weight='weight')
+
+    def test_grid_count(self):
+        G = nx.grid_2d_graph(30, 30)
+        # C(58, 29) overflows the exact range of a float.
+        assert_equal(nx.number_of_shortest_paths(G, (0, 0), (29, 29)),
+                     30067266499541040)
+
+    def test_unreachable(self):
+        G = nx.path_graph(3)
+        G.add_node(3)
+        assert_equal(nx.number_of_shortest_paths(G, 0, 3), 0)
+        assert_raises(nx.NetworkXNoPath, nx.shortest_path_dag, G, 0, 3)
+        assert_raises(nx.NetworkXNoPath, nx.sample_shortest_paths, G, 0, 3)
+        assert_raises(nx.NodeNotFound, nx.shortest_path_dag, G, 4)
+
+    def test_sample_uniform(self):
+        G = nx.Graph()
+        # Three shortest paths from 0 to 4, two of them through 1.
+        nx.add_path(G, [0, 1, 2, 4])
+        nx.add_path(G, [0, 1, 3, 4])
+        nx.add_path(G, [0, 5, 6, 4])
+        paths = nx.sample_shortest_paths(G, 0, 4, k=3000, seed=42)
+        counts = {}
+        for path in paths:
+            counts[tuple(path)] = counts.get(tuple(path), 0) + 1
+        assert_equal(sorted(counts),
+                     [(0, 1, 2, 4), (0, 1, 3, 4), (0, 5, 6, 4)])
+        for c in counts.values():
+            assert_true(900 < c < 1100)
+        assert_equal(nx.sample_shortest_paths(G, 0, 4, k=5, seed=1),
+                     nx.sample_shortest_paths(G, 0, 4, k=5, seed=1))
+        assert_equal(nx.sample_shortest_paths(G, 0, 0), [[0]])
+
+
 class TestAverageShortestPathLength(object):
 
     def test_cycle_graph(self):
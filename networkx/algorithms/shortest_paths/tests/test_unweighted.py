@@ -116,3 +116,31 @@ class TestUnweightedPath:
         p,s = nx.predecessor(G,0,3,cutoff=2,return_seen=True)
         assert_equal(p,[])
         assert_equal(s,-1)
+
+    def test_bfs_nearest(self):
+        result = list(nx.bfs_nearest(self.grid, {1}, {16, 6, 3, 42}))
+        assert_equal(sorted(result[:2]), [(3, 2), (6, 2)])
+        assert_equal(result[2], (16, 6))
+        result = list(nx.bfs_nearest(self.directed_cycle, {0}, k=3))
+        assert_equal(result, [(0, 0), (1, 1), (2, 2)])
+        result = list(nx.bfs_nearest(self.cycle, {0, 3},
+                                     lambda n: n > 4, cutoff=2))
+        assert_equal(sorted(result), [(5, 2), (6, 1)])
+        result = list(nx.bfs_nearest(self.cycle, {0}, [4], cutoff=2))
+        assert_equal(result, [])
+
+    def test_bfs_nearest_lazy(self):
+        G = nx.path_graph(100)
+        visited = []
+
+        def is_target(n):
+            visited.append(n)
+            return n in (20, 30)
+        nearest = nx.bfs_nearest(G, {0}, is_target, k=1)
+        assert_equal(visited, [])
+        assert_equal(list(nearest), [(20, 20)])
+        assert_equal(max(visited), 20)
+
+    def test_bfs_nearest_errors(self):
+        assert_raises(ValueError, nx.bfs_nearest, self.cycle, [])
+        assert_raises(nx.NodeNotFound, nx.bfs_nearest, self.cycle, {10})
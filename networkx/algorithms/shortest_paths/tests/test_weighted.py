@@ -300,6 +300,177 @@ class TestMultiSourceDijkstra(object):
         assert_equal(paths, expected_paths)
 
 
+class TestDijkstraHeaps(WeightedTestBase):
+    """Unit tests for Dijkstra's algorithm with the priority queues from
+    :mod:`networkx.utils.heaps`.
+
+    """
+    heaps = ('binary', 'dary', 'pairing', 'radix', nx.utils.PairingHeap)
+
+    def test_agrees_with_heapq(self):
+        for G in (self.XG, self.XG2, self.XG3, self.XG4, self.MXG4,
+                  self.grid, self.directed_cycle):
+            for s in G:
+                expected = nx.single_source_dijkstra_path_length(G, s)
+                expected = dict(expected)
+                for heap in self.heaps:
+                    length, path = nx.single_source_dijkstra(G, s, heap=heap)
+                    assert_equal(length, expected)
+                    for t in length:
+                        validate_path(G, s, t, length[t], path[t])
+
+    def test_predecessors(self):
+        G = nx.grid_2d_graph(4, 4)
+        expected_pred, expected_dist = \
+            nx.dijkstra_predecessor_and_distance(G, (0, 0))
+        for heap in self.heaps:
+            pred, dist = nx.dijkstra_predecessor_and_distance(G, (0, 0),
+                                                              heap=heap)
+            assert_equal(dist, expected_dist)
+            assert_equal({v: sorted(p) for v, p in pred.items()},
+                         {v: sorted(p) for v, p in expected_pred.items()})
+
+    def test_target_and_cutoff(self):
+        for heap in self.heaps:
+            validate_path(self.XG, 's', 'v', 9,
+                          nx.dijkstra_path(self.XG, 's', 'v', heap=heap))
+            assert_equal(nx.dijkstra_path_length(self.XG, 's', 'v',
+                                                 heap=heap), 9)
+            length = dict(nx.single_source_dijkstra_path_length(
+                self.grid, 1, cutoff=2, heap=heap))
+            assert_equal(length, {1: 0, 2: 1, 5: 1, 3: 2, 6: 2, 9: 2})
+
+    def test_multi_source(self):
+        edges = [(0, 1, 1), (1, 2, 1), (2, 3, 10), (3, 4, 1)]
+        G = nx.Graph()
+        G.add_weighted_edges_from(edges)
+        for heap in self.heaps:
+            distances, paths = nx.multi_source_dijkstra(G, {0, 4}, heap=heap)
+            assert_equal(distances, {0: 0, 1: 1, 2: 2, 3: 1, 4: 0})
+            assert_equal(paths, {0: [0], 1: [0, 1], 2: [0, 1, 2],
+                                 3: [4, 3], 4: [4]})
+
+    def test_radix_float_weights(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, weight=0.5)
+        assert_raises(nx.NetworkXError, nx.single_source_dijkstra, G, 0,
+                      heap='radix')
+
+    @raises(ValueError)
+    def test_unknown_heap(self):
+        nx.single_source_dijkstra(self.XG, 's', heap='fibonacci')
+
+
+class TestDijkstraNearest(WeightedTestBase):
+    """Unit tests for the lazy multi-target search
+    :func:`networkx.dijkstra_nearest`.
+
+    """
+
+    def test_target_set(self):
+        G = self.grid
+        targets = {16, 6, 3, 42}
+        expected = nx.single_source_dijkstra_path_length(G, 1)
+        expected = sorted((d, v) for v, d in expected if v in targets)
+        result = list(nx.dijkstra_nearest(G, {1}, targets))
+        assert_equal(sorted((d, v) for v, d in result), expected)
+        assert_equal([d for v, d in result], [d for d, v in expected])
+
+    def test_stops_when_satisfied(self):
+        G = nx.path_graph(100)
+        scanned = []
+
+        def weight(u, v, d):
+            scanned.append(u)
+            return 1
+        result = list(nx.dijkstra_nearest(G, {0}, {3, 5}, weight=weight))
+        assert_equal(result, [(3, 3), (5, 5)])
+        assert_equal(max(scanned), 4)
+
+    def test_lazy(self):
+        G = nx.path_graph(100)
+        visited = []
+
+        def is_target(n):
+            visited.append(n)
+            return n % 10 == 0
+        nearest = nx.dijkstra_nearest(G, {45}, is_target)
+        assert_equal(visited, [])
+        assert_equal(next(nearest), (40, 5))
+        assert_true(len(visited) <= 12)
+        assert_equal(next(nearest), (50, 5))
+
+    def test_k_nearest(self):
+        result = list(nx.dijkstra_nearest(self.XG, {'s'}, k=3))
+        assert_equal(result, [('s', 0), ('x', 5), ('y', 7)])
+        result = list(nx.dijkstra_nearest(self.XG, {'s'}, k=0))
+        assert_equal(result, [])
+        result = list(nx.dijkstra_nearest(self.XG, {'s'},
+                                          lambda n: n in 'uv', k=1))
+        assert_equal(result, [('u', 8)])
+
+    def test_multi_source_and_cutoff(self):
+        G = nx.path_graph(10)
+        result = list(nx.dijkstra_nearest(G, {0, 9}, cutoff=1))
+        assert_equal(sorted(result), [(0, 0), (1, 1), (8, 1), (9, 0)])
+        result = list(nx.dijkstra_nearest(G, {0}, [2, 7], cutoff=5))
+        assert_equal(result, [(2, 2)])
+
+    def test_unreachable_target(self):
+        G = nx.path_graph(4, create_using=nx.DiGraph())
+        result = list(nx.dijkstra_nearest(G, {2}, {0, 3, 'missing'}))
+        assert_equal(result, [(3, 1)])
+
+    def test_errors(self):
+        assert_raises(ValueError, nx.dijkstra_nearest, self.XG, set())
+        assert_raises(nx.NodeNotFound, nx.dijkstra_nearest, self.XG, {'z'})
+
+
+class TestWeightSnapshot(WeightedTestBase):
+    """Unit tests for the weights computed once per call by
+    :func:`networkx.algorithms.shortest_paths.weighted._weight_snapshot`.
+
+    """
+
+    def test_snapshot(self):
+        from networkx.algorithms.shortest_paths.weighted \
+            import _weight_snapshot
+        snapshot = _weight_snapshot(self.MXG4, 'weight')
+        assert_equal(snapshot[0], {1: 2, 7: 1})
+        assert_equal(snapshot[1], {0: 2, 2: 2})
+        assert_true(_weight_snapshot(self.MXG4, snapshot) is snapshot)
+        # Edges hidden by a weight function are left out.
+        hide = lambda u, v, d: None if v == 2 else d.get('weight', 1)
+        snapshot = _weight_snapshot(self.XG2, hide)
+        assert_equal(snapshot[1], {4: 1, 3: 50})
+
+    def test_all_pairs(self):
+        for G in (self.XG, self.XG2, self.XG3, self.XG4, self.MXG4):
+            for s in G:
+                expected = dict(nx.single_source_dijkstra_path_length(G, s))
+                assert_equal(dict(nx.all_pairs_dijkstra_path_length(G))[s],
+                             expected)
+                length = dict(nx.all_pairs_bellman_ford_path_length(G))
+                assert_equal(length[s], expected)
+                paths = nx.all_pairs_dijkstra_path(G)[s]
+                for t in paths:
+                    validate_path(G, s, t, expected[t], paths[t])
+                paths = nx.all_pairs_bellman_ford_path(G)[s]
+                for t in paths:
+                    validate_path(G, s, t, expected[t], paths[t])
+
+    def test_weight_function(self):
+        # The weight function gets the endpoints of each edge in order.
+        G = nx.DiGraph([(0, 1), (1, 2), (0, 2)])
+        weight = lambda u, v, d: 1 if u < v else 10
+        assert_equal(nx.bellman_ford_path(G, 0, 2, weight=weight), [0, 2])
+        weight = lambda u, v, d: 5 if (u, v) == (0, 2) else 1
+        assert_equal(nx.bellman_ford_path_length(G, 0, 2, weight=weight), 2)
+        length = dict(nx.all_pairs_bellman_ford_path_length(G,
+                                                            weight=weight))
+        assert_equal(length[0], {0: 0, 1: 1, 2: 2})
+
+
 class TestBellmanFordAndGoldbergRadzik(WeightedTestBase):
 
     def test_single_node_graph(self):
@@ -322,6 +493,7 @@ class TestBellmanFordAndGoldbergRadzik(WeightedTestBase):
             assert_raises(nx.NetworkXUnbounded, nx.single_source_bellman_ford, G, i)
             assert_raises(nx.NetworkXUnbounded, nx.bellman_ford_predecessor_and_distance, G, i)
             assert_raises(nx.NetworkXUnbounded, nx.goldberg_radzik, G, i)
+            assert_raises(nx.NetworkXUnbounded, nx.spfa, G, i)
         G = nx.cycle_graph(5)  # undirected Graph
         G.add_edge(1, 2, weight=-3)
         for i in range(5):
@@ -330,12 +502,14 @@ class TestBellmanFordAndGoldbergRadzik(WeightedTestBase):
             assert_raises(nx.NetworkXUnbounded, nx.single_source_bellman_ford, G, i)
             assert_raises(nx.NetworkXUnbounded, nx.bellman_ford_predecessor_and_distance, G, i)
             assert_raises(nx.NetworkXUnbounded, nx.goldberg_radzik, G, i)
+            assert_raises(nx.NetworkXUnbounded, nx.spfa, G, i)
         G = nx.DiGraph([(1, 1, {'weight': -1})])
         assert_raises(nx.NetworkXUnbounded, nx.single_source_bellman_ford_path, G, 1)
         assert_raises(nx.NetworkXUnbounded, nx.single_source_bellman_ford_path_length, G, 1)
         assert_raises(nx.NetworkXUnbounded, nx.single_source_bellman_ford, G, 1)
         assert_raises(nx.NetworkXUnbounded, nx.bellman_ford_predecessor_and_distance, G, 1)
         assert_raises(nx.NetworkXUnbounded, nx.goldberg_radzik, G, 1)
+        assert_raises(nx.NetworkXUnbounded, nx.spfa, G, 1)
         # no negative cycle but negative weight
         G = nx.cycle_graph(5, create_using=nx.DiGraph())
         G.add_edge(1, 2, weight=-3)
@@ -352,6 +526,9 @@ class TestBellmanFordAndGoldbergRadzik(WeightedTestBase):
         assert_equal(nx.goldberg_radzik(G, 0),
                      ({0: None, 1: 0, 2: 1, 3: 2, 4: 3},
                       {0: 0, 1: 1, 2: -2, 3: -1, 4: 0}))
+        assert_equal(nx.spfa(G, 0),
+                     ({0: None, 1: 0, 2: 1, 3: 2, 4: 3},
+                      {0: 0, 1: 1, 2: -2, 3: -1, 4: 0}))
 
     def test_not_connected(self):
         G = nx.complete_graph(6)
@@ -483,6 +660,95 @@ class TestBellmanFordAndGoldbergRadzik(WeightedTestBase):
 
 
 
+class TestSPFAAndNegativeCycles(WeightedTestBase):
+
+    def check_cycle(self, G, cycle):
+        assert_equal(cycle[0], cycle[-1])
+        length = sum(min(d.get('weight', 1) for d in G[u][v].values())
+                     if G.is_multigraph() else G[u][v].get('weight', 1)
+                     for u, v in pairwise(cycle))
+        assert_true(length < 0)
+
+    def test_agrees_with_bellman_ford(self):
+        for G in (self.XG, self.XG2, self.XG3, self.XG4, self.MXG4,
+                  self.grid, self.G):
+            for s in G:
+                pred, dist = nx.bellman_ford_predecessor_and_distance(G, s)
+                for slf in (False, True):
+                    for lll in (False, True):
+                        p, d = nx.spfa(G, s, slf=slf, lll=lll)
+                        assert_equal(d, dist)
+                        assert_true(all(p[v] in pred[v] for v in p))
+
+    def test_negative_weights(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 5), (0, 2, 2), (2, 1, -4),
+                                   (1, 3, 1), (3, 4, -2), (2, 4, 1)])
+        pred, dist = nx.spfa(G, 0)
+        assert_equal(dist, {0: 0, 1: -2, 2: 2, 3: -1, 4: -3})
+        assert_equal(pred, {0: None, 1: 2, 2: 0, 3: 1, 4: 3})
+        assert_raises(nx.NodeNotFound, nx.spfa, G, 5)
+
+    def test_find_negative_cycle(self):
+        G = nx.cycle_graph(5, create_using=nx.DiGraph())
+        G.add_edge(1, 2, weight=-7)
+        for source in (None, 0, 3):
+            cycle = nx.find_negative_cycle(G, source)
+            assert_equal(sorted(cycle[:-1]), list(range(5)))
+            self.check_cycle(G, cycle)
+        # A cycle unreachable from the source.
+        G.add_edge(5, 0)
+        assert_raises(nx.NetworkXError, nx.find_negative_cycle, G.reverse(), 5)
+        assert_raises(nx.NodeNotFound, nx.find_negative_cycle, G, 6)
+        G = nx.cycle_graph(5)
+        assert_raises(nx.NetworkXError, nx.find_negative_cycle, G)
+        G.add_edge(1, 2, weight=-1)
+        cycle = nx.find_negative_cycle(G)
+        assert_equal(sorted(cycle), [1, 1, 2] if cycle[0] == 1 else [1, 2, 2])
+        G = nx.MultiDiGraph(self.MXG)
+        G.add_edge('v', 's', weight=-20)
+        self.check_cycle(G, nx.find_negative_cycle(G))
+        G = nx.DiGraph([(0, 1), (1, 1, {'weight': -1})])
+        assert_equal(nx.find_negative_cycle(G, 0), [1, 1])
+
+    def test_weight_function(self):
+        G = nx.cycle_graph(4, create_using=nx.DiGraph())
+        weight = lambda u, v, d: -1 if u == 3 else 1
+        assert_raises(nx.NetworkXError, nx.find_negative_cycle, G,
+                      weight=weight)
+        weight = lambda u, v, d: None if u == 3 else -1
+        assert_raises(nx.NetworkXError, nx.find_negative_cycle, G,
+                      weight=weight)
+        assert_false(nx.negative_edge_cycle(G, weight=weight))
+
+    def test_negative_cycles(self):
+        G = nx.DiGraph()
+        for offset in (0, 10, 20, 30):
+            nx.add_cycle(G, range(offset, offset + 4), weight=1)
+            G.add_edge(offset + 4, offset)
+        G.add_edge(1, 2, weight=-7)
+        G.add_edge(23, 20, weight=-4)
+        G.add_edge(31, 31, weight=-1)
+        # An edge between components closes no cycle.
+        G.add_edge(10, 4, weight=-5)
+        cycles = list(nx.negative_cycles(G))
+        assert_equal(sorted(min(c) for c in cycles), [0, 20, 31])
+        for cycle in cycles:
+            self.check_cycle(G, cycle)
+        assert_equal(list(nx.negative_cycles(self.XG)), [])
+        G = nx.Graph([(0, 1), (1, 2), (3, 4)])
+        G.add_edge(2, 0, weight=-1)
+        G.add_edge(3, 4, weight=-1)
+        assert_equal(len(list(nx.negative_cycles(G))), 2)
+
+    def test_negative_edge_cycle_leaves_graph(self):
+        G = nx.cycle_graph(5, create_using=nx.DiGraph())
+        G.add_edge(1, 2, weight=-7)
+        nodes = list(G)
+        assert_true(nx.negative_edge_cycle(G))
+        assert_equal(list(G), nodes)
+
+
 class TestJohnsonAlgorithm(WeightedTestBase):
 
     @raises(nx.NetworkXError)
@@ -11,6 +11,8 @@
 Shortest path algorithms for unweighted graphs.
 """
 import networkx as nx
+from networkx.algorithms.traversal.array_bfs import _all_pairs_lengths
+from networkx.algorithms.traversal.array_bfs import _has_numpy
 
 __all__ = ['bidirectional_shortest_path',
            'single_source_shortest_path',
@@ -19,10 +21,11 @@ __all__ = ['bidirectional_shortest_path',
            'single_target_shortest_path_length',
            'all_pairs_shortest_path',
            'all_pairs_shortest_path_length',
+           'bfs_nearest',
            'predecessor']
 
 
-def single_source_shortest_path_length(G, source, cutoff=None):
+def single_source_shortest_path_length(G, source, cutoff=None, method=None):
     """Compute the shortest path lengths from source to all reachable nodes.
 
     Parameters
@@ -35,6 +38,15 @@ def single_source_shortest_path_length(G, source, cutoff=None):
     cutoff : integer, optional
         Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    method : None, 'numpy' or 'python', optional (default=None)
+        If 'numpy', the search runs on arrays with
+        :func:`~networkx.bfs_arrays`, which requires NumPy. If 'python',
+        it runs on the adjacency dictionaries. If None, the method is
+        chosen automatically: 'numpy' when NumPy is available and several
+        searches share the arrays, which is never the case for one
+        search, since converting the graph costs as much as the search.
+        Nodes are yielded in order of distance either way.
+
     Returns
     -------
     lengths : iterator
@@ -60,12 +72,31 @@ def single_source_shortest_path_length(G, source, cutoff=None):
     """
     if source not in G:
         raise nx.NodeNotFound('Source {} is not in G'.format(source))
+    if _choose_method(method, searches=1) == 'numpy':
+        from networkx.algorithms.traversal.array_bfs import _bfs_lengths
+        return _bfs_lengths(G, source, cutoff)
     if cutoff is None:
         cutoff = float('inf')
     nextlevel = {source: 1}
     return _single_shortest_path_length(G.adj, nextlevel, cutoff)
 
 
+def _choose_method(method, searches):
+    """Returns 'numpy' or 'python' for the `method` argument of the
+    breadth-first searches, given the number of searches sharing the
+    arrays of the 'numpy' method.
+
+    None chooses 'numpy' when NumPy is available and more than one search
+    shares the arrays, since converting the graph costs about as much as
+    one search.
+    """
+    if method not in (None, 'numpy', 'python'):
+        raise ValueError("method must be None, 'numpy' or 'python'")
+    if method is None:
+        return 'numpy' if searches > 1 and _has_numpy() else 'python'
+    return method
+
+
 def _single_shortest_path_length(adj, firstlevel, cutoff):
     """Yields (node, level) in a breadth first search
 
@@ -95,7 +126,111 @@ def _single_shortest_path_length(adj, firstlevel, cutoff):
     del seen
 
 
-def single_target_shortest_path_length(G, target, cutoff=None):
+def bfs_nearest(G, sources, targets=None, k=None, cutoff=None):
+    """Yield the nearest target nodes and their shortest path lengths from
+    a set of source nodes, in order of increasing length.
+
+    The breadth-first search is run lazily: it only advances when the
+    next target is requested and it stops as soon as every target has
+    been found, `k` targets have been yielded or `cutoff` is exceeded.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : non-empty set of nodes
+        Starting nodes for paths. The length reported for a node is its
+        distance from the nearest source.
+
+    targets : container of nodes or function, optional (default=None)
+        The nodes to report. If this is a function, it must accept a
+        node and return True if the node is a target; the search then
+        continues until `k` targets are found or the reachable part of
+        the graph is exhausted. If None, every node is a target.
+
+    k : integer, optional (default=None)
+        Maximum number of targets to yield.
+
+    cutoff : integer, optional
+        Depth to stop the search. Only targets at distance <= cutoff are
+        yielded.
+
+    Returns
+    -------
+    nearest : iterator
+        (target, shortest path length) iterator, in order of increasing
+        length.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(10)
+    >>> list(nx.bfs_nearest(G, {0}, targets={7, 2, 4}))
+    [(2, 2), (4, 4), (7, 7)]
+    >>> list(nx.bfs_nearest(G, {0, 9}, k=4))
+    [(0, 0), (9, 0), (1, 1), (8, 1)]
+
+    Raises
+    ------
+    ValueError
+        If `sources` is empty.
+
+    NodeNotFound
+        If one of the `sources` is not in `G`.
+
+    See Also
+    --------
+    single_source_shortest_path_length
+    dijkstra_nearest
+
+    """
+    if not sources:
+        raise ValueError('sources must not be empty')
+    for source in sources:
+        if source not in G:
+            raise nx.NodeNotFound('Source {} is not in G'.format(source))
+    is_target, remaining = _target_test(G, targets)
+    if k is not None:
+        remaining = k if remaining is None else min(k, remaining)
+    if cutoff is None:
+        cutoff = float('inf')
+    return _bfs_nearest(G.adj, sources, is_target, remaining, cutoff)
+
+
+def _bfs_nearest(adj, sources, is_target, remaining, cutoff):
+    """Generator behind :func:`bfs_nearest`.
+
+    The search stops once `remaining` targets were yielded, unless
+    `remaining` is None.
+
+    """
+    if remaining == 0:
+        return
+    for v, level in _single_shortest_path_length(adj, dict.fromkeys(sources),
+                                                 cutoff):
+        if is_target(v):
+            yield (v, level)
+            if remaining is not None:
+                remaining -= 1
+                if remaining == 0:
+                    return
+
+
+def _target_test(G, targets):
+    """Returns a membership test for `targets` and the number of targets
+    in `G`, or None if that number is not known in advance.
+
+    `targets` is None (every node), a function returning True for target
+    nodes or a container of nodes.
+    """
+    if targets is None:
+        return (lambda n: True), len(G)
+    if callable(targets):
+        return targets, None
+    targets = {t for t in targets if t in G}
+    return targets.__contains__, len(targets)
+
+
+def single_target_shortest_path_length(G, target, cutoff=None, method=None):
     """Compute the shortest path lengths to target from all reachable nodes.
 
     Parameters
@@ -108,6 +243,14 @@ def single_target_shortest_path_length(G, target, cutoff=None):
     cutoff : integer, optional
         Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    method : None, 'numpy' or 'python', optional (default=None)
+        If 'numpy', the search runs on arrays with
+        :func:`~networkx.bfs_arrays`, which requires NumPy. If 'python',
+        it runs on the adjacency dictionaries. If None, the method is
+        chosen automatically: 'numpy' when NumPy is available and several
+        searches share the arrays, which is never the case for one
+        search, since converting the graph costs as much as the search.
+
     Returns
     -------
     lengths : iterator
@@ -134,6 +277,9 @@ def single_target_shortest_path_length(G, target, cutoff=None):
     if target not in G:
         raise nx.NodeNotFound('Target {} is not in G'.format(source))
 
+    if _choose_method(method, searches=1) == 'numpy':
+        from networkx.algorithms.traversal.array_bfs import _bfs_lengths
+        return _bfs_lengths(G, target, cutoff, reverse=True)
     if cutoff is None:
         cutoff = float('inf')
     # handle either directed or undirected
@@ -142,7 +288,7 @@ def single_target_shortest_path_length(G, target, cutoff=None):
     return _single_shortest_path_length(adj, nextlevel, cutoff)
 
 
-def all_pairs_shortest_path_length(G, cutoff=None):
+def all_pairs_shortest_path_length(G, cutoff=None, method=None):
     """Computes the shortest path lengths between all nodes in `G`.
 
     Parameters
@@ -153,6 +299,14 @@ def all_pairs_shortest_path_length(G, cutoff=None):
         Depth at which to stop the search. Only paths of length at most
         `cutoff` are returned.
 
+    method : None, 'numpy' or 'python', optional (default=None)
+        If 'numpy', the graph is converted to arrays once and the searches
+        from 64 sources at a time advance together, as in
+        :func:`~networkx.bfs_distance_matrix`. This requires NumPy. If
+        'python', each search runs on the adjacency dictionaries. If None,
+        the method is chosen automatically: 'numpy' when NumPy is
+        available and several searches share the arrays, as they do here.
+
     Returns
     -------
     lengths : iterator
@@ -180,6 +334,10 @@ def all_pairs_shortest_path_length(G, cutoff=None):
     0
 
     """
+    if _choose_method(method, searches=len(G)) == 'numpy':
+        for item in _all_pairs_lengths(G, cutoff):
+            yield item
+        return
     length = single_source_shortest_path_length
     # TODO This can be trivially parallelized.
     for n in G:
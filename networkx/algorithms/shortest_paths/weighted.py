@@ -18,7 +18,8 @@ from collections import deque
 from heapq import heappush, heappop
 from itertools import count
 import networkx as nx
-from networkx.utils import generate_unique_node
+from networkx.utils.heaps import _heap_factory
+from networkx.algorithms.shortest_paths.unweighted import _target_test
 import warnings as _warnings
 
 
@@ -31,6 +32,7 @@ __all__ = ['dijkstra_path',
            'multi_source_dijkstra',
            'multi_source_dijkstra_path',
            'multi_source_dijkstra_path_length',
+           'dijkstra_nearest',
            'all_pairs_dijkstra_path',
            'all_pairs_dijkstra_path_length',
            'dijkstra_predecessor_and_distance',
@@ -44,7 +46,10 @@ __all__ = ['dijkstra_path',
            'bellman_ford',
            'bellman_ford_predecessor_and_distance',
            'negative_edge_cycle',
+           'find_negative_cycle',
+           'negative_cycles',
            'goldberg_radzik',
+           'spfa',
            'johnson']
 
 def _weight_function(G, weight):
@@ -77,7 +82,7 @@ def _weight_function(G, weight):
     have weight one.
 
     """
-    if callable(weight):
+    if callable(weight) or isinstance(weight, _WeightSnapshot):
         return weight
     # If the weight keyword argument is not callable, we assume it is a
     # string representing the edge attribute containing the weight of
@@ -86,7 +91,62 @@ def _weight_function(G, weight):
         return lambda u, v, d: min(attr.get(weight, 1) for attr in d.values())
     return lambda u, v, data: data.get(weight, 1)
 
-def dijkstra_path(G, source, target, weight='weight'):
+
+class _WeightSnapshot(dict):
+    """Adjacency dictionary mapping each node `u` to a dictionary of the
+    weights of the edges joining `u` to its successors.
+
+    :func:`_weight_function` passes snapshots through unchanged, and
+    :func:`_dijkstra_multisource` and :func:`_bellman_ford` read the
+    weights from them directly.
+    """
+
+
+def _weight_snapshot(G, weight):
+    """Returns the weights of all the edges of `G`, computed once.
+
+    Searches that relax every edge many times, like Bellman–Ford, or that
+    are repeated from many sources, can then read each weight from a
+    dictionary instead of calling a weight function.
+
+    Parameters
+    ----------
+    G : NetworkX graph.
+
+    weight : string, function or :class:`_WeightSnapshot`
+        As for :func:`_weight_function`. A snapshot is returned unchanged.
+
+    Returns
+    -------
+    _WeightSnapshot
+        The edges whose weight function returns None are left out. For
+        multigraphs, the minimum weight over parallel edges is kept.
+
+    Notes
+    -----
+    Changes made to `G` later are not reflected in the snapshot.
+    """
+    if isinstance(weight, _WeightSnapshot):
+        return weight
+    succ = G._succ if G.is_directed() else G._adj
+    if callable(weight):
+        snapshot = _WeightSnapshot()
+        for u, nbrs in succ.items():
+            row = snapshot[u] = {}
+            for v, d in nbrs.items():
+                w = weight(u, v, d)
+                if w is not None:
+                    row[v] = w
+        return snapshot
+    if G.is_multigraph():
+        return _WeightSnapshot(
+            (u, {v: min(attr.get(weight, 1) for attr in keydict.values())
+                 for v, keydict in nbrs.items()})
+            for u, nbrs in succ.items())
+    return _WeightSnapshot((u, {v: d.get(weight, 1) for v, d in nbrs.items()})
+                           for u, nbrs in succ.items())
+
+def dijkstra_path(G, source, target, weight='weight', heap=None):
     """Returns the shortest weighted path from source to target in G.
 
     Uses Dijkstra's Method to compute the shortest weighted path
@@ -115,6 +175,14 @@ def dijkstra_path(G, source, target, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     path : list
@@ -156,7 +224,7 @@ def dijkstra_path(G, source, target, weight='weight'):
     bidirectional_dijkstra(), bellman_ford_path()
     """
     (length, path) = single_source_dijkstra(G, source, target=target,
-                                            weight=weight)
+                                            weight=weight, heap=heap)
     try:
         return path[target]
     except KeyError:
@@ -164,7 +232,7 @@ def dijkstra_path(G, source, target, weight='weight'):
             "node %s not reachable from %s" % (target, source))
 
 
-def dijkstra_path_length(G, source, target, weight='weight'):
+def dijkstra_path_length(G, source, target, weight='weight', heap=None):
     """Returns the shortest weighted path length in G from source to target.
 
     Uses Dijkstra's Method to compute the shortest weighted path length
@@ -193,6 +261,14 @@ def dijkstra_path_length(G, source, target, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     length : number
@@ -226,7 +302,7 @@ def dijkstra_path_length(G, source, target, weight='weight'):
     if source == target:
         return 0
     weight = _weight_function(G, weight)
-    length = _dijkstra(G, source, weight, target=target)
+    length = _dijkstra(G, source, weight, target=target, heap=heap)
     try:
         return length[target]
     except KeyError:
@@ -234,7 +310,8 @@ def dijkstra_path_length(G, source, target, weight='weight'):
             "Node %s not reachable from %s" % (target, source))
 
 
-def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
+def single_source_dijkstra_path(G, source, cutoff=None, weight='weight',
+                                heap=None):
     """Find shortest weighted paths in G from a source node.
 
     Compute shortest path between source and all other reachable
@@ -263,6 +340,14 @@ def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     paths : dictionary
@@ -290,11 +375,11 @@ def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
 
     """
     return multi_source_dijkstra_path(G, {source}, cutoff=cutoff,
-                                      weight=weight)
+                                      weight=weight, heap=heap)
 
 
 def single_source_dijkstra_path_length(G, source, cutoff=None,
-                                       weight='weight'):
+                                       weight='weight', heap=None):
     """Find shortest weighted path lengths in G from a source node.
 
     Compute the shortest path length between source and all other
@@ -323,6 +408,14 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     length : iterator
@@ -357,11 +450,11 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
 
     """
     return multi_source_dijkstra_path_length(G, {source}, cutoff=cutoff,
-                                             weight=weight)
+                                             weight=weight, heap=heap)
 
 
 def single_source_dijkstra(G, source, target=None, cutoff=None,
-                           weight='weight'):
+                           weight='weight', heap=None):
     """Find shortest weighted paths and lengths from a source node.
 
     Compute the shortest path length between source and all other
@@ -396,6 +489,14 @@ def single_source_dijkstra(G, source, target=None, cutoff=None,
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     distance,path : dictionaries
@@ -443,10 +544,11 @@ def single_source_dijkstra(G, source, target=None, cutoff=None,
     single_source_bellman_ford()
     """
     return multi_source_dijkstra(G, {source}, cutoff=cutoff, target=target,
-                                 weight=weight)
+                                 weight=weight, heap=heap)
 
 
-def multi_source_dijkstra_path(G, sources, cutoff=None, weight='weight'):
+def multi_source_dijkstra_path(G, sources, cutoff=None, weight='weight',
+                               heap=None):
     """Find shortest weighted paths in G from a given set of source
     nodes.
 
@@ -479,6 +581,14 @@ def multi_source_dijkstra_path(G, sources, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     paths : dictionary
@@ -513,12 +623,12 @@ def multi_source_dijkstra_path(G, sources, cutoff=None, weight='weight'):
 
     """
     length, path = multi_source_dijkstra(G, sources, cutoff=cutoff,
-                                         weight=weight)
+                                         weight=weight, heap=heap)
     return path
 
 
 def multi_source_dijkstra_path_length(G, sources, cutoff=None,
-                                      weight='weight'):
+                                      weight='weight', heap=None):
     """Find shortest weighted path lengths in G from a given set of
     source nodes.
 
@@ -551,6 +661,14 @@ def multi_source_dijkstra_path_length(G, sources, cutoff=None,
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     length : iterator
@@ -590,13 +708,14 @@ def multi_source_dijkstra_path_length(G, sources, cutoff=None,
     if not sources:
         raise ValueError('sources must not be empty')
     weight = _weight_function(G, weight)
-    dist = _dijkstra_multisource(G, sources, weight, cutoff=cutoff)
+    dist = _dijkstra_multisource(G, sources, weight, cutoff=cutoff,
+                                 heap=heap)
     # TODO In Python 3.3+, this should be `yield from dist.items()`.
     return iter(dist.items())
 
 
 def multi_source_dijkstra(G, sources, target=None, cutoff=None,
-                           weight='weight'):
+                           weight='weight', heap=None):
     """Find shortest weighted paths and lengths from a given set of
     source nodes.
 
@@ -633,6 +752,14 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None,
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     distance, path : pair of dictionaries
@@ -690,12 +817,157 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None,
     weight = _weight_function(G, weight)
     paths = {source: [source] for source in sources}  # dictionary of paths
     dist = _dijkstra_multisource(G, sources, weight, paths=paths,
-                                 cutoff=cutoff, target=target)
+                                 cutoff=cutoff, target=target, heap=heap)
     return (dist, paths)
 
 
+def dijkstra_nearest(G, sources, targets=None, k=None, cutoff=None,
+                     weight='weight'):
+    """Yield the nearest target nodes and their distances from a set of
+    source nodes, in order of increasing distance.
+
+    Dijkstra's algorithm is run lazily: the search only advances when the
+    next target is requested and it stops as soon as every target has
+    been found, `k` targets have been yielded or `cutoff` is exceeded.
+    This is much cheaper than a full single source computation when the
+    targets are close to the sources.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : non-empty set of nodes
+        Starting nodes for paths. The distance of a node is its distance
+        from the nearest source.
+
+    targets : container of nodes or function, optional (default=None)
+        The nodes to report. If this is a function, it must accept a
+        node and return True if the node is a target; the search then
+        continues until `k` targets are found or the reachable part of
+        the graph is exhausted. If None, every node is a target.
+
+    k : integer, optional (default=None)
+        Maximum number of targets to yield.
+
+    cutoff : integer or float, optional
+        Depth to stop the search. Only targets at distance <= cutoff are
+        yielded.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edge[u][v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number.
+
+    Returns
+    -------
+    nearest : iterator
+        (target, shortest path length) iterator, in order of increasing
+        length.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(10)
+    >>> list(nx.dijkstra_nearest(G, {0}, targets=[7, 2, 4]))
+    [(2, 2), (4, 4), (7, 7)]
+
+    The three nearest nodes with an even label:
+
+    >>> list(nx.dijkstra_nearest(G, {5}, targets=lambda n: n % 2 == 0, k=3))
+    [(4, 1), (6, 1), (2, 3)]
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    Nodes at equal distance are yielded in the order in which they are
+    reached by the search.
+
+    Raises
+    ------
+    ValueError
+        If `sources` is empty.
+
+    NodeNotFound
+        If one of the `sources` is not in `G`.
+
+    See Also
+    --------
+    multi_source_dijkstra
+    bfs_nearest
+
+    """
+    if not sources:
+        raise ValueError('sources must not be empty')
+    for source in sources:
+        if source not in G:
+            raise nx.NodeNotFound("Source {} not in G".format(source))
+    is_target, remaining = _target_test(G, targets)
+    weight = _weight_function(G, weight)
+    return _dijkstra_nearest(G, sources, weight, is_target, remaining, k,
+                             cutoff)
+
+
+def _dijkstra_nearest(G, sources, weight, is_target, remaining, k, cutoff):
+    """Generator behind :func:`dijkstra_nearest`.
+
+    `remaining` is the number of targets in the graph, or None if it is
+    unknown, and the search stops once that many targets were yielded.
+
+    """
+    if k is not None:
+        remaining = k if remaining is None else min(k, remaining)
+    if remaining == 0:
+        return
+    G_succ = G._succ if G.is_directed() else G._adj
+
+    push = heappush
+    pop = heappop
+    dist = {}  # dictionary of final distances
+    seen = {}
+    c = count()
+    fringe = []
+    for source in sources:
+        seen[source] = 0
+        push(fringe, (0, next(c), source))
+    while fringe:
+        (d, _, v) = pop(fringe)
+        if v in dist:
+            continue  # already searched this node.
+        dist[v] = d
+        if is_target(v):
+            yield (v, d)
+            if remaining is not None:
+                remaining -= 1
+                if remaining == 0:
+                    return
+        for u, e in G_succ[v].items():
+            cost = weight(v, u, e)
+            if cost is None:
+                continue
+            vu_dist = d + cost
+            if cutoff is not None:
+                if vu_dist > cutoff:
+                    continue
+            if u in dist:
+                if vu_dist < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif u not in seen or vu_dist < seen[u]:
+                seen[u] = vu_dist
+                push(fringe, (vu_dist, next(c), u))
+
+
 def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None,
-              target=None):
+              target=None, heap=None):
     """Uses Dijkstra's algorithm to find shortest weighted paths from a
     single source.
 
@@ -705,11 +977,11 @@ def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None,
 
     """
     return _dijkstra_multisource(G, [source], weight, pred=pred, paths=paths,
-                                 cutoff=cutoff, target=target)
+                                 cutoff=cutoff, target=target, heap=heap)
 
 
 def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
-                          cutoff=None, target=None):
+                          cutoff=None, target=None, heap=None):
     """Uses Dijkstra's algorithm to find shortest weighted paths
 
     Parameters
@@ -723,8 +995,10 @@ def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
         iterable, the computed paths may begin from any one of the start
         nodes.
 
-    weight: function
-        Function with (u, v, data) input that returns that edges weight
+    weight: function or _WeightSnapshot
+        Function with (u, v, data) input that returns that edges weight,
+        or the weights of all the edges as returned by
+        :func:`_weight_snapshot`.
 
     pred: dict of lists, optional(default=None)
         dict to store a list of predecessors keyed by that node
@@ -740,6 +1014,10 @@ def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
     cutoff : integer or float, optional
         Depth to stop the search. Only return paths with length <= cutoff.
 
+    heap : string or callable, optional (default=None)
+        Priority queue to use. If None, :mod:`heapq` with lazy deletion is
+        used. Otherwise see :func:`networkx.utils.heaps._heap_factory`.
+
     Returns
     -------
     distance : dictionary
@@ -753,7 +1031,15 @@ def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
     as arguments. No need to explicitly return pred or paths.
 
     """
+    if heap is not None:
+        return _dijkstra_multisource_minheap(G, sources, weight, pred, paths,
+                                             cutoff, target,
+                                             _heap_factory(heap))
     G_succ = G._succ if G.is_directed() else G._adj
+    if isinstance(weight, _WeightSnapshot):
+        # The costs are the values of the snapshot.
+        G_succ = weight
+        weight = None
 
     push = heappush
     pop = heappop
@@ -774,7 +1060,7 @@ def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
         if v == target:
             break
         for u, e in G_succ[v].items():
-            cost = weight(v, u, e)
+            cost = e if weight is None else weight(v, u, e)
             if cost is None:
                 continue
             vu_dist = dist[v] + cost
@@ -801,7 +1087,61 @@ def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
     return dist
 
 
-def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
+def _dijkstra_multisource_minheap(G, sources, weight, pred, paths, cutoff,
+                                  target, make_heap):
+    """Dijkstra's algorithm on top of a :class:`~networkx.utils.MinHeap`.
+
+    Unlike the :mod:`heapq` variant in :func:`_dijkstra_multisource`, each
+    node has at most one entry in the fringe, whose value is decreased in
+    place when a shorter path is found. The arguments are as for
+    :func:`_dijkstra_multisource`, except that `make_heap` is a callable
+    returning an empty min-heap.
+
+    """
+    G_succ = G._succ if G.is_directed() else G._adj
+    if isinstance(weight, _WeightSnapshot):
+        G_succ = weight
+        weight = None
+
+    dist = {}  # dictionary of final distances
+    seen = {}
+    fringe = make_heap()
+    for source in sources:
+        seen[source] = 0
+        fringe.insert(source, 0)
+    while fringe:
+        v, d = fringe.pop()
+        dist[v] = d
+        if v == target:
+            break
+        for u, e in G_succ[v].items():
+            cost = e if weight is None else weight(v, u, e)
+            if cost is None:
+                continue
+            vu_dist = d + cost
+            if cutoff is not None:
+                if vu_dist > cutoff:
+                    continue
+            if u in dist:
+                if vu_dist < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif u not in seen or vu_dist < seen[u]:
+                seen[u] = vu_dist
+                fringe.insert(u, vu_dist)
+                if paths is not None:
+                    paths[u] = paths[v] + [u]
+                if pred is not None:
+                    pred[u] = [v]
+            elif vu_dist == seen[u]:
+                if pred is not None:
+                    pred[u].append(v)
+
+    return dist
+
+
+def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight',
+                                      heap=None):
     """Compute weighted shortest path length and predecessors.
 
     Uses Dijkstra's Method to obtain the shortest weighted paths
@@ -831,6 +1171,14 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     pred, distance : dictionaries
@@ -848,10 +1196,12 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
 
     weight = _weight_function(G, weight)
     pred = {source: []}  # dictionary of predecessors
-    return (pred, _dijkstra(G, source, weight, pred=pred, cutoff=cutoff))
+    return (pred, _dijkstra(G, source, weight, pred=pred, cutoff=cutoff,
+                            heap=heap))
 
 
-def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
+def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight',
+                                   heap=None):
     """Compute shortest path lengths between all nodes in a weighted graph.
 
     Parameters
@@ -874,6 +1224,14 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     distance : iterator
@@ -903,12 +1261,15 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
 
     The dictionary returned only has keys for reachable node pairs.
     """
+    # The weights are computed once for all the searches.
+    weight = _weight_snapshot(G, weight)
     length = single_source_dijkstra_path_length
     for n in G:
-        yield (n, dict(length(G, n, cutoff=cutoff, weight=weight)))
+        yield (n, dict(length(G, n, cutoff=cutoff, weight=weight,
+                              heap=heap)))
 
 
-def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
+def all_pairs_dijkstra_path(G, cutoff=None, weight='weight', heap=None):
     """Compute shortest paths between all nodes in a weighted graph.
 
     Parameters
@@ -931,6 +1292,14 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by the search. If None, a binary heap
+       from :mod:`heapq` with lazy deletion is used. Otherwise this is
+       one of 'binary', 'dary', 'pairing' or 'radix', or a callable
+       returning an empty :class:`~networkx.utils.heaps.MinHeap`. The
+       indexed heaps support decrease-key and so never hold stale
+       entries. The 'radix' heap requires nonnegative integer weights.
+
     Returns
     -------
     distance : dictionary
@@ -953,9 +1322,11 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
     floyd_warshall(), all_pairs_bellman_ford_path()
 
     """
+    weight = _weight_snapshot(G, weight)
     path = single_source_dijkstra_path
     # TODO This can be trivially parallelized.
-    return {n: path(G, n, cutoff=cutoff, weight=weight) for n in G}
+    return {n: path(G, n, cutoff=cutoff, weight=weight, heap=heap)
+            for n in G}
 
 def bellman_ford(G, source, weight='weight'):
 
@@ -1068,11 +1439,12 @@ def _bellman_ford(G, source, weight, pred=None, paths=None, dist=None,
     source: list
         List of source nodes
 
-    weight : function
+    weight : function or _WeightSnapshot
        The weight of an edge is the value returned by the function. The
        function must accept exactly three positional arguments: the two
        endpoints of an edge and the dictionary of edge attributes for
-       that edge. The function must return a number.
+       that edge. The function must return a number, or None to hide the
+       edge. The weights are read from the snapshot if one is given.
 
     pred: dict of lists, optional (default=None)
         dict to store a list of predecessors keyed by that node
@@ -1114,7 +1486,9 @@ def _bellman_ford(G, source, weight, pred=None, paths=None, dist=None,
     if dist is None:
         dist = {v: 0 for v in source}
 
-    G_succ = G.succ if G.is_directed() else G.adj
+    # Bellman-Ford relaxes edges many times, so the weights are computed
+    # only once.
+    G_succ = _weight_snapshot(G, weight)
     inf = float('inf')
     n = len(G)
 
@@ -1128,8 +1502,8 @@ def _bellman_ford(G, source, weight, pred=None, paths=None, dist=None,
         # Skip relaxations if any of the predecessors of u is in the queue.
         if all(pred_u not in in_q for pred_u in pred[u]):
             dist_u = dist[u]
-            for v, e in G_succ[u].items():
-                dist_v = dist_u + weight(v, u, e)
+            for v, cost in G_succ[u].items():
+                dist_v = dist_u + cost
 
                 if cutoff is not None:
                     if dist_v > cutoff:
@@ -1471,6 +1845,8 @@ def all_pairs_bellman_ford_path_length(G, cutoff=None, weight='weight'):
 
     The dictionary returned only has keys for reachable node pairs.
     """
+    # The weights are computed once for all the searches.
+    weight = _weight_snapshot(G, weight)
     length = single_source_bellman_ford_path_length
     for n in G:
         yield (n, dict(length(G, n, cutoff=cutoff, weight=weight)))
@@ -1510,6 +1886,7 @@ def all_pairs_bellman_ford_path(G, cutoff=None, weight='weight'):
     floyd_warshall(), all_pairs_dijkstra_path()
 
     """
+    weight = _weight_snapshot(G, weight)
     path = single_source_bellman_ford_path
     # TODO This can be trivially parallelized.
     return {n: path(G, n, cutoff=cutoff, weight=weight) for n in G}
@@ -1692,6 +2069,360 @@ def goldberg_radzik(G, source, weight='weight'):
     return pred, d
 
 
+def spfa(G, source, weight='weight', slf=True, lll=True):
+    """Compute shortest path lengths and predecessors on shortest paths
+    in weighted graphs with a queue-based Bellman–Ford algorithm.
+
+    The shortest path faster algorithm (SPFA) only scans the nodes whose
+    distance decreased since their last scan. It keeps a first-in
+    first-out queue of such nodes, ordered by two heuristics, and the
+    tree of the shortest paths found so far [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The algorithm works for all types of graphs, including directed
+        graphs and multigraphs.
+
+    source: node label
+        Starting node for path
+
+    weight : string or function
+       If this is a string, then edge weights will be accessed via the
+       edge attribute with this key (that is, the weight of the edge
+       joining `u` to `v` will be ``G.edge[u][v][weight]``). If no
+       such edge attribute exists, the weight of the edge is assumed to
+       be one.
+
+       If this is a function, the weight of an edge is the value
+       returned by the function. The function must accept exactly three
+       positional arguments: the two endpoints of an edge and the
+       dictionary of edge attributes for that edge. The function must
+       return a number, or None to hide the edge.
+
+    slf : bool, optional (default=True)
+        If True, use the small label first heuristic: a node whose
+        distance is smaller than the distance of the node at the front of
+        the queue is inserted at the front rather than at the back.
+
+    lll : bool, optional (default=True)
+        If True, use the large label last heuristic: before each scan, the
+        node at the front of the queue is moved to the back if its
+        distance is larger than the average distance in the queue.
+
+    Returns
+    -------
+    pred, dist : dictionaries
+        Returns two dictionaries keyed by node to predecessor in the
+        path and to the distance from the source respectively.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    NetworkXUnbounded
+       If the (di)graph contains a negative cost (di)cycle reachable
+       from the source. Note: any negative weight edge in an undirected
+       graph is a negative cost cycle. Use :func:`find_negative_cycle`
+       to get the cycle.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5, create_using=nx.DiGraph())
+    >>> pred, dist = nx.spfa(G, 0)
+    >>> sorted(pred.items())
+    [(0, None), (1, 0), (2, 1), (3, 2), (4, 3)]
+    >>> sorted(dist.items())
+    [(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)]
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    The dictionaries returned only have keys for nodes reachable from
+    the source.
+
+    When the distance of a node decreases, the subtree of that node in
+    the tree of shortest paths is disassembled: its other nodes are
+    removed from the queue, since their distances are bound to decrease
+    again. A negative cycle is detected as soon as it closes a cycle in
+    the tree, that is, when the node whose distance decreases is an
+    ancestor of the scanned node [2]_.
+
+    See Also
+    --------
+    bellman_ford_predecessor_and_distance, goldberg_radzik,
+    find_negative_cycle
+
+    References
+    ----------
+    .. [1] Dimitri P. Bertsekas,
+       "A simple and fast label correcting algorithm for shortest paths",
+       Networks 23(8):703--709, 1993.
+    .. [2] Boris V. Cherkassky and Andrew V. Goldberg,
+       "Negative-cycle detection algorithms",
+       Mathematical Programming 85(2):277--311, 1999.
+    """
+    if source not in G:
+        raise nx.NodeNotFound("Node %s is not found in the graph" % source)
+    pred = {}
+    dist = {}
+    succ = _weight_snapshot(G, weight)
+    for cycle in _spfa(succ, [source], pred, dist, slf, lll):
+        raise nx.NetworkXUnbounded("Negative cost cycle detected.")
+    return pred, dist
+
+
+def _spfa(succ, sources, pred, dist, slf=True, lll=True, component=None):
+    """Shortest path faster algorithm with subtree disassembly.
+
+    Parameters
+    ----------
+    succ : dict
+        Adjacency dictionary mapping each node to a dictionary of the
+        weights of its out-edges, like a :class:`_WeightSnapshot`.
+
+    sources : list
+        The source nodes, at distance zero.
+
+    pred, dist : dict
+        Dictionaries filled with the predecessor and the distance of the
+        reached nodes.
+
+    slf, lll : bool
+        Whether to use the small label first and the large label last
+        heuristics.
+
+    component : dict, optional (default=None)
+        If None, the search stops at the first negative cycle. Otherwise,
+        a mapping of the nodes to the strongly connected components of
+        the graph, which no edge of `succ` may join. The search then goes
+        on after a negative cycle is found, without the nodes of its
+        component.
+
+    Returns
+    -------
+    iterator
+        The negative cycles found, as lists of nodes whose first and last
+        nodes are the same.
+    """
+    inf = float('inf')
+    # The tree of the shortest paths, as sets of children.
+    children = {}
+    for s in sources:
+        pred[s] = None
+        dist[s] = 0
+        children[s] = set()
+    if component is not None:
+        members = {}
+        for v, c in component.items():
+            members.setdefault(c, []).append(v)
+    queue = deque(sources)
+    queued = set(sources)
+    # Sum of the distances of the queued nodes.
+    total = 0
+    moved = False
+    while queued:
+        u = queue.popleft()
+        if u not in queued:
+            # The node was removed from the queue by a disassembly.
+            continue
+        # Moving nodes to the back until one is below the average can take
+        # quadratic time when the queue is long, so one node is moved at
+        # most before each scan.
+        if lll and not moved and dist[u] * len(queued) > total:
+            moved = True
+            queue.append(u)
+            continue
+        moved = False
+        queued.remove(u)
+        d_u = dist[u]
+        total -= d_u
+        for v, w in succ[u].items():
+            d_v = d_u + w
+            d_old = dist.get(v, inf)
+            if d_v >= d_old:
+                continue
+            # The distance of every node in the subtree of v will decrease
+            # too; if u is one of them, the tree contains a cycle.
+            if v in children:
+                found = u == v
+                stack = [v]
+                subtree = []
+                while stack and not found:
+                    x = stack.pop()
+                    subtree.append(x)
+                    found = u in children[x]
+                    stack.extend(children[x])
+                if found:
+                    cycle = [u]
+                    while cycle[-1] != v:
+                        cycle.append(pred[cycle[-1]])
+                    cycle.reverse()
+                    cycle.append(v)
+                    yield cycle
+                    if component is None:
+                        return
+                    for x in members[component[v]]:
+                        if x in queued:
+                            queued.remove(x)
+                            total -= dist[x]
+                    break
+                for x in subtree[1:]:
+                    del children[x]
+                    if x in queued:
+                        queued.remove(x)
+                        total -= dist[x]
+                children[v].clear()
+                p = pred[v]
+                if p in children:
+                    children[p].discard(v)
+            else:
+                children[v] = set()
+            pred[v] = u
+            dist[v] = d_v
+            children[u].add(v)
+            if v in queued:
+                total += d_v - d_old
+            else:
+                queued.add(v)
+                total += d_v
+                if slf and queue and d_v < dist[queue[0]]:
+                    queue.appendleft(v)
+                else:
+                    queue.append(v)
+
+
+def find_negative_cycle(G, source=None, weight='weight'):
+    """Returns a cycle with negative total weight.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node, optional (default=None)
+        If given, only the cycles reachable from this node are searched.
+        Otherwise the cycles anywhere in `G` are.
+
+    weight : string or function
+       If this is a string, then edge weights will be accessed via the
+       edge attribute with this key (that is, the weight of the edge
+       joining `u` to `v` will be ``G.edge[u][v][weight]``). If no
+       such edge attribute exists, the weight of the edge is assumed to
+       be one.
+
+       If this is a function, the weight of an edge is the value
+       returned by the function. The function must accept exactly three
+       positional arguments: the two endpoints of an edge and the
+       dictionary of edge attributes for that edge. The function must
+       return a number, or None to hide the edge.
+
+    Returns
+    -------
+    cycle : list
+        The nodes of a negative cycle, in order. The first and the last
+        nodes are the same.
+
+    Raises
+    ------
+    NetworkXError
+        If there is no negative cycle.
+
+    NodeNotFound
+        If `source` is not in `G`.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(5, create_using=nx.DiGraph())
+    >>> G[1][2]['weight'] = -7
+    >>> nx.find_negative_cycle(G)
+    [1, 2, 3, 4, 0, 1]
+
+    Notes
+    -----
+    The cycle is found by :func:`spfa`, started from all the nodes at
+    once if `source` is None. For multigraphs, the lightest of the
+    parallel edges is used.
+
+    See Also
+    --------
+    negative_cycles, negative_edge_cycle, spfa
+    """
+    if source is None:
+        sources = list(G)
+    elif source not in G:
+        raise nx.NodeNotFound("Node %s is not found in the graph" % source)
+    else:
+        sources = [source]
+    succ = _weight_snapshot(G, weight)
+    for cycle in _spfa(succ, sources, {}, {}):
+        return cycle
+    raise nx.NetworkXError("No negative cycle detected.")
+
+
+def negative_cycles(G, weight='weight'):
+    """Generate a negative cycle in each strongly connected component of
+    G that has one.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        For undirected graphs, the connected components are used.
+
+    weight : string or function
+       If this is a string, then edge weights will be accessed via the
+       edge attribute with this key (that is, the weight of the edge
+       joining `u` to `v` will be ``G.edge[u][v][weight]``). If no
+       such edge attribute exists, the weight of the edge is assumed to
+       be one.
+
+       If this is a function, the weight of an edge is the value
+       returned by the function. The function must accept exactly three
+       positional arguments: the two endpoints of an edge and the
+       dictionary of edge attributes for that edge. The function must
+       return a number, or None to hide the edge.
+
+    Returns
+    -------
+    cycles : iterator
+        The negative cycles, as lists of nodes whose first and last nodes
+        are the same. No two cycles share a component.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_weighted_edges_from([(0, 1, 1), (1, 0, -2), (1, 2, 1),
+    ...                            (2, 3, 1), (3, 2, -2), (4, 5, 1)])
+    >>> list(nx.negative_cycles(G))
+    [[1, 0, 1], [3, 2, 3]]
+
+    Notes
+    -----
+    All the components are searched in a single run of :func:`spfa`
+    started from all the nodes, without the edges joining different
+    components. When a negative cycle is found, the nodes of its
+    component are dropped from the search.
+
+    See Also
+    --------
+    find_negative_cycle, negative_edge_cycle
+    """
+    if G.is_directed():
+        components = nx.strongly_connected_components(G)
+    else:
+        components = nx.connected_components(G)
+    component = {}
+    for i, c in enumerate(components):
+        component.update(dict.fromkeys(c, i))
+    succ = _weight_snapshot(G, weight)
+    succ = {u: {v: w for v, w in nbrs.items()
+                if component[v] == component[u]}
+            for u, nbrs in succ.items()}
+    return _spfa(succ, list(G), {}, {}, component=component)
+
+
 def negative_edge_cycle(G, weight='weight'):
     """Return True if there exists a negative edge cycle anywhere in G.
 
@@ -1732,20 +2463,16 @@ def negative_edge_cycle(G, weight='weight'):
     Edge weight attributes must be numerical.
     Distances are calculated as sums of weighted edges traversed.
 
-    This algorithm uses bellman_ford_predecessor_and_distance() but finds negative cycles
-    on any component by first adding a new node connected to
-    every node, and starting bellman_ford_predecessor_and_distance on that node.  It then
-    removes that extra node.
-    """
-    newnode = generate_unique_node()
-    G.add_edges_from([(newnode, n) for n in G])
+    This algorithm runs :func:`spfa` from all the nodes at once, which
+    finds negative cycles in any component without changing `G`.
 
-    try:
-        bellman_ford_predecessor_and_distance(G, newnode, weight)
-    except nx.NetworkXUnbounded:
+    See Also
+    --------
+    find_negative_cycle, negative_cycles
+    """
+    succ = _weight_snapshot(G, weight)
+    for cycle in _spfa(succ, list(G), {}, {}):
         return True
-    finally:
-        G.remove_node(newnode)
     return False
 
 
@@ -1982,6 +2709,8 @@ def johnson(G, weight='weight'):
     # relaxation distances.
     scale = lambda u, v: dist_bellman[u] - dist_bellman[v]
     new_weight = lambda u, v, d: weight(u, v, d) + scale(u, v)
+    # The reweighted edges are computed once for all the searches.
+    new_weight = _weight_snapshot(G, new_weight)
 
     def dist_path(v):
         paths = {v: [v]}
@@ -226,7 +226,7 @@ def _all_simple_paths_multigraph(G, source, target, cutoff=None):
 
 
 @not_implemented_for('multigraph')
-def shortest_simple_paths(G, source, target, weight=None):
+def shortest_simple_paths(G, source, target, weight=None, executor=None):
     """Generate all simple paths in the graph G from source to target,
        starting from shortest ones.
 
@@ -249,6 +249,15 @@ def shortest_simple_paths(G, source, target, weight=None):
         Name of the edge attribute to be used as a weight. If None all
         edges are considered to have unit weight. Default value None.
 
+    executor : object, optional (default=None)
+        An object with a ``map(func, iterable)`` method, such as a
+        :class:`multiprocessing.Pool` or a
+        :class:`concurrent.futures.Executor`. If given, all the spur path
+        searches started by a newly found path are evaluated in parallel
+        through it instead of being postponed. Each task carries the
+        adjacency of `G`, so this only pays off for expensive searches on
+        large graphs.
+
     Returns
     -------
     path_generator: generator
@@ -290,6 +299,21 @@ def shortest_simple_paths(G, source, target, weight=None):
     This procedure is based on algorithm by Jin Y. Yen [1]_.  Finding
     the first K paths requires O(KN^3) operations.
 
+    A shortest path tree towards `target` is computed once. Its distances
+    are lower bounds on the length of every spur path, since a spur path
+    is a shortest path in a graph from which some nodes and edges have
+    been removed. They are used in two ways [2]_:
+
+    * spur path searches are postponed until their lower bound is smaller
+      than the length of the best path found so far, so most of them are
+      never run when only the first few paths are consumed;
+    * each spur path search is an A* search guided by the tree distances,
+      which stops as soon as it reaches a node whose path in the tree
+      avoids the removed nodes.
+
+    The removed nodes and edges are tested inline in the search instead of
+    through filtered views of the graph.
+
     See Also
     --------
     all_shortest_paths
@@ -301,6 +325,9 @@ def shortest_simple_paths(G, source, target, weight=None):
     .. [1] Jin Y. Yen, "Finding the K Shortest Loopless Paths in a
        Network", Management Science, Vol. 17, No. 11, Theory Series
        (Jul., 1971), pp. 712-716.
+    .. [2] Ernesto Q. V. Martins and Marta M. B. Pascoal, "A new
+       implementation of Yen's ranking loopless paths algorithm",
+       4OR 1(2):121-133, 2003.
 
     """
     if source not in G:
@@ -309,48 +336,77 @@ def shortest_simple_paths(G, source, target, weight=None):
     if target not in G:
         raise nx.NodeNotFound('target node %s not in graph' % target)
 
-    if weight is None:
-        length_func = len
-        shortest_path_func = _bidirectional_shortest_path
+    if G.is_directed():
+        succ, pred = G._succ, G._pred
     else:
-        def length_func(path):
-            return sum(G.adj[u][v][weight] for (u, v) in zip(path, path[1:]))
-        shortest_path_func = _bidirectional_dijkstra
+        succ = pred = G._adj
+    dist, hops, next_hop = _reverse_shortest_path_tree(pred, target, weight)
+    if source not in dist:
+        raise nx.NetworkXNoPath("No path between %s and %s." %
+                                (source, target))
 
     listA = list()
     listB = PathBuffer()
-    prev_path = None
+    listB.push(dist[source], _tree_path(next_hop, source))
+    # Postponed spur searches, keyed by a lower bound on their length.
+    pending = []
+    found = set()
+    c = count()
     while True:
-        if not prev_path:
-            length, path = shortest_path_func(G, source, target, weight=weight)
-            listB.push(length, path)
-        else:
-            ignore_nodes = set()
-            ignore_edges = set()
-            for i in range(1, len(prev_path)):
-                root = prev_path[:i]
-                root_length = length_func(root)
-                for path in listA:
-                    if path[:i] == root:
-                        ignore_edges.add((path[i-1], path[i]))
-                ignore_nodes.add(root[-1])
-                try:
-                    length, spur = shortest_path_func(G, root[-1], target,
-                                                      ignore_nodes=ignore_nodes,
-                                                      ignore_edges=ignore_edges,
-                                                      weight=weight)
-                    path = root[:-1] + spur
-                    listB.push(root_length + length, path)
-                except nx.NetworkXNoPath:
-                    pass
-
-        if listB:
-            path = listB.pop()
-            yield path
-            listA.append(path)
-            prev_path = path
-        else:
+        while pending and (not listB or pending[0][0] < listB.min_cost()):
+            _, _, root, root_length, task = heappop(pending)
+            spur = _spur_path(*task)
+            if spur is not None:
+                path = root[:-1] + spur[1]
+                # The edges blocked by the task predate the paths found
+                # since it was created, so it may find one of them again.
+                # The other paths it covers are covered by the spur
+                # searches of that path.
+                if tuple(path) not in found:
+                    listB.push(root_length + spur[0], path)
+        if not listB:
             break
+        path = listB.pop()
+        yield path
+        listA.append(path)
+        found.add(tuple(path))
+
+        # Yen's spur searches from every node of the new path. The spur
+        # search must avoid the root and the edges out of the spur node
+        # taken by any found path sharing the root.
+        tasks = []
+        sharing = listA
+        root_length = 0
+        for i in range(1, len(path)):
+            spur_node = path[i - 1]
+            if i > 1:
+                root_length += _edge_cost(succ[path[i - 2]][spur_node],
+                                          weight)
+            sharing = [p for p in sharing
+                       if len(p) > i and p[i - 1] == spur_node]
+            blocked = {p[i] for p in sharing}
+            root = path[:i]
+            root_nodes = set(root)
+            bound = None
+            for w, e in succ[spur_node].items():
+                if w in root_nodes or w in blocked or w not in dist:
+                    continue
+                d = _edge_cost(e, weight) + dist[w]
+                if bound is None or d < bound:
+                    bound = d
+            if bound is None:
+                continue
+            task = (succ, weight, dist, hops, next_hop, spur_node, target,
+                    root_nodes, blocked)
+            tasks.append((root_length + bound, root, root_length, task))
+        if executor is not None:
+            spurs = executor.map(_spur_task, [t[3] for t in tasks])
+            for (_, root, root_length, _), spur in zip(tasks, spurs):
+                if spur is not None:
+                    listB.push(root_length + spur[0], root[:-1] + spur[1])
+        else:
+            for bound, root, root_length, task in tasks:
+                heappush(pending, (bound, next(c), root, root_length, task))
 
 
 class PathBuffer(object):
@@ -366,15 +422,135 @@ class PathBuffer(object):
     def push(self, cost, path):
         hashable_path = tuple(path)
         if hashable_path not in self.paths:
-            heappush(self.sortedpaths, (cost, next(self.counter), path))
+            heappush(self.sortedpaths,
+                     (cost, len(path), next(self.counter), path))
             self.paths.add(hashable_path)
 
     def pop(self):
-        (cost, num, path) = heappop(self.sortedpaths)
+        (cost, _, num, path) = heappop(self.sortedpaths)
         hashable_path = tuple(path)
         self.paths.remove(hashable_path)
         return path
 
+    def min_cost(self):
+        return self.sortedpaths[0][0]
+
+
+def _edge_cost(data, weight):
+    """Returns the cost of an edge with attribute dictionary `data`."""
+    if weight is None:
+        return 1
+    return data.get(weight, 1)
+
+
+def _reverse_shortest_path_tree(pred, target, weight):
+    """Dijkstra's algorithm towards `target`.
+
+    Returns ``(dist, hops, next_hop)`` where ``dist[v]`` is the length of
+    a shortest path from `v` to `target`, ``hops[v]`` the number of edges
+    of that path and ``next_hop[v]`` the node following `v` on it. Among
+    shortest paths, the one with the fewest edges is chosen. `pred` is the
+    predecessor adjacency of the graph.
+    """
+    dist = {}
+    hops = {}
+    seen = {target: (0, 0)}
+    next_hop = {target: None}
+    c = count()
+    fringe = [(0, 0, next(c), target)]
+    while fringe:
+        d, h, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        hops[v] = h
+        for u, e in pred[v].items():
+            uv = (d + _edge_cost(e, weight), h + 1)
+            if u in dist:
+                if uv[0] < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif u not in seen or uv < seen[u]:
+                seen[u] = uv
+                next_hop[u] = v
+                heappush(fringe, (uv[0], uv[1], next(c), u))
+    return dist, hops, next_hop
+
+
+def _tree_path(next_hop, v):
+    """Returns the path from `v` to the root of a shortest path tree."""
+    path = [v]
+    v = next_hop[v]
+    while v is not None:
+        path.append(v)
+        v = next_hop[v]
+    return path
+
+
+def _spur_path(succ, weight, dist, hops, next_hop, spur, target,
+               root_nodes, blocked):
+    """Returns ``(length, path)`` for a shortest path from `spur` to
+    `target` avoiding the nodes in `root_nodes` other than `spur` and the
+    edges from `spur` to the nodes in `blocked`, or None if there is no
+    such path. Among shortest paths, one with the fewest edges is chosen.
+
+    This is an A* search using the distances `dist` to `target` in the
+    whole graph as heuristic. Those distances are exact as long as the
+    path given by `next_hop` avoids `root_nodes`, so the search can stop
+    as soon as it selects a node whose tree path is clean.
+    """
+    # clean[v] is True if the tree path from v avoids the root nodes.
+    clean = {target: True}
+
+    def is_clean(v):
+        walked = []
+        while v not in clean:
+            if v in root_nodes:
+                clean[v] = False
+                break
+            walked.append(v)
+            v = next_hop[v]
+        result = clean[v]
+        for x in walked:
+            clean[x] = result
+        return result
+
+    c = count()
+    # The fringe holds (estimated length, estimated number of edges, c,
+    # length so far, edges so far, node).
+    fringe = [(0, 0, next(c), 0, 0, spur)]
+    seen = {spur: (0, 0)}
+    parent = {spur: None}
+    explored = set()
+    while fringe:
+        f, fh, _, g, gh, v = heappop(fringe)
+        if v in explored:
+            continue
+        if v != spur and is_clean(v):
+            path = [v]
+            while parent[path[-1]] is not None:
+                path.append(parent[path[-1]])
+            path.reverse()
+            return f, path + _tree_path(next_hop, v)[1:]
+        explored.add(v)
+        for w, e in succ[v].items():
+            if w in root_nodes or w in explored or w not in dist:
+                continue
+            if v == spur and w in blocked:
+                continue
+            wg = (g + _edge_cost(e, weight), gh + 1)
+            if w not in seen or wg < seen[w]:
+                seen[w] = wg
+                parent[w] = v
+                heappush(fringe, (wg[0] + dist[w], wg[1] + hops[w], next(c),
+                                  wg[0], wg[1], w))
+    return None
+
+
+def _spur_task(args):
+    """Picklable wrapper of :func:`_spur_path` for executors."""
+    return _spur_path(*args)
+
 
 def _bidirectional_shortest_path(G, source, target,
                                  ignore_nodes=None,
@@ -81,3 +81,23 @@ class TestCommunicability:
         for k1,val in result.items():
             for k2 in val:
                 assert_almost_equal(answer[k1][k2],result[k1][k2],places=7)
+
+        result=communicability_lanczos(G1)
+        for k1,val in result.items():
+            for k2 in val:
+                assert_almost_equal(answer[k1][k2],result[k1][k2],places=7)
+
+    def test_communicability_lanczos(self):
+        G = nx.barabasi_albert_graph(200, 3, seed=1)
+        answer = communicability_exp(G)
+        result = communicability_lanczos(G, nbunch=[0, 5, 199])
+        assert_equal(set(result), set([0, 5, 199]))
+        for u in result:
+            for v in G:
+                assert_almost_equal(answer[u][v], result[u][v], places=5)
+        G = nx.Graph([(0, 1), (2, 3)])
+        result = communicability_lanczos(G, nbunch=[0])
+        assert_equal(result[0][2], 0)
+        assert_almost_equal(result[0][1], 1.1752011936438012)
+        assert_raises(nx.ExceededMaxIterations, communicability_lanczos,
+                      nx.karate_club_graph(), max_iter=2)
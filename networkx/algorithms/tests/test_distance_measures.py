@@ -81,3 +81,98 @@ class TestDistance:
     def test_eccentricity_directed_weakly_connected(self):
         DG = networkx.DiGraph([(1,2),(1,3)])
         networkx.eccentricity(DG)
+
+
+class TestBounding:
+
+    def check(self, G, weight=None):
+        if weight is None:
+            sp = {u: dict(networkx.single_source_shortest_path_length(G, u))
+                  for u in G}
+        else:
+            sp = {u: dict(networkx.single_source_dijkstra_path_length(
+                G, u, weight=weight)) for u in G}
+        e = {u: max(sp[u].values()) for u in G}
+        d = max(e.values())
+        r = min(e.values())
+        # weighted distances summed in another order may differ by rounding
+        for ecc in (networkx.eccentricity(G, weight=weight),
+                    networkx.eccentricity(G, weight=weight, usebounds=True)):
+            assert_equal(set(ecc), set(e))
+            for v in e:
+                assert_almost_equal(ecc[v], e[v])
+        assert_almost_equal(networkx.diameter(G, usebounds=True,
+                                              weight=weight), d)
+        assert_almost_equal(networkx.radius(G, usebounds=True,
+                                            weight=weight), r)
+        assert_equal(set(networkx.periphery(G, usebounds=True,
+                                            weight=weight)),
+                     {v for v in e if abs(e[v] - d) < 1e-9})
+        assert_equal(set(networkx.center(G, usebounds=True, weight=weight)),
+                     {v for v in e if abs(e[v] - r) < 1e-9})
+
+    def test_directed(self):
+        for seed in range(10):
+            G = networkx.gnp_random_graph(30, 0.1, seed=seed, directed=True)
+            scc = max(networkx.strongly_connected_components(G), key=len)
+            self.check(G.subgraph(scc))
+
+    def test_weighted(self):
+        for seed in range(10):
+            G = networkx.gnp_random_graph(30, 0.15, seed=seed,
+                                          directed=seed % 2 == 0)
+            if G.is_directed():
+                nodes = max(networkx.strongly_connected_components(G),
+                            key=len)
+            else:
+                nodes = max(networkx.connected_components(G), key=len)
+            G = G.subgraph(nodes).copy()
+            for u, v in G.edges():
+                G[u][v]['weight'] = (u * v) % 5 / 2 + 0.5
+            self.check(G, weight='weight')
+
+    def test_inexact_weights(self):
+        # Sums of these weights are rounded, so the lower bound of a node
+        # can end up just above its upper bound.
+        G = networkx.DiGraph()
+        G.add_weighted_edges_from([
+            (0, 14, 2), (1, 4, .1), (2, 11, .1), (3, 9, 20), (4, 15, .5),
+            (5, 2, 2), (6, 0, 1), (6, 5, 1.5), (7, 5, 2), (7, 10, 20),
+            (8, 6, 20), (9, 13, 3.25), (10, 5, .5), (11, 2, 2), (11, 19, 2),
+            (12, 3, 20), (12, 16, 2), (13, 7, 1.5), (14, 1, 2), (15, 12, .1),
+            (16, 8, 7), (17, 16, 2), (18, 17, 7), (19, 10, 7), (19, 18, 1.5)])
+        assert_almost_equal(networkx.diameter(G, usebounds=True,
+                                              weight='weight'), 92.55)
+        self.check(G, weight='weight')
+        weights = [0.1, 0.2, 0.3, 0.7, 1.1]
+        for seed in range(10):
+            G = networkx.gnp_random_graph(25, 0.2, seed=seed,
+                                          directed=seed % 2 == 0)
+            if G.is_directed():
+                nodes = max(networkx.strongly_connected_components(G),
+                            key=len)
+            else:
+                nodes = max(networkx.connected_components(G), key=len)
+            G = G.subgraph(nodes).copy()
+            for u, v in G.edges():
+                G[u][v]['weight'] = weights[(u + 3 * v) % 5]
+            self.check(G, weight='weight')
+
+    def test_eccentricity_bounds(self):
+        G = networkx.grid_2d_graph(6, 7)
+        e = networkx.eccentricity(G)
+        steps = 0
+        for lower, upper in networkx.eccentricity_bounds(G):
+            steps += 1
+            for v in G:
+                assert_true(lower[v] <= e[v] <= upper[v])
+        assert_equal(lower, e)
+        assert_equal(upper, e)
+        assert_true(steps < len(G))
+
+    def test_directed_not_strongly_connected(self):
+        G = networkx.DiGraph([(0, 1), (1, 2), (2, 1)])
+        assert_raises(networkx.NetworkXError, networkx.diameter, G,
+                      usebounds=True)
+        assert_raises(networkx.NetworkXError, list,
+                      networkx.eccentricity_bounds(G))
@@ -0,0 +1,66 @@
+from nose.tools import assert_equal
+from nose.tools import assert_false
+from nose.tools import assert_raises
+from nose.tools import assert_true
+import random
+
+import networkx as nx
+
+
+class TestReachabilityIndex(object):
+
+    def check_index(self, G, index):
+        for u in G:
+            descendants = nx.descendants(G, u)
+            assert_equal(index.descendants(u), descendants)
+            assert_equal(index.ancestors(u), nx.ancestors(G, u))
+            for v in G:
+                assert_equal(index.has_path(u, v),
+                             u == v or v in descendants)
+
+    def test_random_graphs(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(30, 0.06, seed=seed, directed=True)
+            self.check_index(G, nx.ReachabilityIndex(G, seed=seed))
+            D = nx.DiGraph((u, v) for u, v in G.edges() if u < v)
+            self.check_index(D, nx.ReachabilityIndex(D, labels=1))
+
+    def test_add_edge(self):
+        rng = random.Random(1)
+        for seed in range(5):
+            G = nx.gnp_random_graph(25, 0.04, seed=seed, directed=True)
+            index = nx.ReachabilityIndex(G, labels=3, seed=seed)
+            for _ in range(20):
+                index.add_edge(rng.randint(0, 27), rng.randint(0, 27))
+                self.check_index(G, index)
+
+    def test_merge(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 3), (0, 4), (4, 3), (5, 2)])
+        index = nx.ReachabilityIndex(G)
+        assert_false(index.has_path(3, 0))
+        index.add_edge(3, 1, weight=2)
+        assert_equal(G[3][1]['weight'], 2)
+        assert_true(index.has_path(2, 1))
+        assert_false(index.has_path(3, 0))
+        assert_equal(index.descendants(3), {1, 2})
+        assert_equal(index.ancestors(3), {0, 1, 2, 4, 5})
+        index.add_edge(3, 0)
+        self.check_index(G, index)
+
+    def test_add_node_and_rebuild(self):
+        G = nx.DiGraph([(0, 1)])
+        index = nx.ReachabilityIndex(G)
+        index.add_node(2)
+        assert_false(index.has_path(0, 2))
+        G.add_edge(1, 2)
+        index.rebuild()
+        assert_true(index.has_path(0, 2))
+
+    def test_errors(self):
+        G = nx.DiGraph([(0, 1)])
+        index = nx.ReachabilityIndex(G)
+        assert_raises(nx.NodeNotFound, index.has_path, 0, 2)
+        assert_raises(nx.NodeNotFound, index.descendants, 2)
+        assert_raises(nx.NetworkXNotImplemented, nx.ReachabilityIndex,
+                      nx.path_graph(2))
+        assert_raises(ValueError, nx.ReachabilityIndex, G, labels=0)
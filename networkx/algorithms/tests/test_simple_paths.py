@@ -213,6 +213,51 @@ def test_weight_name():
     solution = [[0, 6, 5, 4, 3], [0, 1, 2, 3]]
     assert_equal(paths, solution)
 
+def test_shortest_simple_paths_all_paths():
+    def cost_func(G, path):
+        return sum(G.adj[u][v]['weight'] for (u, v) in zip(path, path[1:]))
+    for seed in range(20):
+        G = nx.gnp_random_graph(8, 0.4, seed=seed, directed=seed % 2 == 0)
+        rng = random.Random(seed)
+        for u, v in G.edges():
+            G.adj[u][v]['weight'] = rng.randint(1, 5)
+        if not nx.has_path(G, 0, 7):
+            continue
+        paths = list(nx.shortest_simple_paths(G, 0, 7, weight='weight'))
+        costs = [cost_func(G, path) for path in paths]
+        assert_equal(costs, sorted(costs))
+        assert_equal(sorted(paths), sorted(nx.all_simple_paths(G, 0, 7)))
+
+
+class MapExecutor(object):
+    """Executor running the tasks sequentially."""
+    def __init__(self):
+        self.calls = 0
+
+    def map(self, func, iterable):
+        self.calls += 1
+        return map(func, iterable)
+
+
+def test_shortest_simple_paths_executor():
+    G = cnlti(nx.grid_2d_graph(4, 4), first_label=1, ordering="sorted")
+    executor = MapExecutor()
+    paths = list(nx.shortest_simple_paths(G, 1, 12, executor=executor))
+    assert_equal(executor.calls, len(paths))
+    assert_equal([len(path) for path in paths],
+                 [len(path) for path in nx.shortest_simple_paths(G, 1, 12)])
+    assert_equal(sorted(paths), sorted(nx.all_simple_paths(G, 1, 12)))
+
+
+def test_shortest_simple_paths_fewest_edges_first():
+    G = nx.Graph()
+    G.add_edge(0, 1, weight=1)
+    G.add_edge(1, 2, weight=1)
+    G.add_edge(2, 3, weight=1)
+    G.add_edge(0, 3, weight=3)
+    paths = list(nx.shortest_simple_paths(G, 0, 3, weight='weight'))
+    assert_equal(paths, [[0, 3], [0, 1, 2, 3]])
+
 @raises(nx.NodeNotFound)
 def test_ssp_source_missing():
     G = nx.Graph()
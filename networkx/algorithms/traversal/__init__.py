@@ -2,3 +2,4 @@ from .beamsearch import *
 from .breadth_first_search import *
 from .depth_first_search import *
 from .edgedfs import *
+from .array_bfs import *
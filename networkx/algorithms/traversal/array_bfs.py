@@ -0,0 +1,477 @@
+# -*- coding: utf-8 -*-
+#    Copyright (C) 2017 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+"""Breadth-first search on array adjacency with NumPy.
+
+The graph is converted once to compressed sparse row (CSR) arrays, and
+each level of the search is expanded with vectorized operations on the
+whole frontier instead of one node at a time.
+"""
+from itertools import chain
+
+import networkx as nx
+
+__all__ = ['bfs_arrays', 'bfs_distance_matrix']
+
+
+def bfs_arrays(G, source, nodelist=None, alpha=14, beta=24):
+    """Returns the breadth-first search distances and parents from
+    `source` as NumPy arrays.
+
+    The search is level-synchronous and direction-optimizing [1]_: a
+    level is expanded top-down, from the edges leaving the frontier, while
+    the frontier is small, and bottom-up, by looking for a parent in the
+    frontier among the predecessors of every unvisited node, once the
+    frontier is large. Both kinds of steps are vectorized with NumPy.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+       Starting node for the search.
+
+    nodelist : list, optional
+       The order of the nodes in the returned arrays. If None, the
+       ordering is produced by ``G.nodes()``. Nodes not in `nodelist` are
+       ignored.
+
+    alpha : float, optional (default=14)
+       Switch to bottom-up steps when the number of edges leaving the
+       frontier exceeds the number of edges entering unvisited nodes
+       divided by `alpha`.
+
+    beta : float, optional (default=24)
+       Switch back to top-down steps when the frontier shrinks below the
+       number of nodes divided by `beta`.
+
+    Returns
+    -------
+    dist : NumPy array
+       ``dist[i]`` is the number of edges of a shortest path from `source`
+       to ``nodelist[i]``, or -1 if there is no such path.
+
+    parent : NumPy array
+       ``parent[i]`` is the index in `nodelist` of the node preceding
+       ``nodelist[i]`` on a shortest path from `source`, or -1 if there is
+       no such path. The parent of `source` is itself.
+
+    Raises
+    ------
+    NodeNotFound
+       If `source` is not in `nodelist`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> dist, parent = nx.bfs_arrays(G, 1)
+    >>> dist.tolist()
+    [1, 0, 1, 2]
+    >>> parent.tolist()
+    [1, 1, 1, 2]
+
+    Notes
+    -----
+    Converting the graph to arrays takes time linear in its size, so the
+    search pays off on large graphs or when the arrays are reused, as in
+    :func:`networkx.bfs_distance_matrix`.
+
+    References
+    ----------
+    .. [1] S. Beamer, K. Asanović and D. Patterson,
+       "Direction-optimizing breadth-first search",
+       Scientific Programming 21(3-4):137-148, 2013.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("bfs_arrays() requires numpy: http://scipy.org/ ")
+    nodelist, index, out_csr, in_csr = _csr_adjacency(G, nodelist)
+    if source not in index:
+        raise nx.NodeNotFound('Source {} is not in G'.format(source))
+    return _bfs_csr(out_csr, in_csr, np.array([index[source]]), alpha, beta)
+
+
+def bfs_distance_matrix(G, sources=None, nodelist=None, cutoff=None):
+    """Returns the matrix of breadth-first search distances from several
+    sources as a NumPy array.
+
+    The searches from up to 64 sources advance together, level by level:
+    each node holds one machine word whose bits tell which of the searches
+    have reached it, and a level is expanded for all the searches at once
+    with bitwise operations on the words of the frontier nodes and their
+    neighbors [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : list, optional
+       Starting nodes of the searches, one row of the result per source.
+       If None, every node in `nodelist` is a source.
+
+    nodelist : list, optional
+       The order of the nodes in the columns of the result. If None, the
+       ordering is produced by ``G.nodes()``. Nodes not in `nodelist` are
+       ignored.
+
+    cutoff : integer, optional
+       Depth at which to stop the searches. Only distances at most `cutoff`
+       are found.
+
+    Returns
+    -------
+    D : NumPy array
+       ``D[i, j]`` is the number of edges of a shortest path from
+       ``sources[i]`` to ``nodelist[j]``, or -1 if there is no such path.
+
+    Raises
+    ------
+    NodeNotFound
+       If a source is not in `nodelist`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> D = nx.bfs_distance_matrix(G, sources=[0, 3])
+    >>> D.tolist()
+    [[0, 1, 2, 3], [3, 2, 1, 0]]
+    >>> G = nx.DiGraph([(0, 1), (1, 2)])
+    >>> nx.bfs_distance_matrix(G).tolist()
+    [[0, 1, 2], [-1, 0, 1], [-1, -1, 0]]
+
+    Notes
+    -----
+    The result takes memory proportional to the number of sources times
+    the number of nodes. :func:`~networkx.all_pairs_shortest_path_length`
+    with ``method='numpy'``, :func:`~networkx.closeness_centrality` and
+    :func:`~networkx.harmonic_centrality` use the same searches but only
+    keep 64 rows at a time.
+
+    References
+    ----------
+    .. [1] M. Then, M. Kaufmann, F. Chirigati, T.-A. Hoang-Vu, K. Pham,
+       A. Kemper, T. Neumann and H. T. Vo,
+       "The more the merrier: efficient multi-source graph traversal",
+       Proceedings of the VLDB Endowment 8(4):449-460, 2014.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "bfs_distance_matrix() requires numpy: http://scipy.org/ ")
+    nodelist, index, out_csr, in_csr = _csr_adjacency(G, nodelist)
+    if sources is None:
+        sources = nodelist
+    for s in sources:
+        if s not in index:
+            raise nx.NodeNotFound('Source {} is not in G'.format(s))
+    sources = np.array([index[s] for s in sources], dtype=np.intp)
+    chunks = [dist for _, dist in
+              _bfs_bitsets(out_csr, in_csr, sources, cutoff)]
+    if not chunks:
+        return np.empty((0, len(nodelist)), dtype=np.intp)
+    return np.concatenate(chunks)
+
+
+def _has_numpy():
+    """Returns True if NumPy can be imported."""
+    try:
+        import numpy  # noqa: F401 -- only checks that NumPy is available
+    except ImportError:
+        return False
+    return True
+
+
+def _csr_adjacency(G, nodelist=None):
+    """Returns ``(nodelist, index, out_csr, in_csr)``.
+
+    `index` maps each node to its position in `nodelist`, and `out_csr`
+    and `in_csr` are ``(indptr, indices)`` pairs of arrays holding the
+    successors and the predecessors of each node. For undirected graphs
+    both pairs are the same. Self-loops and parallel edges are kept.
+    """
+    import numpy as np
+    if nodelist is None:
+        nodelist = list(G)
+    index = dict(zip(nodelist, range(len(nodelist))))
+
+    def csr(adj):
+        rows = list(map(adj.__getitem__, nodelist))
+        degree = np.fromiter(map(len, rows), dtype=np.intp,
+                             count=len(nodelist))
+        nbrs = chain.from_iterable(rows)
+        if len(index) == len(G):
+            indices = np.fromiter(map(index.__getitem__, nbrs),
+                                  dtype=np.intp, count=int(degree.sum()))
+        else:
+            # Drop the edges to nodes outside of nodelist.
+            indices = np.fromiter((index.get(v, -1) for v in nbrs),
+                                  dtype=np.intp, count=int(degree.sum()))
+            keep = indices >= 0
+            rows = np.repeat(np.arange(len(nodelist)), degree)[keep]
+            indices = indices[keep]
+            degree = np.bincount(rows, minlength=len(nodelist))
+        indptr = np.zeros(len(nodelist) + 1, dtype=np.intp)
+        np.cumsum(degree, out=indptr[1:])
+        return indptr, indices
+
+    if G.is_directed():
+        return nodelist, index, csr(G._succ), csr(G._pred)
+    out_csr = csr(G._adj)
+    return nodelist, index, out_csr, out_csr
+
+
+def _gather(indptr, indices, rows, offset=0):
+    """Returns ``(row, neighbor)`` arrays with one entry for each of the
+    neighbors of the nodes in `rows`, skipping the first `offset`
+    neighbors of each node.
+    """
+    import numpy as np
+    starts = indptr[rows] + offset
+    lengths = np.maximum(indptr[rows + 1] - starts, 0)
+    total = int(lengths.sum())
+    # Position of each gathered entry in `indices`.
+    shift = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    pos = shift + np.arange(total)
+    return np.repeat(rows, lengths), indices[pos]
+
+
+# Number of vectorized rounds of the bottom-up step that test one
+# predecessor of every unvisited node, before the remaining predecessors
+# are tested all at once.
+_BOTTOM_UP_ROUNDS = 4
+
+
+def _bfs_csr(out_csr, in_csr, sources, alpha=14, beta=24, cutoff=None):
+    """Direction-optimizing breadth-first search on CSR arrays.
+
+    Returns the distance and parent arrays of a search started from all
+    the node indices in `sources` at distance zero. Only nodes at
+    distance at most `cutoff` are reached, if it is given.
+    """
+    import numpy as np
+    out_ptr, out_idx = out_csr
+    in_ptr, in_idx = in_csr
+    n = len(out_ptr) - 1
+    dist = np.full(n, -1, dtype=np.intp)
+    parent = np.full(n, -1, dtype=np.intp)
+    frontier = np.unique(sources)
+    dist[frontier] = 0
+    parent[frontier] = frontier
+    out_degree = np.diff(out_ptr)
+    in_degree = np.diff(in_ptr)
+    # Number of edges entering unvisited nodes.
+    unexplored = int(in_degree.sum() - in_degree[frontier].sum())
+    bottom_up = False
+    level = 0
+    while frontier.size and (cutoff is None or level < cutoff):
+        level += 1
+        if bottom_up:
+            if frontier.size < n / beta:
+                bottom_up = False
+        elif int(out_degree[frontier].sum()) * alpha > unexplored:
+            bottom_up = True
+        if bottom_up:
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            todo = np.flatnonzero(dist < 0)
+            found = []
+            for k in range(_BOTTOM_UP_ROUNDS):
+                pos = in_ptr[todo] + k
+                todo = todo[pos < in_ptr[todo + 1]]
+                if not todo.size:
+                    break
+                pred = in_idx[in_ptr[todo] + k]
+                hit = in_frontier[pred]
+                found.append((todo[hit], pred[hit]))
+                todo = todo[~hit]
+            if todo.size:
+                rows, pred = _gather(in_ptr, in_idx, todo, _BOTTOM_UP_ROUNDS)
+                hit = in_frontier[pred]
+                rows, pred = rows[hit], pred[hit]
+                # Keep the first parent of each node.
+                rows, first = np.unique(rows, return_index=True)
+                found.append((rows, pred[first]))
+            if found:
+                new = np.concatenate([f[0] for f in found])
+                parents = np.concatenate([f[1] for f in found])
+            else:
+                new = parents = np.empty(0, dtype=np.intp)
+        else:
+            rows, nbrs = _gather(out_ptr, out_idx, frontier)
+            unseen = dist[nbrs] < 0
+            new, first = np.unique(nbrs[unseen], return_index=True)
+            parents = rows[unseen][first]
+        dist[new] = level
+        parent[new] = parents
+        unexplored -= int(in_degree[new].sum())
+        frontier = new
+    return dist, parent
+
+
+# Number of searches advanced together by _bfs_bitsets, one per bit of
+# the word of each node.
+_WORD_BITS = 64
+
+
+def _bfs_bitsets(out_csr, in_csr, sources, cutoff=None):
+    """Bit-parallel breadth-first searches on CSR arrays.
+
+    Yields ``(start, dist)`` for each chunk of 64 consecutive entries of
+    `sources`, where ``dist[i]`` holds the distances from
+    ``sources[start + i]`` to every node, or -1 if it is not reached.
+    Only distances at most `cutoff` are found, if it is given.
+    """
+    import numpy as np
+    out_ptr, out_idx = out_csr
+    in_ptr, in_idx = in_csr
+    n = len(out_ptr) - 1
+    m = len(out_idx)
+    has_pred = np.flatnonzero(np.diff(in_ptr))
+    starts = in_ptr[has_pred]
+    one = np.uint64(1)
+    shifts = np.arange(_WORD_BITS, dtype=np.uint64)
+    for start in range(0, len(sources), _WORD_BITS):
+        chunk = sources[start:start + _WORD_BITS]
+        k = len(chunk)
+        dist = np.full((k, n), -1, dtype=np.intp)
+        dist[np.arange(k), chunk] = 0
+        frontier = np.zeros(n, dtype=np.uint64)
+        # The same node may be the source of several searches.
+        np.bitwise_or.at(frontier, chunk, one << shifts[:k])
+        seen = frontier.copy()
+        active = np.flatnonzero(frontier)
+        level = 0
+        while active.size and (cutoff is None or level < cutoff):
+            level += 1
+            rows, nbrs = _gather(out_ptr, out_idx, active)
+            if not nbrs.size:
+                break
+            if 4 * nbrs.size < m:
+                # Push the words of the frontier to their neighbors.
+                order = np.argsort(nbrs, kind='mergesort')
+                nbrs = nbrs[order]
+                heads = np.flatnonzero(np.concatenate(
+                    ([True], nbrs[1:] != nbrs[:-1])))
+                reached = np.bitwise_or.reduceat(frontier[rows[order]], heads)
+                targets = nbrs[heads]
+            else:
+                # Pull the words of the predecessors of every node.
+                reached = np.bitwise_or.reduceat(frontier[in_idx], starts)
+                targets = has_pred
+            new = reached & ~seen[targets]
+            found = new != 0
+            targets = targets[found]
+            new = new[found]
+            seen[targets] |= new
+            frontier[active] = 0
+            frontier[targets] = new
+            hit, bit = np.nonzero((new[:, None] >> shifts[:k]) & one)
+            dist[bit, targets[hit]] = level
+            active = targets
+        yield start, dist
+
+
+def _connected_components_csr(csr):
+    """Returns an array labelling the connected components of the
+    undirected graph with CSR adjacency `csr` by consecutive integers, in
+    order of their first node.
+
+    The components are found in one sweep over all the edges at once by a
+    vectorized union-find: each round hooks the larger root of the ends
+    of every edge to the smaller one, then compresses the paths to the
+    roots, until the ends of every edge share their root.
+    """
+    import numpy as np
+    indptr, indices = csr
+    n = len(indptr) - 1
+    parent = np.arange(n, dtype=np.intp)
+    u = np.repeat(parent, np.diff(indptr))
+    v = np.asarray(indices, dtype=np.intp)
+    # Each edge is stored in both directions.
+    forward = u < v
+    u, v = u[forward], v[forward]
+    while u.size:
+        ru = parent[u]
+        rv = parent[v]
+        # Edges whose ends share a root keep sharing it.
+        split = ru != rv
+        u, v, ru, rv = u[split], v[split], ru[split], rv[split]
+        if not u.size:
+            break
+        # When several edges hook the same root, any one of them wins;
+        # the parent of a node stays smaller than the node.
+        parent[np.maximum(ru, rv)] = np.minimum(ru, rv)
+        while True:
+            grandparent = parent[parent]
+            if (grandparent == parent).all():
+                break
+            parent = grandparent
+    # Each root is the smallest node of its component.
+    return np.unique(parent, return_inverse=True)[1]
+
+
+def _bfs_lengths(G, source, cutoff=None, reverse=False):
+    """Returns an iterator of ``(node, level)`` pairs in order of level
+    for the nodes reachable from `source`, or that reach `source` if
+    `reverse` is True. This is the NumPy fast path of
+    :func:`networkx.single_source_shortest_path_length`.
+    """
+    import numpy as np
+    nodelist, index, out_csr, in_csr = _csr_adjacency(G)
+    if reverse:
+        out_csr, in_csr = in_csr, out_csr
+    dist, _ = _bfs_csr(out_csr, in_csr, np.array([index[source]]),
+                       cutoff=cutoff)
+    reached = np.flatnonzero(dist >= 0)
+    reached = reached[np.argsort(dist[reached], kind='mergesort')]
+    return zip(map(nodelist.__getitem__, reached.tolist()),
+               dist[reached].tolist())
+
+
+def _all_pairs_lengths(G, cutoff=None):
+    """Yields ``(source, lengths)`` for every node of `G` like
+    :func:`networkx.all_pairs_shortest_path_length`, from bit-parallel
+    searches on arrays built once.
+    """
+    for u, dist, nodelist in _distance_rows(G, cutoff=cutoff):
+        reached = (dist >= 0).nonzero()[0]
+        yield u, dict(zip(map(nodelist.__getitem__, reached.tolist()),
+                          dist[reached].tolist()))
+
+
+def _distance_rows(G, sources=None, cutoff=None, reverse=False):
+    """Yields ``(source, dist, nodelist)`` for each source, where
+    ``dist[j]`` is the distance from the source to ``nodelist[j]``, or
+    from ``nodelist[j]`` to the source if `reverse` is True, and -1 if
+    there is no path. The rows come from :func:`_bfs_bitsets`.
+    """
+    import numpy as np
+    nodelist, index, out_csr, in_csr = _csr_adjacency(G)
+    if reverse:
+        out_csr, in_csr = in_csr, out_csr
+    if sources is None:
+        sources = nodelist
+    sources = list(sources)
+    idx = np.array([index[s] for s in sources], dtype=np.intp)
+    for start, dist in _bfs_bitsets(out_csr, in_csr, idx, cutoff):
+        for i, row in enumerate(dist):
+            yield sources[start + i], row, nodelist
+
+
+def _connected_components(G):
+    """Yields the connected components of the undirected graph `G` as
+    sets of nodes, like :func:`networkx.connected_components`.
+    """
+    import numpy as np
+    nodelist, index, csr, _ = _csr_adjacency(G)
+    label = _connected_components_csr(csr)
+    order = np.argsort(label, kind='mergesort')
+    bounds = np.flatnonzero(np.diff(label[order])) + 1
+    for part in np.split(order, bounds) if len(order) else ():
+        yield set(map(nodelist.__getitem__, part.tolist()))
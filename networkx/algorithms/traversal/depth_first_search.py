@@ -16,7 +16,15 @@ from collections import defaultdict
 __all__ = ['dfs_edges', 'dfs_tree',
            'dfs_predecessors', 'dfs_successors',
            'dfs_preorder_nodes', 'dfs_postorder_nodes',
-           'dfs_labeled_edges']
+           'dfs_labeled_edges', 'dfs_visit', 'DFSVisitor']
+
+# Labels of the events generated by a depth-first search.
+FORWARD = 'forward'
+NONTREE = 'nontree'
+REVERSE = 'reverse'
+
+# Returned by next() once the neighbors of a node are exhausted.
+_DONE = object()
 
 
 def dfs_edges(G, source=None, depth_limit=None):
@@ -65,31 +73,9 @@ def dfs_edges(G, source=None, depth_limit=None):
     dfs_postorder_nodes
     dfs_labeled_edges
     """
-    if source is None:
-        # edges for all components
-        nodes = G
-    else:
-        # edges for components with source
-        nodes = [source]
-    visited = set()
-    if depth_limit is None:
-       depth_limit = len(G)
-    for start in nodes:
-        if start in visited:
-            continue
-        visited.add(start)
-        stack = [(start, depth_limit, iter(G[start]))]
-        while stack:
-            parent, depth_now, children = stack[-1]
-            try:
-                child = next(children)
-                if child not in visited:
-                    yield parent, child
-                    visited.add(child)
-                    if depth_now > 1:
-                        stack.append((child, depth_now-1, iter(G[child])))
-            except StopIteration:
-                stack.pop()
+    nodes = G if source is None else [source]
+    return ((u, v) for u, v, d in _dfs_events(G._adj, nodes, depth_limit)
+            if d == FORWARD and u is not v)
 
 
 def dfs_tree(G, source=None, depth_limit=None):
@@ -390,28 +376,145 @@ def dfs_labeled_edges(G, source=None, depth_limit=None):
     else:
         # edges for components with source
         nodes = [source]
-    visited = set()
-    if depth_limit is None:
-       depth_limit = len(G)
+    return _dfs_events(G._adj, nodes, depth_limit)
+
+
+def _dfs_events(adj, nodes, depth_limit=None, visited=None):
+    """Iterative core of the depth-first searches.
+
+    Yields the events of :func:`dfs_labeled_edges` for a search started
+    from each node of `nodes` that is not yet visited.
+
+    `adj` maps each node to an iterable of its neighbors; it is either an
+    adjacency dictionary or a list of lists of integer nodes. `visited`
+    is the set of discovered nodes. It is updated in place and may be
+    changed by the caller between two events, for instance to let the
+    search discover a node again.
+
+    The stack is kept as two parallel lists, of the nodes on the current
+    path and of their neighbor iterators, so exploring an edge allocates
+    no more than the event itself.
+    """
+    if visited is None:
+        visited = set()
     for start in nodes:
         if start in visited:
             continue
-        yield start, start, 'forward'
         visited.add(start)
-        stack = [(start, depth_limit, iter(G[start]))]
-        while stack:
-            parent, depth_now, children = stack[-1]
-            try:
-                child = next(children)
-                if child in visited:
-                    yield parent, child, 'nontree'
-                else:
-                    yield parent, child, 'forward'
-                    visited.add(child)
-                    if depth_now > 1:
-                        stack.append((child, depth_now-1, iter(G[child])))
-            except StopIteration:
-                stack.pop()
-                if stack:
-                    yield stack[-1][0], parent, 'reverse'
-        yield start, start, 'reverse'
+        yield start, start, FORWARD
+        path = [start]
+        nbrs = [iter(adj[start])]
+        while nbrs:
+            child = next(nbrs[-1], _DONE)
+            if child is _DONE:
+                nbrs.pop()
+                child = path.pop()
+                if path:
+                    yield path[-1], child, REVERSE
+            elif child in visited:
+                yield path[-1], child, NONTREE
+            else:
+                visited.add(child)
+                yield path[-1], child, FORWARD
+                if depth_limit is None or len(path) < depth_limit:
+                    path.append(child)
+                    nbrs.append(iter(adj[child]))
+        yield start, start, REVERSE
+
+
+class DFSVisitor(object):
+    """Base class for the visitors of :func:`dfs_visit`.
+
+    Each method is called on one event of the depth-first search and
+    does nothing. Subclasses override the methods of the events they need.
+    """
+
+    def start_vertex(self, u):
+        """Called on the root `u` of each search tree, before it is
+        discovered."""
+
+    def discover_vertex(self, u):
+        """Called when `u` is first reached."""
+
+    def finish_vertex(self, u):
+        """Called once all the edges leaving `u` have been explored."""
+
+    def tree_edge(self, u, v):
+        """Called on an edge `(u, v)` to a node `v` that is not yet
+        discovered; `v` is discovered next."""
+
+    def back_edge(self, u, v):
+        """Called on an edge `(u, v)` to a node `v` on the current path,
+        including self-loops."""
+
+    def forward_or_cross_edge(self, u, v):
+        """Called on an edge `(u, v)` to a node `v` that is finished."""
+
+
+def dfs_visit(G, visitor, source=None):
+    """Run a depth-first search calling the methods of `visitor` on each
+    event.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    visitor : :class:`DFSVisitor`
+       An object with the methods of :class:`DFSVisitor`, which are called
+       as the corresponding events of the search happen.
+
+    source : node, optional
+       Specify starting node for depth-first search and visit the
+       component reachable from source.
+
+    Examples
+    --------
+    Detect the cycles of a directed graph by their back edges:
+
+    >>> class BackEdges(nx.DFSVisitor):
+    ...     def __init__(self):
+    ...         self.edges = []
+    ...     def back_edge(self, u, v):
+    ...         self.edges.append((u, v))
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (0, 3)])
+    >>> visitor = BackEdges()
+    >>> nx.dfs_visit(G, visitor, source=0)
+    >>> visitor.edges
+    [(2, 0)]
+
+    Notes
+    -----
+    If a source is not specified then a source is chosen arbitrarily and
+    repeatedly until all components in the graph are searched.
+
+    The search is iterative, so its depth is not bounded by the recursion
+    limit. In an undirected graph the edge from a node back to its parent
+    in the search tree is not reported.
+
+    See Also
+    --------
+    dfs_labeled_edges
+    """
+    nodes = G if source is None else [source]
+    undirected = not G.is_directed()
+    path = []
+    on_path = set()
+    for u, v, d in _dfs_events(G._adj, nodes):
+        if d == FORWARD:
+            if u is v:
+                visitor.start_vertex(v)
+            else:
+                visitor.tree_edge(u, v)
+            visitor.discover_vertex(v)
+            path.append(v)
+            on_path.add(v)
+        elif d == NONTREE:
+            if v in on_path:
+                if not (undirected and len(path) > 1 and path[-2] == v):
+                    visitor.back_edge(u, v)
+            else:
+                visitor.forward_or_cross_edge(u, v)
+        else:
+            path.pop()
+            on_path.remove(v)
+            visitor.finish_vertex(v)
@@ -159,27 +159,26 @@ def edge_dfs(G, source=None, orientation='original'):
     out_edges, key, tailhead = helper_funcs(G, orientation)
 
     visited_edges = set()
-    visited_nodes = set()
+    # A node is entered again each time one of its edges is traversed, and
+    # resumes the iterator over its edges created on its first visit.
     edges = {}
 
     for start_node in nodes:
-        stack = [start_node]
+        if start_node not in edges:
+            edges[start_node] = iter(out_edges(start_node, **kwds))
+        stack = [edges[start_node]]
         while stack:
-            current_node = stack[-1]
-            if current_node not in visited_nodes:
-                edges[current_node] = iter(out_edges(current_node, **kwds))
-                visited_nodes.add(current_node)
-
-            try:
-                edge = next(edges[current_node])
-            except StopIteration:
+            edge = next(stack[-1], None)
+            if edge is None:
                 # No more edges from the current node.
                 stack.pop()
-            else:
-                edge_key = key(edge)
-                if edge_key not in visited_edges:
-                    visited_edges.add(edge_key)
-                    # Mark the traversed "to" node as to-be-explored.
-                    stack.append(tailhead(edge)[1])
-                    yield edge
-
+                continue
+            edge_key = key(edge)
+            if edge_key not in visited_edges:
+                visited_edges.add(edge_key)
+                # Mark the traversed "to" node as to-be-explored.
+                head = tailhead(edge)[1]
+                if head not in edges:
+                    edges[head] = iter(out_edges(head, **kwds))
+                stack.append(edges[head])
+                yield edge
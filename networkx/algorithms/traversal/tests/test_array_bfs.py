@@ -0,0 +1,222 @@
+from nose import SkipTest
+from nose.tools import assert_almost_equal
+from nose.tools import assert_equal
+from nose.tools import assert_raises
+from nose.tools import assert_true
+import networkx as nx
+
+
+class TestArrayBFS(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def check_search(self, G, source, **kwds):
+        nodelist = list(G)
+        dist, parent = nx.bfs_arrays(G, source, **kwds)
+        expected = dict(nx.single_source_shortest_path_length(G, source))
+        for i, v in enumerate(nodelist):
+            assert_equal(dist[i], expected.get(v, -1))
+            if v == source:
+                assert_equal(parent[i], i)
+            elif v in expected:
+                # The parent is an in-neighbor one level closer.
+                u = nodelist[parent[i]]
+                assert_true(G.has_edge(u, v))
+                assert_equal(dist[parent[i]], dist[i] - 1)
+            else:
+                assert_equal(parent[i], -1)
+
+    def test_path(self):
+        dist, parent = nx.bfs_arrays(nx.path_graph(4), 1)
+        assert_equal(dist.tolist(), [1, 0, 1, 2])
+        assert_equal(parent.tolist(), [1, 1, 1, 2])
+
+    def test_random_graphs(self):
+        for seed in range(10):
+            G = nx.gnp_random_graph(100, 0.03, seed=seed)
+            self.check_search(G, 0)
+            D = nx.gnp_random_graph(100, 0.03, seed=seed, directed=True)
+            self.check_search(D, 0)
+
+    def test_direction(self):
+        # Always bottom-up, and always top-down.
+        G = nx.gnp_random_graph(200, 0.02, seed=1, directed=True)
+        self.check_search(G, 0, alpha=0)
+        self.check_search(G, 0, alpha=float('inf'))
+        self.check_search(G, 0, alpha=0, beta=float('inf'))
+
+    def test_multigraph_self_loops(self):
+        G = nx.MultiDiGraph([(0, 1), (0, 1), (1, 1), (1, 2), (2, 0)])
+        self.check_search(G, 0, alpha=0)
+        self.check_search(G, 2)
+
+    def test_nodelist(self):
+        G = nx.cycle_graph(6)
+        dist, parent = nx.bfs_arrays(G, 0, nodelist=[3, 2, 1, 0])
+        assert_equal(dist.tolist(), [3, 2, 1, 0])
+        assert_equal(parent.tolist(), [1, 2, 3, 3])
+        assert_raises(nx.NodeNotFound, nx.bfs_arrays, G, 5, nodelist=[0])
+
+    def test_unreachable(self):
+        G = nx.DiGraph([(0, 1), (2, 1)])
+        dist, parent = nx.bfs_arrays(G, 0)
+        assert_equal(dist.tolist(), [0, 1, -1])
+        assert_equal(parent.tolist(), [0, 0, -1])
+
+    def test_not_found(self):
+        assert_raises(nx.NodeNotFound, nx.bfs_arrays, nx.path_graph(3), 4)
+
+    def test_shortest_path_length(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(60, 0.05, seed=seed, directed=True)
+            for cutoff in (None, 0, 2):
+                expected = nx.single_source_shortest_path_length(
+                    G, 0, cutoff=cutoff)
+                lengths = list(nx.single_source_shortest_path_length(
+                    G, 0, cutoff=cutoff, method='numpy'))
+                assert_equal(dict(lengths), dict(expected))
+                levels = [d for v, d in lengths]
+                assert_equal(levels, sorted(levels))
+                expected = nx.single_target_shortest_path_length(
+                    G, 0, cutoff=cutoff)
+                lengths = nx.single_target_shortest_path_length(
+                    G, 0, cutoff=cutoff, method='numpy')
+                assert_equal(dict(lengths), dict(expected))
+            assert_equal(dict(nx.all_pairs_shortest_path_length(G)),
+                         dict(nx.all_pairs_shortest_path_length(
+                             G, method='numpy')))
+
+    def test_connected_components(self):
+        for seed in range(5):
+            G = nx.gnp_random_graph(100, 0.015, seed=seed)
+            G.add_node('isolated')
+            assert_equal(list(nx.connected_components(G)),
+                         list(nx.connected_components(G, method='numpy')))
+            assert_equal(nx.number_connected_components(G),
+                         nx.number_connected_components(G, method='numpy'))
+        assert_equal(list(nx.connected_components(nx.Graph(),
+                                                  method='numpy')), [])
+
+    def test_many_components(self):
+        G = nx.Graph()
+        for i in range(0, 3000, 3):
+            if i % 2:
+                nx.add_path(G, [i, i + 1, i + 2])
+            else:
+                G.add_edge(i + 2, i)
+                G.add_node(i + 1)
+        G.add_edge(2999, 2999)
+        assert_equal(list(nx.connected_components(G)),
+                     list(nx.connected_components(G, method='numpy')))
+        assert_equal(nx.number_connected_components(G, method='numpy'), 1500)
+
+    def test_methods(self):
+        # The searches accept the same methods; None picks the arrays
+        # only when several searches share them.
+        G = nx.gnp_random_graph(30, 0.1, seed=6, directed=True)
+        from networkx.algorithms.shortest_paths.unweighted import \
+            _choose_method
+        assert_equal(_choose_method(None, 1), 'python')
+        assert_equal(_choose_method(None, len(G)), 'numpy')
+        for f in (nx.single_source_shortest_path_length,
+                  nx.single_target_shortest_path_length):
+            expected = dict(f(G, 0))
+            for method in (None, 'numpy', 'python'):
+                assert_equal(dict(f(G, 0, method=method)), expected)
+        expected = dict(nx.all_pairs_shortest_path_length(G))
+        for method in (None, 'numpy', 'python'):
+            assert_equal(dict(nx.all_pairs_shortest_path_length(
+                G, method=method)), expected)
+
+    def test_unknown_method(self):
+        G = nx.path_graph(3)
+        assert_raises(ValueError, nx.single_source_shortest_path_length,
+                      G, 0, method='scipy')
+        assert_raises(ValueError, nx.single_target_shortest_path_length,
+                      G, 0, method='scipy')
+        assert_raises(ValueError, list,
+                      nx.connected_components(G, method='scipy'))
+
+
+class TestBFSDistanceMatrix(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def check_matrix(self, G, sources=None, cutoff=None):
+        nodelist = list(G)
+        if sources is None:
+            sources = nodelist
+        D = nx.bfs_distance_matrix(G, sources, cutoff=cutoff)
+        assert_equal(D.shape, (len(sources), len(G)))
+        for i, s in enumerate(sources):
+            expected = nx.single_source_shortest_path_length(G, s, cutoff)
+            expected = dict(expected)
+            assert_equal(D[i].tolist(), [expected.get(v, -1)
+                                         for v in nodelist])
+
+    def test_random_graphs(self):
+        # More than one word of sources, and both kinds of steps.
+        for seed in range(3):
+            G = nx.gnp_random_graph(150, 0.02, seed=seed)
+            self.check_matrix(G)
+            G = nx.gnp_random_graph(150, 0.02, seed=seed, directed=True)
+            self.check_matrix(G)
+            self.check_matrix(G, cutoff=2)
+        self.check_matrix(nx.grid_2d_graph(12, 12))
+
+    def test_sources(self):
+        G = nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 2), (3, 4)])
+        self.check_matrix(G, [2, 2, 4, 0])
+        D = nx.bfs_distance_matrix(G, [0], nodelist=[2, 1, 0])
+        assert_equal(D.tolist(), [[2, 1, 0]])
+        D = nx.bfs_distance_matrix(G, [])
+        assert_equal(D.shape, (0, 5))
+        assert_raises(nx.NodeNotFound, nx.bfs_distance_matrix, G, [5])
+
+    def test_no_edges(self):
+        G = nx.empty_graph(3)
+        D = nx.bfs_distance_matrix(G)
+        assert_equal(D.tolist(), [[0, -1, -1], [-1, 0, -1], [-1, -1, 0]])
+
+    def test_all_pairs_shortest_path_length(self):
+        G = nx.gnp_random_graph(100, 0.03, seed=3, directed=True)
+        for cutoff in (None, 3):
+            expected = dict(nx.all_pairs_shortest_path_length(
+                G, cutoff, method='python'))
+            assert_equal(dict(nx.all_pairs_shortest_path_length(G, cutoff)),
+                         expected)
+        assert_raises(ValueError, list,
+                      nx.all_pairs_shortest_path_length(G, method='scipy'))
+
+    def test_centrality(self):
+        # Breadth-first searches on arrays are used unless distances are
+        # given, or closeness is asked for a single node. A missing
+        # distance attribute counts as one.
+        for directed in (False, True):
+            G = nx.gnp_random_graph(100, 0.03, seed=4, directed=directed)
+            c = nx.harmonic_centrality(G)
+            d = nx.harmonic_centrality(G, distance='missing')
+            for n in G:
+                assert_almost_equal(c[n], d[n])
+            c = nx.harmonic_centrality(G, nbunch=[0, 5])
+            assert_equal(sorted(c), [0, 5])
+            assert_almost_equal(c[5], d[5])
+            for reverse in (False, True):
+                c = nx.closeness_centrality(G, reverse=reverse)
+                for n in G:
+                    assert_equal(c[n], nx.closeness_centrality(
+                        G, n, reverse=reverse))
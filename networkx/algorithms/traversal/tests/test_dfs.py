@@ -137,3 +137,76 @@ class TestDepthLimitedSearch:
         edges = list(nx.dfs_labeled_edges(self.G, source=6, depth_limit=2))
         forward = [(u, v) for (u, v, d) in edges if d == 'forward']
         assert_equal(forward, [(6, 6), (6, 5), (5, 4)])
+
+
+class Recorder(nx.DFSVisitor):
+
+    def __init__(self):
+        self.events = []
+
+    def start_vertex(self, u):
+        self.events.append(('start', u))
+
+    def discover_vertex(self, u):
+        self.events.append(('discover', u))
+
+    def finish_vertex(self, u):
+        self.events.append(('finish', u))
+
+    def tree_edge(self, u, v):
+        self.events.append(('tree', u, v))
+
+    def back_edge(self, u, v):
+        self.events.append(('back', u, v))
+
+    def forward_or_cross_edge(self, u, v):
+        self.events.append(('forward_or_cross', u, v))
+
+
+class TestDFSVisit:
+
+    def test_directed(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (0, 2), (3, 3)])
+        visitor = Recorder()
+        nx.dfs_visit(G, visitor)
+        assert_equal(visitor.events,
+                     [('start', 0), ('discover', 0),
+                      ('tree', 0, 1), ('discover', 1),
+                      ('tree', 1, 2), ('discover', 2),
+                      ('back', 2, 0), ('finish', 2), ('finish', 1),
+                      ('forward_or_cross', 0, 2), ('finish', 0),
+                      ('start', 3), ('discover', 3),
+                      ('back', 3, 3), ('finish', 3)])
+
+    def test_source(self):
+        G = nx.DiGraph([(0, 1), (2, 1)])
+        visitor = Recorder()
+        nx.dfs_visit(G, visitor, source=2)
+        assert_equal(visitor.events,
+                     [('start', 2), ('discover', 2), ('tree', 2, 1),
+                      ('discover', 1), ('finish', 1), ('finish', 2)])
+
+    def test_undirected(self):
+        # The edge to the parent is not a back edge.
+        visitor = Recorder()
+        nx.dfs_visit(nx.cycle_graph(4), visitor)
+        back = [e for e in visitor.events if e[0] == 'back']
+        assert_equal(back, [('back', 3, 0)])
+        visitor = Recorder()
+        nx.dfs_visit(nx.path_graph(3), visitor)
+        assert_false(any(e[0] == 'back' for e in visitor.events))
+
+    def test_base_visitor(self):
+        nx.dfs_visit(nx.petersen_graph(), nx.DFSVisitor())
+
+    def test_deep(self):
+        # Deeper than the recursion limit.
+        G = nx.path_graph(5000, create_using=nx.DiGraph())
+        order = []
+
+        class Finish(nx.DFSVisitor):
+            def finish_vertex(self, u):
+                order.append(u)
+
+        nx.dfs_visit(G, Finish(), source=0)
+        assert_equal(order, list(range(4999, -1, -1)))
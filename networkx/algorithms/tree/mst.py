@@ -21,6 +21,7 @@ from itertools import count
 
 import networkx as nx
 from networkx.utils import UnionFind, not_implemented_for
+from networkx.utils.heaps import _heap_factory
 
 
 @not_implemented_for('multigraph')
@@ -140,7 +141,15 @@ def kruskal_mst_edges(G, minimum, weight='weight', keys=True, data=True):
                 subtrees.union(u, v)
 
 
-def prim_mst_edges(G, minimum, weight='weight', keys=True, data=True):
+def prim_mst_edges(G, minimum, weight='weight', keys=True, data=True,
+                   heap=None):
+    if heap is not None:
+        edges = _indexed_prim_mst_edges(G, minimum, weight, keys, data,
+                                        _heap_factory(heap))
+        for edge in edges:
+            yield edge
+        return
+
     is_multigraph = G.is_multigraph()
     push = heappush
     pop = heappop
@@ -195,6 +204,54 @@ def prim_mst_edges(G, minimum, weight='weight', keys=True, data=True):
                 else:
                     yield u, v
 
+
+def _indexed_prim_mst_edges(G, minimum, weight, keys, data, make_heap):
+    """Prim's algorithm on top of a :class:`~networkx.utils.MinHeap`.
+
+    The heap holds the nodes outside the tree, each keyed by the weight of
+    the lightest edge joining it to the tree, so its size never exceeds the
+    number of nodes.
+
+    """
+    is_multigraph = G.is_multigraph()
+    sign = 1 if minimum else -1
+    visited = set()
+    for root in G:
+        if root in visited:
+            continue
+        frontier = make_heap()
+        frontier.insert(root, 0)
+        # Maps nodes in the frontier to the best edge joining them to the
+        # tree, as a (u, key, data) triple.
+        best = {}
+        while frontier:
+            v, _ = frontier.pop()
+            visited.add(v)
+            if v in best:
+                u, k, d = best.pop(v)
+                # Multigraphs need to handle edge keys in addition to edge
+                # data.
+                if is_multigraph and keys:
+                    if data:
+                        yield u, v, k, d
+                    else:
+                        yield u, v, k
+                else:
+                    if data:
+                        yield u, v, d
+                    else:
+                        yield u, v
+            if is_multigraph:
+                edges = G.edges(v, keys=True, data=True)
+            else:
+                edges = ((v, w, None, d) for v, w, d in G.edges(v, data=True))
+            for _, w, k, d in edges:
+                if w in visited:
+                    continue
+                if frontier.insert(w, d.get(weight, 1) * sign):
+                    best[w] = (v, k, d)
+
+
 ALGORITHMS = {
     'boruvka': boruvka_mst_edges,
     u'borůvka': boruvka_mst_edges,
@@ -205,18 +262,24 @@ ALGORITHMS = {
 
 @not_implemented_for('directed')
 def _spanning_edges(G, minimum, algorithm='kruskal', weight='weight',
-                    keys=True, data=True):
+                    keys=True, data=True, heap=None):
     try:
         algo = ALGORITHMS[algorithm]
     except KeyError:
         msg = '{} is not a valid choice for an algorithm.'.format(algorithm)
         raise ValueError(msg)
 
+    if heap is not None:
+        if algo is not prim_mst_edges:
+            msg = 'a heap can only be given for Prim\'s algorithm.'
+            raise ValueError(msg)
+        return algo(G, minimum=minimum, weight=weight, keys=keys, data=data,
+                    heap=heap)
     return algo(G, minimum=minimum, weight=weight, keys=keys, data=data)
 
 
 def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
-                           data=True):
+                           data=True, heap=None):
     """Generate edges in a minimum spanning forest of an undirected
     weighted graph.
 
@@ -245,6 +308,14 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
     data : bool, optional
        If True yield the edge data along with the edge.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by Prim's algorithm. If None, a binary
+       heap of edges from :mod:`heapq` is used. Otherwise this is one of
+       'binary', 'dary' or 'pairing', or a callable returning an empty
+       :class:`~networkx.utils.heaps.MinHeap`, and the heap holds one
+       entry per node whose value is decreased in place. Only valid
+       when `algorithm` is 'prim'.
+
     Returns
     -------
     edges : iterator
@@ -298,10 +369,11 @@ def minimum_spanning_edges(G, algorithm='kruskal', weight='weight', keys=True,
 
     """
     return _spanning_edges(G, minimum=True, algorithm=algorithm,
-                           weight=weight, keys=keys, data=data)
+                           weight=weight, keys=keys, data=data, heap=heap)
 
 
-def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
+def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True,
+                           heap=None):
     """Generate edges in a maximum spanning forest of an undirected
     weighted graph.
 
@@ -330,6 +402,14 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
     data : bool, optional
        If True yield the edge data along with the edge.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by Prim's algorithm. If None, a binary
+       heap of edges from :mod:`heapq` is used. Otherwise this is one of
+       'binary', 'dary' or 'pairing', or a callable returning an empty
+       :class:`~networkx.utils.heaps.MinHeap`, and the heap holds one
+       entry per node whose value is decreased in place. Only valid
+       when `algorithm` is 'prim'.
+
     Returns
     -------
     edges : iterator
@@ -382,16 +462,17 @@ def maximum_spanning_edges(G, algorithm='kruskal', weight='weight', data=True):
     http://www.ics.uci.edu/~eppstein/PADS/
     """
     return _spanning_edges(G, minimum=False, algorithm=algorithm,
-                           weight=weight, data=data)
+                           weight=weight, data=data, heap=heap)
 
 
 @not_implemented_for('directed')
-def _optimum_spanning_tree(G, algorithm, minimum, weight='weight'):
+def _optimum_spanning_tree(G, algorithm, minimum, weight='weight',
+                           heap=None):
     # When creating the spanning tree, we can ignore the key used to
     # identify multigraph edges, since a tree is guaranteed to have no
     # multiedges. This is why we use `keys=False`.
     edges = _spanning_edges(G, minimum, algorithm=algorithm, weight=weight,
-                            keys=False, data=True)
+                            keys=False, data=True, heap=heap)
     T = nx.Graph(edges)
 
     # Add isolated nodes
@@ -406,7 +487,7 @@ def _optimum_spanning_tree(G, algorithm, minimum, weight='weight'):
     return T
 
 
-def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
+def minimum_spanning_tree(G, weight='weight', algorithm='kruskal', heap=None):
     """Returns a minimum spanning tree or forest on an undirected graph `G`.
 
     Parameters
@@ -423,6 +504,14 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
        choices are 'kruskal', 'prim', or 'boruvka'. The default is
        'kruskal'.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by Prim's algorithm. If None, a binary
+       heap of edges from :mod:`heapq` is used. Otherwise this is one of
+       'binary', 'dary' or 'pairing', or a callable returning an empty
+       :class:`~networkx.utils.heaps.MinHeap`, and the heap holds one
+       entry per node whose value is decreased in place. Only valid
+       when `algorithm` is 'prim'.
+
     Returns
     -------
     G : NetworkX Graph
@@ -450,10 +539,10 @@ def minimum_spanning_tree(G, weight='weight', algorithm='kruskal'):
 
     """
     return _optimum_spanning_tree(G, algorithm=algorithm, minimum=True,
-                                  weight=weight)
+                                  weight=weight, heap=heap)
 
 
-def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
+def maximum_spanning_tree(G, weight='weight', algorithm='kruskal', heap=None):
     """Returns a maximum spanning tree or forest on an undirected graph `G`.
 
     Parameters
@@ -470,6 +559,13 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
        choices are 'kruskal', 'prim', or 'boruvka'. The default is
        'kruskal'.
 
+    heap : string or callable, optional (default=None)
+       The priority queue used by Prim's algorithm. If None, a binary
+       heap of edges from :mod:`heapq` is used. Otherwise this is one of
+       'binary', 'dary' or 'pairing', or a callable returning an empty
+       :class:`~networkx.utils.heaps.MinHeap`, and the heap holds one
+       entry per node whose value is decreased in place. Only valid
+       when `algorithm` is 'prim'.
 
     Returns
     -------
@@ -499,4 +595,4 @@ def maximum_spanning_tree(G, weight='weight', algorithm='kruskal'):
 
     """
     return _optimum_spanning_tree(G, algorithm=algorithm, minimum=False,
-                                  weight=weight)
+                                  weight=weight, heap=heap)
@@ -22,6 +22,11 @@ def test_unknown_algorithm():
     nx.minimum_spanning_tree(nx.Graph(), algorithm='random')
 
 
+@raises(ValueError)
+def test_heap_without_prim():
+    nx.minimum_spanning_tree(nx.Graph(), algorithm='kruskal', heap='pairing')
+
+
 class MinimumSpanningTreeTestBase(object):
     """Base class for test classes for minimum spanning tree algorithms.
 
@@ -207,3 +212,33 @@ class TestPrim(MultigraphMSTTestBase, TestCase):
         G.add_edge(0, 1, key='b', weight=1)
         T = nx.maximum_spanning_tree(G)
         assert_edges_equal([(0, 1, 2)], list(T.edges(data='weight')))
+
+    def test_heaps(self):
+        for heap in ('binary', 'dary', 'pairing', nx.utils.DaryHeap):
+            edges = nx.minimum_spanning_edges(self.G, algorithm=self.algo,
+                                              heap=heap)
+            actual = sorted((min(u, v), max(u, v), d) for u, v, d in edges)
+            assert_edges_equal(actual, self.minimum_spanning_edgelist)
+            edges = nx.maximum_spanning_edges(self.G, algorithm=self.algo,
+                                              heap=heap)
+            actual = sorted((min(u, v), max(u, v), d) for u, v, d in edges)
+            assert_edges_equal(actual, self.maximum_spanning_edgelist)
+
+    def test_heap_disconnected(self):
+        G = nx.Graph([(0, 1, dict(weight=1)), (2, 3, dict(weight=2))])
+        G.add_node(4)
+        T = nx.minimum_spanning_tree(G, algorithm=self.algo, heap='pairing')
+        assert_nodes_equal(list(T), list(range(5)))
+        assert_edges_equal(list(T.edges()), [(0, 1), (2, 3)])
+
+    def test_heap_multigraph_keys(self):
+        G = nx.MultiGraph()
+        G.add_edge(0, 1, key='a', weight=2)
+        G.add_edge(0, 1, key='b', weight=1)
+        G.add_edge(1, 2, key='c', weight=3)
+        mst_edges = nx.minimum_spanning_edges(G, algorithm=self.algo,
+                                              data=False, heap='dary')
+        assert_edges_equal([(0, 1, 'b'), (1, 2, 'c')], list(mst_edges))
+        mst_edges = nx.maximum_spanning_edges(G, algorithm=self.algo,
+                                              data=False, heap='dary')
+        assert_edges_equal([(0, 1, 'a'), (1, 2, 'c')], list(mst_edges))
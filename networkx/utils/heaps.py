@@ -11,7 +11,7 @@ from heapq import heappop, heappush
 from itertools import count
 import networkx as nx
 
-__all__ = ['MinHeap', 'PairingHeap', 'BinaryHeap']
+__all__ = ['MinHeap', 'PairingHeap', 'BinaryHeap', 'DaryHeap', 'RadixHeap']
 
 
 class MinHeap(object):
@@ -366,3 +366,261 @@ class BinaryHeap(MinHeap):
             dict[key] = value
             heappush(self._heap, (value, next(self._count), key))
             return True
+
+
+class DaryHeap(MinHeap):
+    """An indexed d-ary heap.
+
+    The position of every key in the underlying array is tracked, so
+    decreasing (or increasing) a value moves the existing entry instead of
+    pushing a duplicate one. The heap therefore never holds stale entries.
+    """
+    def __init__(self, d=4):
+        """Initialize a d-ary heap.
+
+        Parameters
+        ----------
+        d : int
+            The arity of the heap. Must be at least 2. Default value: 4.
+        """
+        if d < 2:
+            raise ValueError('the arity of a d-ary heap must be at least 2.')
+        super(DaryHeap, self).__init__()
+        self._d = d
+        # Parallel arrays of keys and values. self._dict maps each key to its
+        # position in these arrays.
+        self._keys = []
+        self._values = []
+
+    @_inherit_doc(MinHeap)
+    def min(self):
+        if not self._keys:
+            raise nx.NetworkXError('heap is empty.')
+        return (self._keys[0], self._values[0])
+
+    @_inherit_doc(MinHeap)
+    def pop(self):
+        keys = self._keys
+        if not keys:
+            raise nx.NetworkXError('heap is empty.')
+        values = self._values
+        key = keys[0]
+        value = values[0]
+        del self._dict[key]
+        last_key = keys.pop()
+        last_value = values.pop()
+        if keys:
+            keys[0] = last_key
+            values[0] = last_value
+            self._dict[last_key] = 0
+            self._sift_down(0)
+        return (key, value)
+
+    @_inherit_doc(MinHeap)
+    def get(self, key, default=None):
+        pos = self._dict.get(key)
+        return self._values[pos] if pos is not None else default
+
+    @_inherit_doc(MinHeap)
+    def insert(self, key, value, allow_increase=False):
+        pos = self._dict.get(key)
+        if pos is not None:
+            old_value = self._values[pos]
+            if value < old_value:
+                self._values[pos] = value
+                self._sift_up(pos)
+                return True
+            elif allow_increase and value > old_value:
+                self._values[pos] = value
+                self._sift_down(pos)
+            return False
+        else:
+            pos = len(self._keys)
+            self._keys.append(key)
+            self._values.append(value)
+            self._dict[key] = pos
+            self._sift_up(pos)
+            return True
+
+    def _sift_up(self, pos):
+        """Move the entry at pos towards the root until the heap property
+        is restored.
+        """
+        keys = self._keys
+        values = self._values
+        dict = self._dict
+        d = self._d
+        key = keys[pos]
+        value = values[pos]
+        while pos > 0:
+            parent = (pos - 1) // d
+            if not value < values[parent]:
+                break
+            keys[pos] = keys[parent]
+            values[pos] = values[parent]
+            dict[keys[pos]] = pos
+            pos = parent
+        keys[pos] = key
+        values[pos] = value
+        dict[key] = pos
+
+    def _sift_down(self, pos):
+        """Move the entry at pos towards the leaves until the heap property
+        is restored.
+        """
+        keys = self._keys
+        values = self._values
+        dict = self._dict
+        d = self._d
+        n = len(keys)
+        key = keys[pos]
+        value = values[pos]
+        while True:
+            first = d * pos + 1
+            if first >= n:
+                break
+            # Find the child with the smallest value.
+            child = first
+            child_value = values[first]
+            for i in range(first + 1, min(first + d, n)):
+                if values[i] < child_value:
+                    child = i
+                    child_value = values[i]
+            if not child_value < value:
+                break
+            keys[pos] = keys[child]
+            values[pos] = child_value
+            dict[keys[pos]] = pos
+            pos = child
+        keys[pos] = key
+        values[pos] = value
+        dict[key] = pos
+
+
+class RadixHeap(MinHeap):
+    """A radix heap for nonnegative integer values.
+
+    A radix heap is a monotone priority queue: a value smaller than the last
+    popped value can never be inserted. This is exactly the access pattern
+    of Dijkstra's algorithm with nonnegative integer edge weights, for which
+    a pop costs amortized O(log C) where C is the largest edge weight.
+
+    Keys are kept in buckets indexed by the highest bit in which their value
+    differs from the last popped value. Popping from a bucket other than the
+    first redistributes its keys into lower buckets.
+    """
+    def __init__(self):
+        """Initialize a radix heap.
+        """
+        super(RadixHeap, self).__init__()
+        self._last = 0
+        # Each bucket maps keys to values. self._bucket maps each key to the
+        # index of the bucket that holds it.
+        self._buckets = [{}]
+        self._bucket = {}
+
+    def _index(self, value):
+        """Return the index of the bucket that should hold value.
+        """
+        return (int(value) ^ self._last).bit_length()
+
+    def _add(self, key, value):
+        """Put a key-value pair into its bucket.
+        """
+        i = self._index(value)
+        buckets = self._buckets
+        while len(buckets) <= i:
+            buckets.append({})
+        buckets[i][key] = value
+        self._bucket[key] = i
+
+    def _first_bucket(self):
+        """Return the index of the first nonempty bucket.
+        """
+        for i, bucket in enumerate(self._buckets):
+            if bucket:
+                return i
+
+    @_inherit_doc(MinHeap)
+    def min(self):
+        if not self._dict:
+            raise nx.NetworkXError('heap is empty.')
+        bucket = self._buckets[self._first_bucket()]
+        key = min(bucket, key=bucket.__getitem__)
+        return (key, bucket[key])
+
+    @_inherit_doc(MinHeap)
+    def pop(self):
+        if not self._dict:
+            raise nx.NetworkXError('heap is empty.')
+        i = self._first_bucket()
+        bucket = self._buckets[i]
+        if i > 0:
+            # Make the minimum value the new reference point and spread the
+            # bucket over the lower buckets. Bucket 0 is then nonempty.
+            self._buckets[i] = {}
+            self._last = int(min(bucket.values()))
+            for key, value in bucket.items():
+                self._add(key, value)
+            bucket = self._buckets[0]
+        key, value = bucket.popitem()
+        del self._bucket[key]
+        del self._dict[key]
+        return (key, value)
+
+    @_inherit_doc(MinHeap)
+    def get(self, key, default=None):
+        return self._dict.get(key, default)
+
+    @_inherit_doc(MinHeap)
+    def insert(self, key, value, allow_increase=False):
+        if value != int(value):
+            raise nx.NetworkXError('radix heap values must be integers.')
+        if value < self._last:
+            raise nx.NetworkXError('radix heap values must not be smaller '
+                                   'than the last popped value.')
+        dict = self._dict
+        if key in dict:
+            old_value = dict[key]
+            if value < old_value or (allow_increase and value > old_value):
+                del self._buckets[self._bucket[key]][key]
+                dict[key] = value
+                self._add(key, value)
+                return value < old_value
+            return False
+        else:
+            dict[key] = value
+            self._add(key, value)
+            return True
+
+
+_HEAPS = {
+    'binary': BinaryHeap,
+    'dary': DaryHeap,
+    'pairing': PairingHeap,
+    'radix': RadixHeap,
+}
+
+
+def _heap_factory(heap):
+    """Return a callable that creates an empty min-heap.
+
+    Parameters
+    ----------
+    heap : string or callable
+        One of 'binary', 'dary', 'pairing' or 'radix', or a callable that
+        takes no arguments and returns an empty :class:`MinHeap`, such as a
+        subclass of :class:`MinHeap`.
+
+    Raises
+    ------
+    ValueError
+        If `heap` is neither a known heap name nor callable.
+    """
+    if callable(heap):
+        return heap
+    try:
+        return _HEAPS[heap]
+    except (KeyError, TypeError):
+        msg = '{} is not a valid choice for a heap.'.format(heap)
+        raise ValueError(msg)
@@ -128,3 +128,49 @@ def test_PairingHeap():
 
 def test_BinaryHeap():
     _test_heap_class(BinaryHeap)
+
+
+def test_DaryHeap():
+    _test_heap_class(DaryHeap)
+    _test_heap_class(DaryHeap, 2)
+    _test_heap_class(DaryHeap, d=7)
+    assert_raises(ValueError, DaryHeap, 1)
+
+
+def test_RadixHeap():
+    heap = RadixHeap()
+    assert_raises(nx.NetworkXError, heap.min)
+    assert_raises(nx.NetworkXError, heap.pop)
+    assert_equal(heap.get(x), None)
+    assert_true(heap.insert(x, 5))
+    assert_true(heap.insert(1, 9))
+    assert_true(heap.insert(2, 9.0))
+    assert_equal(heap.min(), (x, 5))
+    # min should not pop the top element.
+    assert_equal(heap.min(), (x, 5))
+    assert_equal(len(heap), 3)
+    # Decrease-insert should succeed.
+    assert_true(heap.insert(1, 3))
+    assert_false(heap.insert(1, 4))
+    assert_equal(heap.get(1), 3)
+    assert_equal(heap.pop(), (1, 3))
+    # Values smaller than the last popped value are rejected.
+    assert_raises(nx.NetworkXError, heap.insert, 3, 2)
+    # Non-integral values are rejected.
+    assert_raises(nx.NetworkXError, heap.insert, 3, 4.5)
+    # Increase-insert should succeed when allowed.
+    assert_false(heap.insert(x, 10, True))
+    assert_equal(heap.pop(), (2, 9.0))
+    assert_equal(heap.pop(), (x, 10))
+    assert_raises(nx.NetworkXError, heap.pop)
+    # Monotone usage as in Dijkstra's algorithm.
+    values = [7, 3, 1000, 64, 3, 12, 0, 129, 65]
+    for i, v in enumerate(values):
+        assert_true(heap.insert(i, v + 10))
+    popped = []
+    while heap:
+        key, value = heap.pop()
+        popped.append(value)
+        if value < 30:
+            heap.insert(key + 100, value + 5)
+    assert_equal(popped, sorted(popped))